@@ -1,3 +1,7 @@
+from ikea_api.abc import ExecutorHooks as ExecutorHooks
+from ikea_api.abc import set_executor_hooks as set_executor_hooks
+from ikea_api.cache import TTLCache as TTLCache
+from ikea_api.combination_hints import CombinationHints as CombinationHints
 from ikea_api.constants import Constants as Constants
 from ikea_api.endpoints.auth import Auth as Auth
 from ikea_api.endpoints.cart import Cart as Cart
@@ -16,12 +20,19 @@ from ikea_api.exceptions import AuthError as AuthError
 from ikea_api.exceptions import GraphQLError as GraphQLError
 from ikea_api.exceptions import ItemFetchError as ItemFetchError
 from ikea_api.exceptions import JSONError as JSONError
+from ikea_api.exceptions import KnownInvalidItemError as KnownInvalidItemError
 from ikea_api.exceptions import NotSuccessError as NotSuccessError
 from ikea_api.exceptions import ParsingError as ParsingError
 from ikea_api.exceptions import ProcessingError as ProcessingError
 from ikea_api.exceptions import WrongItemCodeError as WrongItemCodeError
 from ikea_api.executors.httpx import run_async as run_async
 from ikea_api.executors.requests import run as run
+from ikea_api.invalid_items import InvalidItemRegistry as InvalidItemRegistry
+from ikea_api.metrics import HistogramCollector as HistogramCollector
+from ikea_api.metrics import MetricsExporter as MetricsExporter
+from ikea_api.metrics import MetricsHooks as MetricsHooks
+from ikea_api.token_manager import TokenManager as TokenManager
+from ikea_api.token_manager import TokenPool as TokenPool
 from ikea_api.utils import format_item_code as format_item_code
 from ikea_api.utils import parse_item_codes as parse_item_codes
 
@@ -30,9 +41,42 @@ try:
 except ImportError:
     pass
 else:
+    from ikea_api.wrappers.child_items import ChildItemResolver as ChildItemResolver
+    from ikea_api.wrappers.stock_index import StockIndex as StockIndex
+    from ikea_api.wrappers.stock_watcher import StockWatcher as StockWatcher
     from ikea_api.wrappers.wrappers import add_items_to_cart as add_items_to_cart
+    from ikea_api.wrappers.wrappers import (
+        add_items_to_cart_async as add_items_to_cart_async,
+    )
+    from ikea_api.wrappers.wrappers import (
+        add_items_to_large_cart as add_items_to_large_cart,
+    )
     from ikea_api.wrappers.wrappers import (
         get_delivery_services as get_delivery_services,
     )
+    from ikea_api.wrappers.wrappers import (
+        get_delivery_services_for_baskets as get_delivery_services_for_baskets,
+    )
+    from ikea_api.wrappers.wrappers import (
+        get_delivery_services_for_zip_codes as get_delivery_services_for_zip_codes,
+    )
+    from ikea_api.wrappers.wrappers import get_items as get_items
     from ikea_api.wrappers.wrappers import get_purchase_history as get_purchase_history
+    from ikea_api.wrappers.wrappers import (
+        get_purchase_history_async as get_purchase_history_async,
+    )
     from ikea_api.wrappers.wrappers import get_purchase_info as get_purchase_info
+    from ikea_api.wrappers.wrappers import (
+        get_purchase_info_async as get_purchase_info_async,
+    )
+    from ikea_api.wrappers.wrappers import get_purchases_info as get_purchases_info
+    from ikea_api.wrappers.wrappers import (
+        iter_purchase_history as iter_purchase_history,
+    )
+    from ikea_api.wrappers.wrappers import (
+        iter_purchase_products as iter_purchase_products,
+    )
+    from ikea_api.wrappers.wrappers import sync_cart as sync_cart
+    from ikea_api.wrappers.wrappers import (
+        warm_up_service_areas as warm_up_service_areas,
+    )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import sys
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from functools import cached_property, partial
+from dataclasses import dataclass, field, replace
+from functools import cached_property, partial, wraps
 from typing import (
     Any,
     Callable,
@@ -14,6 +15,7 @@ from typing import (
     Mapping,
     TypeVar,
 )
+from urllib.parse import urlsplit
 
 if sys.version_info < (3, 10):
     from typing_extensions import ParamSpec
@@ -36,12 +38,21 @@ class RequestInfo:
     headers: dict[str, str]
     data: Any = None
     json: Any = None
+    # Responses that endpoint handles itself: error handlers are not run for them
+    skip_handlers: Callable[[ResponseInfo], bool] | None = None
 
 
 @dataclass
 class ResponseInfo(ABC):
     headers: Mapping[str, str] = field(init=False)
     status_code: int = field(init=False)
+    # Seconds spent on decoding `json`, set by responses that measure it
+    json_decode_time: float | None = field(default=None, init=False)
+
+    @property
+    def content_length(self) -> int | None:
+        """Size of response body in bytes, if known."""
+        return None
 
     @cached_property
     @abstractmethod
@@ -65,15 +76,126 @@ Endpoint = Generator[RequestInfo, ResponseInfo, EndpointResponse]
 ErrorHandler = Callable[[ResponseInfo], None]
 
 
+@dataclass
+class Reauthenticator:
+    get_token: Callable[[], EndpointInfo[str]]
+    set_token: Callable[[str], SessionInfo]
+
+
 @dataclass
 class EndpointInfo(Generic[EndpointResponse]):
     func: partial[Endpoint[EndpointResponse]]
     handlers: Iterable[ErrorHandler]
+    reauthenticator: Reauthenticator | None = None
+    name: str | None = None
 
 
 P = ParamSpec("P")
 
 
+@dataclass(frozen=True)
+class EndpointTags:
+    endpoint: str
+    host: str
+
+
+class ExecutorHooks:
+    """Executor instrumentation hooks. Every hook does nothing by default.
+
+    Hooks are called synchronously from executors, so they should be fast.
+    Durations are in seconds. Handler time includes JSON decoding if handlers
+    decode response.
+    """
+
+    def on_request_start(self, tags: EndpointTags, request: RequestInfo) -> None:
+        pass
+
+    def on_request_end(
+        self, tags: EndpointTags, response: ResponseInfo, duration: float
+    ) -> None:
+        pass
+
+    def on_handlers_end(self, tags: EndpointTags, duration: float) -> None:
+        pass
+
+    def on_json_decode(self, tags: EndpointTags, duration: float) -> None:
+        pass
+
+    def on_endpoint_end(
+        self, tags: EndpointTags, duration: float, error: BaseException | None
+    ) -> None:
+        pass
+
+
+_executor_hooks: ExecutorHooks | None = None
+
+
+def set_executor_hooks(hooks: ExecutorHooks | None) -> None:
+    """Set hooks of all executors. Pass None to disable instrumentation."""
+    global _executor_hooks
+    _executor_hooks = hooks
+
+
+def get_executor_hooks() -> ExecutorHooks | None:
+    return _executor_hooks
+
+
+def _get_handlers(
+    endpoint: EndpointInfo[Any], request: RequestInfo, response: ResponseInfo
+) -> Iterable[ErrorHandler]:
+    if request.skip_handlers is not None and request.skip_handlers(response):
+        return ()
+    return endpoint.handlers
+
+
+def get_endpoint_name(endpoint: EndpointInfo[Any]) -> str:
+    if endpoint.name is not None:
+        return endpoint.name
+    func = endpoint.func.func
+    return getattr(func, "__qualname__", None) or repr(func)
+
+
+class _EndpointTimer:
+    """Reports one executor run to hooks. Created only when hooks are set."""
+
+    hooks: ExecutorHooks
+    tags: EndpointTags
+    started: float
+
+    def __init__(self, hooks: ExecutorHooks, endpoint: EndpointInfo[Any]) -> None:
+        self.hooks = hooks
+        self.tags = EndpointTags(endpoint=get_endpoint_name(endpoint), host="")
+        self.started = time.perf_counter()
+
+    def request_start(self, request: RequestInfo) -> float:
+        host = urlsplit(request.session_info.base_url).netloc
+        if host != self.tags.host:
+            self.tags = replace(self.tags, host=host)
+        self.hooks.on_request_start(self.tags, request)
+        return time.perf_counter()
+
+    def request_end(self, response: ResponseInfo, started: float) -> None:
+        self.hooks.on_request_end(self.tags, response, time.perf_counter() - started)
+
+    def run_handlers(
+        self, handlers: Iterable[ErrorHandler], response: ResponseInfo
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            for handler in handlers:
+                handler(response)
+        finally:
+            self.hooks.on_handlers_end(self.tags, time.perf_counter() - started)
+
+    def response_processed(self, response: ResponseInfo) -> None:
+        if response.json_decode_time is not None:
+            self.hooks.on_json_decode(self.tags, response.json_decode_time)
+
+    def endpoint_end(self, error: BaseException | None) -> None:
+        duration = time.perf_counter() - self.started
+        self.hooks.on_endpoint_end(self.tags, duration, error)
+
+
 def endpoint(
     handlers: Iterable[ErrorHandler] | None = None,
 ) -> Callable[
@@ -86,8 +208,11 @@ def endpoint(
         def wrapper(
             *args: P.args, **kwargs: P.kwargs
         ) -> EndpointInfo[EndpointResponse]:
+            api = args[0] if args and isinstance(args[0], BaseAPI) else None
             return EndpointInfo(
-                func=partial(func, *args, **kwargs), handlers=handlers or ()
+                func=partial(func, *args, **kwargs),
+                handlers=handlers or (),
+                reauthenticator=api._get_reauthenticator() if api else None,
             )
 
         return wrapper
@@ -95,6 +220,20 @@ def endpoint(
     return decorator
 
 
+def named_endpoint(
+    func: Callable[P, EndpointInfo[EndpointResponse]]
+) -> Callable[P, EndpointInfo[EndpointResponse]]:
+    """Name endpoint after method that delegates to shared endpoint,
+    for example, `Cart.show` instead of `Cart._req`.
+    """
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> EndpointInfo[EndpointResponse]:
+        return replace(func(*args, **kwargs), name=func.__qualname__)
+
+    return wrapper
+
+
 class SyncExecutor(ABC):
     @staticmethod
     @abstractmethod
@@ -103,20 +242,67 @@ class SyncExecutor(ABC):
 
     @classmethod
     def run(cls, endpoint: EndpointInfo[EndpointResponse]) -> EndpointResponse:
+        hooks = _executor_hooks
+        if hooks is None:
+            return cls._run(endpoint, None)
+
+        timer = _EndpointTimer(hooks, endpoint)
+        try:
+            res = cls._run(endpoint, timer)
+        except BaseException as exc:
+            timer.endpoint_end(exc)
+            raise
+        timer.endpoint_end(None)
+        return res
+
+    @classmethod
+    def _request(
+        cls, request: RequestInfo, timer: _EndpointTimer | None
+    ) -> ResponseInfo:
+        if timer is None:
+            return cls.request(request)
+        started = timer.request_start(request)
+        response = cls.request(request)
+        timer.request_end(response, started)
+        return response
+
+    @classmethod
+    def _run(
+        cls, endpoint: EndpointInfo[EndpointResponse], timer: _EndpointTimer | None
+    ) -> EndpointResponse:
         gen = endpoint.func()
-        req_info = next(gen)
+        try:
+            req_info = next(gen)
+        except StopIteration as exc:  # Endpoint didn't need to make any requests
+            return exc.value
 
         while True:
-            response_info = cls.request(req_info)
+            response_info = cls._request(req_info, timer)
+
+            if response_info.status_code == 401 and endpoint.reauthenticator:
+                if timer is not None:
+                    timer.response_processed(response_info)
+                token = cls.run(endpoint.reauthenticator.get_token())
+                session_info = endpoint.reauthenticator.set_token(token)
+                req_info = replace(req_info, session_info=session_info)
+                response_info = cls._request(req_info, timer)
 
             try:
-                for handler in endpoint.handlers:
-                    handler(response_info)
+                handlers = _get_handlers(endpoint, req_info, response_info)
+                if timer is None:
+                    for handler in handlers:
+                        handler(response_info)
+                else:
+                    timer.run_handlers(handlers, response_info)
                 req_info = gen.send(response_info)
 
             except StopIteration as exc:
                 return exc.value
 
+            finally:
+                if timer is not None:
+                    timer.response_processed(response_info)
+
 
 class AsyncExecutor(ABC):
     @staticmethod
@@ -126,20 +312,67 @@ class AsyncExecutor(ABC):
 
     @classmethod
     async def run(cls, endpoint: EndpointInfo[EndpointResponse]) -> EndpointResponse:
+        hooks = _executor_hooks
+        if hooks is None:
+            return await cls._run(endpoint, None)
+
+        timer = _EndpointTimer(hooks, endpoint)
+        try:
+            res = await cls._run(endpoint, timer)
+        except BaseException as exc:
+            timer.endpoint_end(exc)
+            raise
+        timer.endpoint_end(None)
+        return res
+
+    @classmethod
+    async def _request(
+        cls, request: RequestInfo, timer: _EndpointTimer | None
+    ) -> ResponseInfo:
+        if timer is None:
+            return await cls.request(request)
+        started = timer.request_start(request)
+        response = await cls.request(request)
+        timer.request_end(response, started)
+        return response
+
+    @classmethod
+    async def _run(
+        cls, endpoint: EndpointInfo[EndpointResponse], timer: _EndpointTimer | None
+    ) -> EndpointResponse:
         gen = endpoint.func()
-        req_info = next(gen)
+        try:
+            req_info = next(gen)
+        except StopIteration as exc:  # Endpoint didn't need to make any requests
+            return exc.value
 
         while True:
-            response_info = await cls.request(req_info)
+            response_info = await cls._request(req_info, timer)
+
+            if response_info.status_code == 401 and endpoint.reauthenticator:
+                if timer is not None:
+                    timer.response_processed(response_info)
+                token = await cls.run(endpoint.reauthenticator.get_token())
+                session_info = endpoint.reauthenticator.set_token(token)
+                req_info = replace(req_info, session_info=session_info)
+                response_info = await cls._request(req_info, timer)
 
             try:
-                for handler in endpoint.handlers:
-                    handler(response_info)
+                handlers = _get_handlers(endpoint, req_info, response_info)
+                if timer is None:
+                    for handler in handlers:
+                        handler(response_info)
+                else:
+                    timer.run_handlers(handlers, response_info)
                 req_info = gen.send(response_info)
 
             except StopIteration as exc:
                 return exc.value
 
+            finally:
+                if timer is not None:
+                    timer.response_processed(response_info)
+
 
 class BaseAPI(ABC):
     _session_info: SessionInfo
@@ -151,6 +384,9 @@ class BaseAPI(ABC):
     def _get_session_info(self) -> SessionInfo:
         pass
 
+    def _get_reauthenticator(self) -> Reauthenticator | None:
+        return None
+
     def _RequestInfo(
         self,
         method: Literal["GET", "POST"],
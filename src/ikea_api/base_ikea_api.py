@@ -1,16 +1,58 @@
 from __future__ import annotations
 
-from ikea_api.abc import BaseAPI
+import json
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, cast
+
+from ikea_api.abc import (
+    BaseAPI,
+    Endpoint,
+    EndpointInfo,
+    Reauthenticator,
+    ResponseInfo,
+    SessionInfo,
+)
+from ikea_api.combination_hints import CombinationHints
 from ikea_api.constants import Constants, get_default_headers
+from ikea_api.graphql import build_persisted_payload, is_persisted_query_not_found
+from ikea_api.invalid_items import InvalidItemRegistry
 
 
 class BaseIkeaAPI(BaseAPI):
     _const: Constants
+    invalid_items: InvalidItemRegistry | None
+    combination_hints: CombinationHints | None
 
-    def __init__(self, constants: Constants) -> None:
+    def __init__(
+        self,
+        constants: Constants,
+        *,
+        invalid_items: InvalidItemRegistry | None = None,
+        combination_hints: CombinationHints | None = None,
+    ) -> None:
+        """
+        :params invalid_items: Registry of known invalid item codes.
+            Item endpoints don't request codes from it and record
+            codes that turned out to be invalid.
+        :params combination_hints: Whether items are combinations.
+            Item endpoints use and update it.
+        """
         self._const = constants
+        self.invalid_items = invalid_items
+        self.combination_hints = combination_hints
         super().__init__()
 
+    def _split_invalid_item_codes(
+        self, item_codes: list[str]
+    ) -> tuple[list[str], list[str]]:
+        if self.invalid_items is None:
+            return item_codes, []
+        return self.invalid_items.split(self._const.country, item_codes)
+
+    def _add_invalid_item_codes(self, item_codes: list[str]) -> None:
+        if self.invalid_items is not None:
+            self.invalid_items.add(self._const.country, item_codes)
+
     def _extend_default_headers(self, headers: dict[str, str]) -> dict[str, str]:
         res = get_default_headers(constants=self._const).copy()
         res.update(headers)
@@ -19,10 +61,34 @@ class BaseIkeaAPI(BaseAPI):
 
 class BaseAuthIkeaAPI(BaseIkeaAPI):
     token: str
+    token_provider: Callable[[], EndpointInfo[str]] | None
+
+    def __init__(
+        self,
+        constants: Constants,
+        *,
+        token: str,
+        token_provider: Callable[[], EndpointInfo[str]] | None = None,
+        invalid_items: InvalidItemRegistry | None = None,
+    ) -> None:
+        """
+        :params token_provider: Endpoint to get new token with, for example,
+            `Auth(constants).get_guest_token`. If set, requests that failed
+            with 401 are replayed once with new token.
+        """
+        self.token = token
+        self.token_provider = token_provider
+        super().__init__(constants, invalid_items=invalid_items)
+
+    def _get_reauthenticator(self) -> Reauthenticator | None:
+        if self.token_provider is None:
+            return None
+        return Reauthenticator(get_token=self.token_provider, set_token=self._set_token)
 
-    def __init__(self, constants: Constants, *, token: str) -> None:
+    def _set_token(self, token: str) -> SessionInfo:
         self.token = token
-        super().__init__(constants)
+        self._session_info = self._get_session_info()
+        return self._session_info
 
     def _extend_default_headers_with_auth(
         self, headers: dict[str, str]
@@ -30,3 +96,71 @@ class BaseAuthIkeaAPI(BaseIkeaAPI):
         res = super()._extend_default_headers(headers)
         res["Authorization"] = "Bearer " + self.token
         return res
+
+
+class BaseGraphQLAPI(BaseAuthIkeaAPI):
+    persisted_queries: bool
+
+    def __init__(
+        self,
+        constants: Constants,
+        *,
+        token: str,
+        token_provider: Callable[[], EndpointInfo[str]] | None = None,
+        invalid_items: InvalidItemRegistry | None = None,
+        persisted_queries: bool = False,
+    ) -> None:
+        """
+        :params persisted_queries: Send query hash instead of query
+            (Automatic Persisted Queries). Query is sent only if server
+            doesn't know the hash yet.
+        """
+        self.persisted_queries = persisted_queries
+        super().__init__(
+            constants,
+            token=token,
+            token_provider=token_provider,
+            invalid_items=invalid_items,
+        )
+
+    def _graphql_request(
+        self,
+        payload: dict[str, Any] | list[dict[str, Any]],
+        headers: dict[str, str] | None = None,
+    ) -> Endpoint[ResponseInfo]:
+        if not self.persisted_queries:
+            return (yield self._RequestInfo("POST", json=payload, headers=headers))
+
+        # Unknown hash is not an error: query is resent in full. If full query
+        # gets the same error, handlers raise it
+        response = yield replace(
+            self._RequestInfo(
+                "POST", json=_persist(payload, include_query=False), headers=headers
+            ),
+            skip_handlers=_is_persisted_query_miss,
+        )
+        if not _is_persisted_query_miss(response):
+            return response
+        return (
+            yield self._RequestInfo(
+                "POST", json=_persist(payload, include_query=True), headers=headers
+            )
+        )
+
+
+def _is_persisted_query_miss(response: ResponseInfo) -> bool:
+    try:
+        return is_persisted_query_not_found(response.json)
+    except json.JSONDecodeError:
+        return False
+
+
+def _persist(
+    payload: dict[str, Any] | list[dict[str, Any]], *, include_query: bool
+) -> dict[str, Any] | list[dict[str, Any]]:
+    if isinstance(payload, list):
+        return [
+            build_persisted_payload(p, include_query=include_query)
+            for p in cast(List[Dict[str, Any]], payload)
+        ]
+    return build_persisted_payload(payload, include_query=include_query)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    stored_at: float
+
+
+class TTLCache(Generic[K, V]):
+    """In-memory LRU cache of at most `maxsize` entries.
+
+    Entry is fresh for `ttl` seconds. After that, for `stale_ttl` more seconds
+    `get_or_fetch()` returns stale value right away and revalidates it in background.
+    """
+
+    ttl: float
+    stale_ttl: float
+    maxsize: int
+    stats: CacheStats
+    _entries: OrderedDict[K, _Entry[V]]
+    _pending: dict[K, asyncio.Future[V]]
+
+    def __init__(
+        self, *, ttl: float, stale_ttl: float = 0, maxsize: int = 1024
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+        self._pending = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: K) -> tuple[V, bool] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        age = time.monotonic() - entry.stored_at
+        if age >= self.ttl + self.stale_ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.value, age < self.ttl
+
+    def lookup(self, key: K) -> tuple[V, bool] | None:
+        """Get value and whether it is fresh. Counts towards stats."""
+        res = self._lookup(key)
+        if res is None:
+            self.stats.misses += 1
+        elif res[1]:
+            self.stats.hits += 1
+        else:
+            self.stats.stale_hits += 1
+        return res
+
+    def get(self, key: K) -> V | None:
+        """Get fresh value. Doesn't count towards stats."""
+        res = self._lookup(key)
+        if res is None or not res[1]:
+            return None
+        return res[0]
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = _Entry(value=value, stored_at=time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_fetch(
+        self,
+        key: K,
+        fetch: Callable[[], Awaitable[V]],
+        *,
+        revalidate_in_background: bool = True,
+    ) -> V:
+        """Get value from cache or with `fetch()`.
+        Concurrent callers with the same key wait for the same `fetch()`.
+
+        :params revalidate_in_background: If False, stale value is refreshed
+            before returning. Use it when `fetch()` must not outlive the caller,
+            for example, if it uses caller's resources.
+        """
+        res = self._lookup(key)
+        if res is None or not (res[1] or revalidate_in_background):
+            # Caller waits for fetch, so stale value doesn't count as hit
+            self.stats.misses += 1
+            return await asyncio.shield(self._fetch(key, fetch))
+
+        value, is_fresh = res
+        if is_fresh:
+            self.stats.hits += 1
+        else:
+            self.stats.stale_hits += 1
+            self._fetch(key, fetch)
+        return value
+
+    def _fetch(self, key: K, fetch: Callable[[], Awaitable[V]]) -> asyncio.Future[V]:
+        if key not in self._pending:
+            future = asyncio.ensure_future(self._store(key, fetch))
+            # Nobody awaits background revalidation, mark its error as retrieved
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._pending[key] = future
+        return self._pending[key]
+
+    async def _store(self, key: K, fetch: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await fetch()
+            self.set(key, value)
+            return value
+        finally:
+            del self._pending[key]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, cast
+
+
+class CombinationHints:
+    """Remembers whether items are combinations (SPR) or not (ART).
+
+    PIP has different URLs for combinations and other items. With hints,
+    `PipItem.get_item()` requests the right URL at once instead of getting 404
+    first. Hints are learnt from Ingka item types and from PIP responses.
+    """
+
+    _hints: dict[str, bool]
+
+    def __init__(self) -> None:
+        self._hints = {}
+
+    def __len__(self) -> int:
+        return len(self._hints)
+
+    def get(self, item_code: str) -> bool | None:
+        return self._hints.get(item_code)
+
+    def set(self, item_code: str, is_combination: bool) -> None:
+        self._hints[item_code] = is_combination
+
+    def discard(self, item_code: str) -> None:
+        self._hints.pop(item_code, None)
+
+    def update_from_ingka_response(self, response: Any) -> None:
+        """Learn item types from raw `IngkaItems.get_items()` response."""
+        if not isinstance(response, dict):
+            return
+        data = cast(Dict[str, Any], response).get("data")
+        if not isinstance(data, list):
+            return
+
+        for item in cast(List[Any], data):
+            try:
+                item_code = item["itemKey"]["itemNo"]
+                item_type = item["itemKey"]["itemType"]
+            except (KeyError, TypeError):
+                continue
+            if item_type in ("ART", "SPR"):
+                self.set(item_code, item_type == "SPR")
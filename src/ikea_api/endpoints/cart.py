@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, TypedDict
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Literal, Sequence, TypedDict
 
-from ikea_api.abc import Endpoint, EndpointInfo, SessionInfo, endpoint
-from ikea_api.base_ikea_api import BaseAuthIkeaAPI
+from ikea_api.abc import Endpoint, EndpointInfo, SessionInfo, endpoint, named_endpoint
+from ikea_api.base_ikea_api import BaseGraphQLAPI
 from ikea_api.error_handlers import (
     handle_401,
     handle_graphql_error,
     handle_json_decode_error,
     handle_not_success,
 )
+from ikea_api.graphql import minify_queries
 
 
 class _TemplatedItem(TypedDict):
@@ -21,7 +23,91 @@ def convert_items(items: dict[str, int]) -> list[_TemplatedItem]:
     return [{"itemNo": item_code, "quantity": qty} for item_code, qty in items.items()]
 
 
-class Cart(BaseAuthIkeaAPI):
+@dataclass
+class CartMutation:
+    """Mutation that can be sent together with other ones in `Cart.mutate()`."""
+
+    field: str
+    # Argument name: (GraphQL type, value)
+    arguments: dict[str, tuple[str, Any]] = field(default_factory=dict)
+    selection: str = "...CartProps"
+
+    @classmethod
+    def add_items(cls, items: dict[str, int]) -> CartMutation:
+        # Same selection as in `Mutations.add_items`: addItems doesn't return cart
+        return cls(
+            "addItems",
+            {"items": ("[AddItemInput!]!", convert_items(items))},
+            "quantity context { userId isAnonymous retailId }",
+        )
+
+    @classmethod
+    def update_items(cls, items: dict[str, int]) -> CartMutation:
+        return cls(
+            "updateItems", {"items": ("[UpdateItemInput!]!", convert_items(items))}
+        )
+
+    @classmethod
+    def remove_items(cls, item_codes: list[str]) -> CartMutation:
+        return cls("removeItems", {"itemNos": ("[ID!]!", item_codes)})
+
+    @classmethod
+    def clear_items(cls) -> CartMutation:
+        return cls("clearItems")
+
+    @classmethod
+    def copy_items(cls, source_user_id: str) -> CartMutation:
+        return cls("copyItems", {"sourceUserId": ("ID!", source_user_id)})
+
+    @classmethod
+    def set_coupon(cls, code: str) -> CartMutation:
+        return cls("setCoupon", {"code": ("String!", code)})
+
+    @classmethod
+    def clear_coupon(cls) -> CartMutation:
+        return cls("clearCoupon")
+
+
+def build_mutation(mutations: Sequence[CartMutation]) -> tuple[str, dict[str, Any]]:
+    """Compose mutations in one document. Results are aliased as m0, m1 etc.
+    Mutations are executed by server in the same order.
+    """
+    definitions = ["$languageCode: String"]
+    fields: list[str] = []
+    variables: dict[str, Any] = {}
+
+    for idx, mutation in enumerate(mutations):
+        arguments: list[str] = []
+        for name, (type_, value) in mutation.arguments.items():
+            definitions.append(f"${name}{idx}: {type_}")
+            arguments.append(f"{name}: ${name}{idx}")
+            variables[f"{name}{idx}"] = value
+        arguments.append("languageCode: $languageCode")
+        fields.append(
+            f"m{idx}: {mutation.field}({', '.join(arguments)}) "
+            + f"{{ {mutation.selection} }}"
+        )
+
+    query = f"mutation Batch({' '.join(definitions)}) {{ {' '.join(fields)} }}"
+    return query + get_fragments(m.selection for m in mutations), variables
+
+
+def get_fragments(selections: Iterable[str]) -> str:
+    """Get definitions of cart fragments used in selections."""
+    if any("...CartProps" in s for s in selections):
+        return Fragments.cart_props
+    return ""
+
+
+handlers = (
+    handle_json_decode_error,
+    handle_graphql_error,
+    handle_401,
+    handle_not_success,
+)
+
+
+class Cart(BaseGraphQLAPI):
     def _get_session_info(self) -> SessionInfo:
         url = "https://cart.oneweb.ingka.com/graphql"
         headers = self._extend_default_headers_with_auth(
@@ -29,28 +115,37 @@ class Cart(BaseAuthIkeaAPI):
         )
         return SessionInfo(base_url=url, headers=headers)
 
-    @endpoint(
-        handlers=[
-            handle_json_decode_error,
-            handle_graphql_error,
-            handle_401,
-            handle_not_success,
-        ]
-    )
+    @endpoint(handlers)
     def _req(self, query: str, **variables: Any) -> Endpoint[dict[str, Any]]:
         payload = {
             "query": query,
             "variables": {"languageCode": self._const.language, **variables},
         }
-        response = yield self._RequestInfo("POST", json=payload)
+        response = yield from self._graphql_request(payload)
         return response.json
 
-    def show(self) -> EndpointInfo[dict[str, Any]]:
-        return self._req(Queries.cart)
+    @named_endpoint
+    def show(
+        self, profile: Literal["full", "items", "totals"] = "full"
+    ) -> EndpointInfo[dict[str, Any]]:
+        """
+        :params profile: Cart fields to request.
+            "full" — everything, "items" — only item codes, quantities
+            and unit codes, "totals" — only currency and total prices.
+        """
+        return self._req(
+            {
+                "full": Queries.cart,
+                "items": Queries.cart_items,
+                "totals": Queries.cart_totals,
+            }[profile]
+        )
 
+    @named_endpoint
     def clear(self) -> EndpointInfo[dict[str, Any]]:
         return self._req(Mutations.clear_items)
 
+    @named_endpoint
     def add_items(self, items: dict[str, int]) -> EndpointInfo[dict[str, Any]]:
         """
         Add items to cart.
@@ -58,6 +153,7 @@ class Cart(BaseAuthIkeaAPI):
         """
         return self._req(Mutations.add_items, items=convert_items(items))
 
+    @named_endpoint
     def update_items(self, items: dict[str, int]) -> EndpointInfo[dict[str, Any]]:
         """
         Replace quantity for given item to the new one.
@@ -65,21 +161,52 @@ class Cart(BaseAuthIkeaAPI):
         """
         return self._req(Mutations.update_items, items=convert_items(items))
 
+    @named_endpoint
     def copy_items(self, *, source_user_id: str) -> EndpointInfo[dict[str, Any]]:
         """Copy cart from another account."""
         return self._req(Mutations.copy_items, sourceUserId=source_user_id)
 
+    @named_endpoint
     def remove_items(self, item_codes: list[str]) -> EndpointInfo[dict[str, Any]]:
         """Remove items by item codes."""
         return self._req(Mutations.remove_items, itemNos=item_codes)
 
+    @named_endpoint
     def set_coupon(self, code: str) -> EndpointInfo[dict[str, Any]]:
         return self._req(Mutations.set_coupon, code=code)
 
+    @named_endpoint
     def clear_coupon(self) -> EndpointInfo[dict[str, Any]]:
         return self._req(Mutations.clear_coupon)
 
+    @endpoint(handlers)
+    def mutate(
+        self, mutations: Sequence[CartMutation]
+    ) -> Endpoint[list[dict[str, Any]]]:
+        """Run several mutations in one request. Returns result of every mutation."""
+        query, variables = build_mutation(mutations)
+        payload = {
+            "query": query,
+            "variables": {"languageCode": self._const.language, **variables},
+        }
+        response = yield from self._graphql_request(payload)
+        return [response.json["data"][f"m{idx}"] for idx in range(len(mutations))]
+
+    @named_endpoint
+    def replace_items(
+        self, items: dict[str, int]
+    ) -> EndpointInfo[list[dict[str, Any]]]:
+        """Clear cart and add items in one request.
+        Returns results of both mutations, use `show()` to get new cart.
+        """
+        mutations = [
+            CartMutation("clearItems", selection="checksum"),
+            CartMutation.add_items(items),
+        ]
+        return self.mutate(mutations)
+
 
+@minify_queries
 class Fragments:
     item_props = """
     fragment ItemProps on Item {
@@ -240,6 +367,19 @@ class Fragments:
     }
     """
 
+    item_quantities = """
+    fragment ItemQuantities on Cart {
+        checksum
+        items {
+            itemNo
+            quantity
+            product {
+                unitCode
+            }
+        }
+    }
+    """
+
     cart_props = """
     fragment CartProps on Cart {{
         currency
@@ -273,6 +413,7 @@ class Fragments:
     )
 
 
+@minify_queries
 class Mutations:
     add_items = """
     mutation AddItems(
@@ -379,6 +520,7 @@ class Mutations:
     )
 
 
+@minify_queries
 class Queries:
     cart = """
     query Cart(
@@ -392,3 +534,31 @@ class Queries:
     """ % (
         Fragments.cart_props
     )
+
+    cart_items = """
+    query Cart(
+        $languageCode: String
+    ) {
+        cart(languageCode: $languageCode) {
+        ...ItemQuantities
+        }
+    }
+  %s
+    """ % (
+        Fragments.item_quantities
+    )
+
+    cart_totals = """
+    query Cart(
+        $languageCode: String
+    ) {
+        cart(languageCode: $languageCode) {
+        currency
+        checksum
+        ...Totals
+        }
+    }
+  %s
+    """ % (
+        Fragments.totals
+    )
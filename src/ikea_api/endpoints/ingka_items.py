@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, List, cast
 
 from ikea_api.abc import Endpoint, SessionInfo, endpoint
 from ikea_api.base_ikea_api import BaseIkeaAPI
@@ -26,6 +26,10 @@ class IngkaItems(BaseIkeaAPI):
 
     @endpoint(handlers=[handle_json_decode_error, handle_401, handle_not_success])
     def get_items(self, item_codes: list[str]) -> Endpoint[dict[str, Any]]:
+        item_codes, known_invalid = self._split_invalid_item_codes(item_codes)
+        if known_invalid and not item_codes:
+            return {"data": []}
+
         response = yield self._RequestInfo("GET", params={"itemNos": item_codes})
 
         if "error" in response.json:
@@ -33,6 +37,10 @@ class IngkaItems(BaseIkeaAPI):
                 msg = response.json["error"]["details"][0]["value"]["keys"]
             except (KeyError, TypeError, IndexError):
                 msg = None
+            if isinstance(msg, list):
+                self._add_invalid_item_codes(cast(List[str], msg))
             raise ItemFetchError(response, msg)
 
+        if self.combination_hints is not None:
+            self.combination_hints.update_from_ingka_response(response.json)
         return response.json
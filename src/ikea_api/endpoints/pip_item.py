@@ -5,7 +5,7 @@ from typing import Any
 from ikea_api.abc import Endpoint, SessionInfo, endpoint
 from ikea_api.base_ikea_api import BaseIkeaAPI
 from ikea_api.error_handlers import handle_json_decode_error
-from ikea_api.exceptions import ItemFetchError
+from ikea_api.exceptions import ItemFetchError, KnownInvalidItemError
 
 
 def build_url(item_code: str, is_combination: bool) -> str:
@@ -21,14 +21,43 @@ class PipItem(BaseIkeaAPI):
 
     @endpoint()
     def get_item(
-        self, item_code: str, is_combination: bool = True
+        self, item_code: str, is_combination: bool | None = None
     ) -> Endpoint[dict[str, Any]]:
+        """
+        :params is_combination: If None, `combination_hints` are used.
+            If there's no hint, item is requested as combination first.
+            If guessed URL returns 404, the other one is tried.
+            Explicit flag works as before: `True` falls back to
+            non-combination URL, `False` requests exactly one URL.
+            Item is recorded as invalid only if both URLs return 404.
+        """
+        if not self._split_invalid_item_codes([item_code])[0]:
+            raise KnownInvalidItemError(item_code)
+
+        guessed = is_combination is None
+        if is_combination is None:
+            hint = None
+            if self.combination_hints is not None:
+                hint = self.combination_hints.get(item_code)
+            is_combination = True if hint is None else hint
+
         response = yield self._RequestInfo("GET", build_url(item_code, is_combination))
 
-        if response.status_code == 404 and is_combination:
-            response = yield self._RequestInfo("GET", build_url(item_code, False))
-            if response.status_code == 404:
-                raise ItemFetchError(response)
+        tried_both = False
+        if response.status_code == 404 and (guessed or is_combination):
+            is_combination = not is_combination
+            tried_both = True
+            response = yield self._RequestInfo(
+                "GET", build_url(item_code, is_combination)
+            )
+        if response.status_code == 404:
+            if tried_both:
+                self._add_invalid_item_codes([item_code])
+            if guessed and self.combination_hints is not None:
+                self.combination_hints.discard(item_code)
+            raise ItemFetchError(response)
 
         handle_json_decode_error(response)
+        if self.combination_hints is not None:
+            self.combination_hints.set(item_code, is_combination)
         return response.json
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, List, Literal, Sequence, cast
 
 from ikea_api.abc import Endpoint, SessionInfo, endpoint
-from ikea_api.base_ikea_api import BaseAuthIkeaAPI
+from ikea_api.base_ikea_api import BaseGraphQLAPI
 from ikea_api.error_handlers import (
     handle_401,
     handle_graphql_error,
     handle_json_decode_error,
     handle_not_success,
 )
+from ikea_api.exceptions import GraphQLError, ProcessingError
+from ikea_api.graphql import minify_queries
 
 
 def build_payload(operation_name: str, query: str, **variables: Any) -> dict[str, Any]:
@@ -22,9 +24,16 @@ handlers = (
     handle_401,
     handle_not_success,
 )
+# GraphQL errors are handled per order in bulk requests
+bulk_handlers = (handle_json_decode_error, handle_401, handle_not_success)
 
+OrderQuery = Literal["StatusBannerOrder", "CostsOrder", "ProductListOrder"]
+# "lite" requests only fields that are used by wrappers: dates in one format
+# and total and delivery costs
+PurchasesProfile = Literal["full", "lite"]
 
-class Purchases(BaseAuthIkeaAPI):
+
+class Purchases(BaseGraphQLAPI):
     def _get_session_info(self) -> SessionInfo:
         url = "https://purchase-history.ocp.ingka.ikea.com/graphql"
         headers = self._extend_default_headers_with_auth(
@@ -38,50 +47,45 @@ class Purchases(BaseAuthIkeaAPI):
         return SessionInfo(base_url=url, headers=headers)
 
     @endpoint(handlers)
-    def history(self, *, take: int = 5, skip: int = 0) -> Endpoint[dict[str, Any]]:
+    def history(
+        self, *, take: int = 5, skip: int = 0, profile: PurchasesProfile = "full"
+    ) -> Endpoint[dict[str, Any]]:
         """Get purchase history.
         Parameters are for pagination. If you want to see all your purchases set 'take' to 10000.
         """
-        payload = build_payload("History", Queries.history, take=take, skip=skip)
-        response = yield self._RequestInfo("POST", json=payload)
+        query = Queries.history if profile == "full" else Queries.history_lite
+        payload = build_payload("History", query, take=take, skip=skip)
+        response = yield from self._graphql_request(payload)
         return response.json
 
-    @endpoint(handlers)
-    def order_info(
+    def _build_order_info_payload(
         self,
         order_number: str,
-        *,
-        email: str | None = None,
-        queries: list[
-            Literal["StatusBannerOrder", "CostsOrder", "ProductListOrder"]
-        ] = ["StatusBannerOrder", "CostsOrder", "ProductListOrder"],
+        queries: Sequence[OrderQuery],
         skip_products: int = 0,
         skip_product_prices: bool = False,
         take_products: int = 10,
-    ) -> Endpoint[list[dict[str, Any]]]:
-        """Get order information: status and costs.
-
-        :params order_number: Purchase ID
-        :params email: Email. If set, there's no need to get token.
-        :params queries: Queries that will be included in request
-        :params skip_products: Relevant to ProductListOrder
-        :params skip_product_prices: Relevant to ProductListOrder
-        :params take_products: Relevant to ProductListOrder
-        """
+        profile: PurchasesProfile = "full",
+    ) -> list[dict[str, Any]]:
         payload: list[dict[str, Any]] = []
+        is_full = profile == "full"
 
         if "StatusBannerOrder" in queries:
             payload.append(
                 build_payload(
                     "StatusBannerOrder",
-                    Queries.status_banner_order,
+                    Queries.status_banner_order
+                    if is_full
+                    else Queries.status_banner_order_lite,
                     orderNumber=order_number,
                 )
             )
         if "CostsOrder" in queries:
             payload.append(
                 build_payload(
-                    "CostsOrder", Queries.costs_order, orderNumber=order_number
+                    "CostsOrder",
+                    Queries.costs_order if is_full else Queries.costs_order_lite,
+                    orderNumber=order_number,
                 )
             )
         if "ProductListOrder" in queries:
@@ -96,6 +100,42 @@ class Purchases(BaseAuthIkeaAPI):
                     take=take_products,
                 )
             )
+        return payload
+
+    @endpoint(handlers)
+    def order_info(
+        self,
+        order_number: str,
+        *,
+        email: str | None = None,
+        queries: list[OrderQuery] = [
+            "StatusBannerOrder",
+            "CostsOrder",
+            "ProductListOrder",
+        ],
+        skip_products: int = 0,
+        skip_product_prices: bool = False,
+        take_products: int = 10,
+        profile: PurchasesProfile = "full",
+    ) -> Endpoint[list[dict[str, Any]]]:
+        """Get order information: status and costs.
+
+        :params order_number: Purchase ID
+        :params email: Email. If set, there's no need to get token.
+        :params queries: Queries that will be included in request
+        :params skip_products: Relevant to ProductListOrder
+        :params skip_product_prices: Relevant to ProductListOrder
+        :params take_products: Relevant to ProductListOrder
+        :params profile: Relevant to StatusBannerOrder and CostsOrder
+        """
+        payload = self._build_order_info_payload(
+            order_number,
+            queries,
+            skip_products=skip_products,
+            skip_product_prices=skip_product_prices,
+            take_products=take_products,
+            profile=profile,
+        )
 
         if email:
             for chunk in payload:
@@ -108,10 +148,68 @@ class Purchases(BaseAuthIkeaAPI):
         else:
             headers = {"Referer": f"https://order.ikea.com/{order_number}/"}
 
-        response = yield self._RequestInfo("POST", json=payload, headers=headers)
+        response = yield from self._graphql_request(payload, headers=headers)
         return response.json
 
+    @endpoint(bulk_handlers)
+    def bulk_order_info(
+        self,
+        order_numbers: list[str],
+        *,
+        queries: list[Literal["StatusBannerOrder", "CostsOrder"]] = [
+            "StatusBannerOrder",
+            "CostsOrder",
+        ],
+        chunk_size: int = 50,
+        profile: PurchasesProfile = "full",
+    ) -> Endpoint[dict[str, list[dict[str, Any]] | GraphQLError]]:
+        """Get status and costs of many orders, `chunk_size` orders per request.
+        Requires authorized token.
+
+        Returns responses for every order in the same format as `order_info`.
+        If order has errors, GraphQLError with only its errors is returned instead.
+        """
+        order_numbers = list(dict.fromkeys(order_numbers))
+        queries = list(dict.fromkeys(queries))
+        res: dict[str, list[dict[str, Any]] | GraphQLError] = {}
+        headers = {
+            "Referer": f"https://order.ikea.com/{self._const.country}/"
+            + f"{self._const.language}/purchases/"
+        }
 
+        for start in range(0, len(order_numbers), chunk_size):
+            chunk = order_numbers[start : start + chunk_size]
+            payload: list[dict[str, Any]] = []
+            for order_number in chunk:
+                payload += self._build_order_info_payload(
+                    order_number, queries, profile=profile
+                )
+
+            response = yield from self._graphql_request(payload, headers=headers)
+            if not isinstance(response.json, list):
+                handle_graphql_error(response)
+                raise ProcessingError(response, "Expected list of responses")
+            if len(cast(List[Any], response.json)) != len(payload):
+                raise ProcessingError(
+                    response,
+                    f"Expected {len(payload)} responses, "
+                    + f"got {len(cast(List[Any], response.json))}",
+                )
+
+            per_order = len(payload) // len(chunk)
+            for idx, order_number in enumerate(chunk):
+                order_response: list[dict[str, Any]] = response.json[
+                    idx * per_order : (idx + 1) * per_order
+                ]
+                errors = [e for r in order_response for e in r.get("errors", [])]
+                res[order_number] = (
+                    GraphQLError(response, errors) if errors else order_response
+                )
+
+        return res
+
+
+@minify_queries
 class Fragments:
     date_and_time = """
     fragment DateAndTime on DateAndTime {
@@ -125,6 +223,14 @@ class Fragments:
     }
     """
 
+    date_and_time_lite = """
+    fragment DateAndTime on DateAndTime {
+        time
+        date
+        formattedLongDateTime
+    }
+    """
+
     delivery_date = """
     fragment DeliveryDate on DeliveryDate {
         actual {
@@ -247,6 +353,7 @@ class Fragments:
     )
 
 
+@minify_queries
 class Queries:
     history = """
     query History($skip: Int!, $take: Int!) {
@@ -313,6 +420,53 @@ class Queries:
         Fragments.costs
     )
 
+    history_lite = history.replace(
+        Fragments.date_and_time, Fragments.date_and_time_lite
+    )
+
+    status_banner_order_lite = """
+    query StatusBannerOrder($orderNumber: String!, $liteId: String) {
+        order(orderNumber: $orderNumber, liteId: $liteId) {
+            id
+            dateAndTime {
+            ...DateAndTime
+            }
+            status
+            deliveryMethods {
+                deliveryDate {
+                    estimatedFrom {
+                    ...DateAndTime
+                    }
+                }
+            }
+        }
+    }
+
+    %s
+    """ % (
+        Fragments.date_and_time_lite
+    )
+
+    costs_order_lite = """
+    query CostsOrder($orderNumber: String!, $liteId: String) {
+        order(orderNumber: $orderNumber, liteId: $liteId) {
+            id
+            costs {
+                total {
+                ...Money
+                }
+                delivery {
+                ...Money
+                }
+            }
+        }
+    }
+
+    %s
+    """ % (
+        Fragments.money
+    )
+
     product_list_order = """
     query ProductListOrder(
         $orderNumber: String!
@@ -5,7 +5,7 @@ from typing import Any
 from ikea_api.abc import Endpoint, SessionInfo, endpoint
 from ikea_api.base_ikea_api import BaseIkeaAPI
 from ikea_api.error_handlers import handle_json_decode_error
-from ikea_api.exceptions import ItemFetchError
+from ikea_api.exceptions import ItemFetchError, KnownInvalidItemError
 
 
 def build_url(item_code: str) -> str:
@@ -20,9 +20,13 @@ class RoteraItem(BaseIkeaAPI):
 
     @endpoint()
     def get_item(self, item_code: str) -> Endpoint[dict[str, Any]]:
+        if not self._split_invalid_item_codes([item_code])[0]:
+            raise KnownInvalidItemError(item_code)
+
         response = yield self._RequestInfo("GET", build_url(item_code))
 
         if response.status_code == 404:
+            self._add_invalid_item_codes([item_code])
             raise ItemFetchError(response)
 
         handle_json_decode_error(response)
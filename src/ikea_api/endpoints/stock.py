@@ -4,7 +4,15 @@ from typing import Any
 
 from ikea_api.abc import Endpoint, SessionInfo, endpoint
 from ikea_api.base_ikea_api import BaseIkeaAPI
-from ikea_api.error_handlers import handle_graphql_error, handle_json_decode_error
+from ikea_api.error_handlers import (
+    handle_graphql_error,
+    handle_json_decode_error,
+    handle_not_success,
+)
+
+
+def build_params(item_codes: list[str]) -> dict[str, Any]:
+    return {"itemNos": item_codes, "expand": "StoresList,Restocks,SalesLocations"}
 
 
 class Stock(BaseIkeaAPI):
@@ -21,9 +29,13 @@ class Stock(BaseIkeaAPI):
 
     @endpoint(handlers=[handle_json_decode_error, handle_graphql_error])
     def get_stock(self, item_code: str) -> Endpoint[dict[str, Any]]:
-        params = {
-            "itemNos": [item_code],
-            "expand": "StoresList,Restocks,SalesLocations",
-        }
-        response = yield self._RequestInfo("GET", params=params)
+        response = yield self._RequestInfo("GET", params=build_params([item_code]))
+        return response.json
+
+    @endpoint(
+        handlers=[handle_json_decode_error, handle_graphql_error, handle_not_success]
+    )
+    def get_stocks(self, item_codes: list[str]) -> Endpoint[dict[str, Any]]:
+        """Get stock of several items with one request."""
+        response = yield self._RequestInfo("GET", params=build_params(item_codes))
         return response.json
@@ -32,8 +32,12 @@ class NotSuccessError(APIError):
 class GraphQLError(APIError):
     errors: list[dict[str, Any]]
 
-    def __init__(self, response: ResponseInfo) -> None:
-        if isinstance(response.json, cast(Type[Dict[str, Any]], dict)):
+    def __init__(
+        self, response: ResponseInfo, errors: list[dict[str, Any]] | None = None
+    ) -> None:
+        if errors is not None:
+            self.errors = errors
+        elif isinstance(response.json, cast(Type[Dict[str, Any]], dict)):
             self.errors = response.json[  # pyright: ignore[reportUnknownMemberType]
                 "errors"
             ]
@@ -62,6 +66,18 @@ class WrongItemCodeError(ItemFetchError):
     pass
 
 
+class KnownInvalidItemError(ItemFetchError):
+    """Item code is in invalid item registry, so request wasn't made.
+    There's no `response` in this case.
+    """
+
+    item_code: str
+
+    def __init__(self, item_code: str) -> None:
+        self.item_code = item_code
+        Exception.__init__(self, item_code)
+
+
 class ProcessingError(APIError):
     pass
 
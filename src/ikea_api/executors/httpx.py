@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any, cast
@@ -31,7 +32,15 @@ class HttpxResponseInfo(ResponseInfo):
 
     @cached_property
     def json(self) -> Any:
-        return self.response.json()
+        started = time.perf_counter()
+        try:
+            return self.response.json()
+        finally:
+            self.json_decode_time = time.perf_counter() - started
+
+    @property
+    def content_length(self) -> int:
+        return len(self.response.content)
 
     @property
     def is_success(self) -> bool:
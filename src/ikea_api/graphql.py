@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Type, TypeVar, cast
+
+_T = TypeVar("_T")
+
+_SPACES_RE = re.compile(r"\s+")
+_PUNCTUATOR_RE = re.compile(r" ?([{}()\[\]:,!=]) ?")
+
+PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+
+
+def minify_query(query: str) -> str:
+    """Remove insignificant whitespace from GraphQL document.
+    Document must not contain string literals and comments.
+    """
+    return _PUNCTUATOR_RE.sub(r"\1", _SPACES_RE.sub(" ", query)).strip()
+
+
+def minify_queries(cls: Type[_T]) -> Type[_T]:
+    """Class decorator that minifies all public string attributes once, at import."""
+    for name, value in list(vars(cls).items()):
+        if not name.startswith("_") and isinstance(value, str):
+            setattr(cls, name, minify_query(value))
+    return cls
+
+
+@lru_cache(maxsize=None)
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def build_persisted_payload(
+    payload: dict[str, Any], *, include_query: bool
+) -> dict[str, Any]:
+    """Build automatic persisted query payload: send query hash and,
+    if server doesn't know it yet, the query itself.
+    """
+    res = {k: v for k, v in payload.items() if k != "query" or include_query}
+    res["extensions"] = {
+        "persistedQuery": {"version": 1, "sha256Hash": get_query_hash(payload["query"])}
+    }
+    return res
+
+
+def _is_persisted_query_not_found(error: Any) -> bool:
+    if not isinstance(error, dict):
+        return False
+    error = cast(Dict[str, Any], error)
+    extensions = error.get("extensions") or {}
+    return (
+        extensions.get("code") == PERSISTED_QUERY_NOT_FOUND
+        or error.get("message") == "PersistedQueryNotFound"
+    )
+
+
+def is_persisted_query_not_found(response_json: Any) -> bool:
+    """Check whether server asks to send full query for any query in response."""
+    chunks = cast(
+        List[Any], response_json if isinstance(response_json, list) else [response_json]
+    )
+    for chunk in chunks:
+        if not isinstance(chunk, dict):
+            continue
+        errors = cast(Dict[str, Any], chunk).get("errors")
+        if isinstance(errors, list) and any(
+            _is_persisted_query_not_found(e) for e in cast(List[Any], errors)
+        ):
+            return True
+    return False
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable
+
+# Discontinued items rarely come back, but new ones may reuse codes
+DEFAULT_INVALID_ITEM_TTL = 7 * 24 * 60 * 60
+DEFAULT_SAVE_INTERVAL = 60
+
+
+class InvalidItemRegistry:
+    """Negative cache of item codes that are known to be invalid or
+    discontinued in a market (country).
+
+    Endpoints and wrappers that accept registry skip these codes instead of
+    making requests that are bound to fail. Codes are forgotten after `ttl`
+    seconds. If `path` is set, registry is loaded from and saved to JSON file.
+    New codes are saved at most once per `save_interval` seconds, call
+    `flush()` to save the rest before exit.
+    """
+
+    ttl: float
+    path: Path | None
+    save_interval: float
+    _expires_at: dict[str, dict[str, float]]
+    _dirty: bool
+    _saved_at: float
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_INVALID_ITEM_TTL,
+        path: str | Path | None = None,
+        save_interval: float = DEFAULT_SAVE_INTERVAL,
+    ) -> None:
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self.save_interval = save_interval
+        self._expires_at = {}
+        self._dirty = False
+        self._saved_at = float("-inf")
+        if self.path and self.path.exists():
+            self.load()
+
+    def add(self, country: str, item_codes: Iterable[str]) -> None:
+        item_codes = list(item_codes)
+        if not item_codes:
+            return
+
+        expires_at = time.time() + self.ttl
+        market = self._expires_at.setdefault(country, {})
+        for item_code in item_codes:
+            market[item_code] = expires_at
+
+        self._dirty = True
+        if self.path and time.monotonic() - self._saved_at >= self.save_interval:
+            self.save()
+
+    def flush(self) -> None:
+        """Save codes that were added since last save."""
+        if self.path and self._dirty:
+            self.save()
+
+    def is_invalid(self, country: str, item_code: str) -> bool:
+        market = self._expires_at.get(country)
+        if not market or item_code not in market:
+            return False
+        if market[item_code] <= time.time():
+            del market[item_code]
+            return False
+        return True
+
+    def split(
+        self, country: str, item_codes: Iterable[str]
+    ) -> tuple[list[str], list[str]]:
+        """Split item codes into ones that are not known to be invalid and
+        ones that are.
+        """
+        valid: list[str] = []
+        invalid: list[str] = []
+        for item_code in item_codes:
+            if self.is_invalid(country, item_code):
+                invalid.append(item_code)
+            else:
+                valid.append(item_code)
+        return valid, invalid
+
+    def clear(self) -> None:
+        self._expires_at = {}
+        if self.path:
+            self.save()
+
+    def load(self) -> None:
+        if self.path is None:
+            raise ValueError("Registry has no path to load from")
+        with open(self.path, encoding="utf-8") as f:
+            data: Dict[str, Dict[str, float]] = json.load(f)
+
+        now = time.time()
+        self._expires_at = {
+            country: {code: exp for code, exp in market.items() if exp > now}
+            for country, market in data.items()
+        }
+
+    def save(self) -> None:
+        if self.path is None:
+            raise ValueError("Registry has no path to save to")
+        now = time.time()
+        data = {
+            country: {code: exp for code, exp in market.items() if exp > now}
+            for country, market in self._expires_at.items()
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        self._dirty = False
+        self._saved_at = time.monotonic()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Mapping, Sequence, Tuple
+
+from ikea_api.abc import EndpointTags, ExecutorHooks, ResponseInfo
+
+REQUEST_DURATION = "request_duration_seconds"
+RESPONSE_SIZE = "response_size_bytes"
+RESPONSES = "responses_total"
+HANDLERS_DURATION = "handlers_duration_seconds"
+JSON_DECODE_DURATION = "json_decode_duration_seconds"
+ENDPOINT_DURATION = "endpoint_duration_seconds"
+ENDPOINT_ERRORS = "endpoint_errors_total"
+
+DEFAULT_DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_SIZE_BUCKETS = tuple(float(4**i) for i in range(4, 12))  # 256 B to 4 MiB
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def get_labels_key(labels: Mapping[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+class MetricsExporter(ABC):
+    """Adapter to metrics backend, for example, Prometheus or OpenTelemetry.
+
+    Names of observations end with `_seconds` or `_bytes`,
+    names of counters end with `_total`.
+    """
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        ...
+
+    @abstractmethod
+    def increment(self, name: str, labels: Mapping[str, str]) -> None:
+        ...
+
+
+class MetricsHooks(ExecutorHooks):
+    """Executor hooks that report metrics to exporter. Every metric has
+    `endpoint` (endpoint method name, for example, `Cart.show`) and `host` labels.
+    """
+
+    exporter: MetricsExporter
+
+    def __init__(self, exporter: MetricsExporter) -> None:
+        self.exporter = exporter
+
+    def on_request_end(
+        self, tags: EndpointTags, response: ResponseInfo, duration: float
+    ) -> None:
+        labels = {"endpoint": tags.endpoint, "host": tags.host}
+        self.exporter.observe(REQUEST_DURATION, duration, labels)
+        content_length = response.content_length
+        if content_length is not None:
+            self.exporter.observe(RESPONSE_SIZE, content_length, labels)
+        self.exporter.increment(
+            RESPONSES, {**labels, "status": str(response.status_code)}
+        )
+
+    def on_handlers_end(self, tags: EndpointTags, duration: float) -> None:
+        labels = {"endpoint": tags.endpoint, "host": tags.host}
+        self.exporter.observe(HANDLERS_DURATION, duration, labels)
+
+    def on_json_decode(self, tags: EndpointTags, duration: float) -> None:
+        labels = {"endpoint": tags.endpoint, "host": tags.host}
+        self.exporter.observe(JSON_DECODE_DURATION, duration, labels)
+
+    def on_endpoint_end(
+        self, tags: EndpointTags, duration: float, error: BaseException | None
+    ) -> None:
+        labels = {"endpoint": tags.endpoint, "host": tags.host}
+        self.exporter.observe(ENDPOINT_DURATION, duration, labels)
+        if error is not None:
+            self.exporter.increment(
+                ENDPOINT_ERRORS, {**labels, "error": type(error).__name__}
+            )
+
+
+class Histogram:
+    """Histogram with fixed bucket upper bounds. Last bucket is for values
+    greater than all bounds.
+    """
+
+    bounds: Sequence[float]
+    counts: list[int]
+    count: int
+    sum: float
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_DURATION_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate quantile as upper bound of bucket it falls into.
+        If it falls into last bucket, the greatest bound is returned.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+
+
+class HistogramCollector(MetricsExporter):
+    """In-memory exporter that keeps histogram per metric name and labels."""
+
+    histograms: dict[tuple[str, Labels], Histogram]
+    counters: dict[tuple[str, Labels], int]
+    _bounds: dict[str, Sequence[float]]
+
+    def __init__(self, bounds: Mapping[str, Sequence[float]] | None = None) -> None:
+        self.histograms = {}
+        self.counters = {}
+        self._bounds = {RESPONSE_SIZE: DEFAULT_SIZE_BUCKETS}
+        if bounds:
+            self._bounds.update(bounds)
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        key = (name, get_labels_key(labels))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            bounds = self._bounds.get(name, DEFAULT_DURATION_BUCKETS)
+            histogram = self.histograms[key] = Histogram(bounds)
+        histogram.observe(value)
+
+    def increment(self, name: str, labels: Mapping[str, str]) -> None:
+        key = (name, get_labels_key(labels))
+        self.counters[key] = self.counters.get(key, 0) + 1
+
+    def get_histogram(self, name: str, **labels: str) -> Histogram | None:
+        return self.histograms.get((name, get_labels_key(labels)))
+
+    def get_counter(self, name: str, **labels: str) -> int:
+        return self.counters.get((name, get_labels_key(labels)), 0)
+
+    def clear(self) -> None:
+        self.histograms.clear()
+        self.counters.clear()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable
+
+from ikea_api.abc import EndpointInfo
+from ikea_api.constants import Constants
+from ikea_api.endpoints.auth import Auth
+from ikea_api.executors.httpx import run_async
+
+# Guest token expires in 30 days
+DEFAULT_TOKEN_LIFETIME = 30 * 24 * 60 * 60
+
+TokenRunner = Callable[[EndpointInfo[str]], Awaitable[str]]
+
+
+def get_token_expiration_time(token: str) -> float | None:
+    """Get expiration timestamp from JWT payload. Signature is not verified."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+@dataclass(frozen=True)
+class GuestToken:
+    value: str
+    expires_at: float
+
+    @classmethod
+    def from_value(cls, value: str) -> GuestToken:
+        expires_at = get_token_expiration_time(value)
+        if expires_at is None:
+            expires_at = time.time() + DEFAULT_TOKEN_LIFETIME
+        return cls(value=value, expires_at=expires_at)
+
+    def expires_within(self, seconds: float) -> bool:
+        return time.time() + seconds >= self.expires_at
+
+
+class TokenManager:
+    """Keeps guest token fresh.
+
+    Token is refreshed `refresh_margin` seconds before it expires.
+    Concurrent callers wait for the same refresh request.
+    """
+
+    refresh_margin: float
+    _token: GuestToken | None
+    _refresh_task: asyncio.Future[GuestToken] | None
+
+    def __init__(
+        self,
+        constants: Constants,
+        *,
+        refresh_margin: float = 60 * 60,
+        run: TokenRunner = run_async,
+    ) -> None:
+        self.refresh_margin = refresh_margin
+        self._auth = Auth(constants)
+        self._run = run
+        self._token = None
+        self._refresh_task = None
+
+    async def get_token(self) -> str:
+        token = self._token
+        if token is None or token.expires_within(self.refresh_margin):
+            token = await self.refresh()
+        return token.value
+
+    async def refresh(self) -> GuestToken:
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._fetch_token())
+        return await asyncio.shield(self._refresh_task)
+
+    def invalidate(self) -> None:
+        """Drop current token so that next `get_token()` call fetches new one."""
+        self._token = None
+
+    async def _fetch_token(self) -> GuestToken:
+        try:
+            value = await self._run(self._auth.get_guest_token())
+            self._token = GuestToken.from_value(value)
+            return self._token
+        finally:
+            self._refresh_task = None
+
+
+class TokenPool:
+    """Pool of `size` guest tokens. Every guest token has its own cart.
+
+    Use `lease()` to get token exclusively, so that cart-based workflows
+    running in parallel don't interfere.
+    """
+
+    _managers: list[TokenManager]
+    _free: asyncio.Queue[TokenManager] | None
+
+    def __init__(
+        self,
+        constants: Constants,
+        size: int,
+        *,
+        refresh_margin: float = 60 * 60,
+        run: TokenRunner = run_async,
+    ) -> None:
+        self._managers = [
+            TokenManager(constants, refresh_margin=refresh_margin, run=run)
+            for _ in range(size)
+        ]
+        self._free = None
+
+    @property
+    def size(self) -> int:
+        return len(self._managers)
+
+    def _get_free(self) -> asyncio.Queue[TokenManager]:
+        # Pool may be created before event loop is running, see LazySemaphore
+        if self._free is None:
+            self._free = asyncio.Queue()
+            for manager in self._managers:
+                self._free.put_nowait(manager)
+        return self._free
+
+    async def warm_up(self) -> None:
+        """Fetch all tokens concurrently."""
+        await asyncio.gather(*(m.get_token() for m in self._managers))
+
+    @asynccontextmanager
+    async def lease_manager(self) -> AsyncIterator[TokenManager]:
+        free = self._get_free()
+        manager = await free.get()
+        try:
+            yield manager
+        finally:
+            free.put_nowait(manager)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[str]:
+        async with self.lease_manager() as manager:
+            yield await manager.get_token()
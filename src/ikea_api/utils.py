@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import json
 import re
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from ikea_api.constants import Constants
 
@@ -30,3 +33,110 @@ def translate_from_dict(
     if lang_dict is None:
         return v
     return lang_dict.get(v, v)
+
+
+_JSON_TOKEN_RE = re.compile(r'\\.?|["{}\[\],:]', re.DOTALL)
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Decode items of top-level object's `key` array from raw JSON chunks.
+
+    Items are yielded as soon as they are fully received, only the item
+    that is being read is kept in memory. Raises `json.JSONDecodeError`
+    if data is malformed or truncated.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    depth = 0
+    in_string = skip_next = in_array = False
+    string_parts: list[str] | None = None
+    item_parts: list[str] = []
+    last_string = current_key = None
+
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if not text:
+            continue
+
+        pos = string_start = item_start = 0
+        if skip_next:
+            pos, skip_next = 1, False
+
+        for match in _JSON_TOKEN_RE.finditer(text, pos):
+            token, idx = match.group(), match.start()
+
+            if token[0] == "\\":
+                # Escaped char is in the next chunk
+                skip_next = len(token) == 1
+
+            elif in_string:
+                if token == '"':
+                    in_string = False
+                    if string_parts is not None:
+                        string_parts.append(text[string_start:idx])
+                        last_string = "".join(string_parts)
+                        string_parts = None
+
+            elif token == '"':
+                in_string = True
+                if depth == 1:
+                    string_parts, string_start = [], idx + 1
+
+            elif token in "{[":
+                if token == "[" and depth == 1 and current_key == key:
+                    in_array, item_parts, item_start = True, [], idx + 1
+                depth += 1
+
+            elif token in "}]":
+                depth -= 1
+                if in_array and depth == 1:
+                    item_parts.append(text[item_start:idx])
+                    raw_item = "".join(item_parts).strip()
+                    if raw_item:
+                        yield json.loads(raw_item)
+                    in_array, item_parts = False, []
+
+            elif token == ":":
+                if depth == 1:
+                    current_key = last_string
+
+            elif depth == 1:  # Comma between keys
+                current_key = None
+
+            elif in_array and depth == 2:  # Comma between items
+                item_parts.append(text[item_start:idx])
+                yield json.loads("".join(item_parts))
+                item_parts, item_start = [], idx + 1
+
+        if string_parts is not None:
+            string_parts.append(text[string_start:])
+        if in_array:
+            item_parts.append(text[item_start:])
+
+    decoder.decode(b"", final=True)
+    if depth or in_string:
+        raise json.JSONDecodeError("Unexpected end of data", "", 0)
+
+
+class LazySemaphore:
+    """`asyncio.Semaphore` that is created on first use. Objects that hold it
+    can be created before event loop is running: on Python < 3.10 asyncio
+    primitives are bound to the loop they are created in.
+    """
+
+    value: int
+    _semaphore: asyncio.Semaphore | None
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self._semaphore = None
+
+    def _get(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.value)
+        return self._semaphore
+
+    async def __aenter__(self) -> None:
+        await self._get().acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._get().release()
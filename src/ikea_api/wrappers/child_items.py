@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Iterable, List, TypeVar, cast
+
+from ikea_api.constants import Constants
+from ikea_api.endpoints.ingka_items import IngkaItems
+from ikea_api.exceptions import ItemFetchError
+from ikea_api.executors.httpx import run_async as run_with_httpx
+from ikea_api.invalid_items import InvalidItemRegistry
+from ikea_api.utils import LazySemaphore
+from ikea_api.wrappers import types
+from ikea_api.wrappers.parsers.ingka_items import parse_ingka_items
+
+_ItemWithChildrenT = TypeVar("_ItemWithChildrenT", types.IngkaItem, types.ParsedItem)
+
+
+def get_ingka_invalid_item_codes(exc: ItemFetchError) -> list[str]:
+    # IngkaItems passes item codes from error keys as message
+    msg = exc.args[0] if exc.args else None
+    if not isinstance(msg, list):
+        return []
+    return [c for c in cast(List[Any], msg) if isinstance(c, str)]
+
+
+async def get_ingka_items_skipping_invalid(
+    ingka_items: IngkaItems, item_codes: list[str]
+) -> tuple[dict[str, Any], list[str]]:
+    """Get items, retrying without item codes that Ingka reported as invalid.
+    Return response and reported item codes.
+    Reraise error if it isn't about invalid items.
+    """
+    invalid_item_codes: list[str] = []
+    while item_codes:
+        try:
+            response = await run_with_httpx(ingka_items.get_items(item_codes))
+            return response, invalid_item_codes
+        except ItemFetchError as exc:
+            reported = set(get_ingka_invalid_item_codes(exc)).intersection(item_codes)
+            if not reported:
+                raise
+            invalid_item_codes += [c for c in item_codes if c in reported]
+            item_codes = [c for c in item_codes if c not in reported]
+    return {"data": []}, invalid_item_codes
+
+
+class ChildItemResolver:
+    """Fills names and weights of combination child items.
+
+    Child items of the whole batch are requested at once, without duplicates,
+    `chunk_size` items per request. Fetched child items are cached
+    for the lifetime of resolver, so they are requested only once.
+    """
+
+    chunk_size: int
+    concurrency: int
+    _cache: dict[str, types.IngkaItem | None]
+    _pending: dict[str, asyncio.Future[None]]
+    _semaphore: LazySemaphore
+
+    def __init__(
+        self,
+        constants: Constants,
+        *,
+        chunk_size: int = 50,
+        concurrency: int = 5,
+        invalid_items: InvalidItemRegistry | None = None,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self._constants = constants
+        self._ingka_items = IngkaItems(constants, invalid_items=invalid_items)
+        self._cache = {}
+        self._pending = {}
+        self._semaphore = LazySemaphore(concurrency)
+
+    async def resolve(
+        self, items: Iterable[_ItemWithChildrenT]
+    ) -> list[_ItemWithChildrenT]:
+        """Return items with filled child items. If combination has no weight,
+        it is set to total weight of its child items.
+        """
+        items = list(items)
+        await self._fetch(c.item_code for i in items for c in i.child_items)
+        return [self._fill(item) for item in items]
+
+    async def _fetch(self, item_codes: Iterable[str]) -> None:
+        # Child items that are being fetched by concurrent call are awaited
+        tasks: set[asyncio.Future[None]] = set()
+        missing: list[str] = []
+        for item_code in dict.fromkeys(item_codes):
+            if item_code in self._cache:
+                continue
+            if item_code in self._pending:
+                tasks.add(self._pending[item_code])
+            else:
+                missing.append(item_code)
+
+        for start in range(0, len(missing), self.chunk_size):
+            chunk = missing[start : start + self.chunk_size]
+            task = asyncio.ensure_future(self._fetch_chunk(chunk))
+            self._pending.update(dict.fromkeys(chunk, task))
+            tasks.add(task)
+
+        await asyncio.gather(*(asyncio.shield(t) for t in tasks))
+
+    async def _fetch_chunk(self, item_codes: list[str]) -> None:
+        try:
+            async with self._semaphore:
+                try:
+                    response, _ = await get_ingka_items_skipping_invalid(
+                        self._ingka_items, item_codes
+                    )
+                except ItemFetchError:
+                    # Not cached, so that these items are requested next time
+                    return
+
+            for item_code in item_codes:
+                self._cache[item_code] = None
+            for item in parse_ingka_items(self._constants, response):
+                self._cache[item.item_code] = item
+        finally:
+            for item_code in item_codes:
+                self._pending.pop(item_code, None)
+
+    def _fill(self, item: _ItemWithChildrenT) -> _ItemWithChildrenT:
+        if not item.child_items:
+            return item
+
+        child_items: list[types.ChildItem] = []
+        for child in item.child_items:
+            cached = self._cache.get(child.item_code)
+            if cached:
+                child = child.model_copy(
+                    update={"name": cached.name, "weight": cached.weight}
+                )
+            child_items.append(child)
+
+        weight = item.weight or sum(c.weight * c.qty for c in child_items)
+        return item.model_copy(update={"child_items": child_items, "weight": weight})
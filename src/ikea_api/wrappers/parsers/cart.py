@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+from ikea_api.wrappers import types
+
+
+class CartItem(BaseModel):
+    itemNo: str
+    quantity: int
+
+
+class CartData(BaseModel):
+    items: List[CartItem]
+
+
+class CartResponseData(BaseModel):
+    cart: CartData
+
+
+class ResponseCart(BaseModel):
+    data: CartResponseData
+
+
+def parse_cart_items(response: dict[str, Any]) -> dict[str, int]:
+    """Parse `Cart.show()` response with any profile except "totals"."""
+    cart = ResponseCart.model_validate(response)
+    return {item.itemNo: item.quantity for item in cart.data.cart.items}
+
+
+class Price(BaseModel):
+    inclTax: float
+
+
+class Discount(BaseModel):
+    amount: float
+
+
+class TotalPrice(BaseModel):
+    totalInclDiscount: Price
+    totalDiscount: Discount
+
+
+class CartTotalsData(BaseModel):
+    currency: str
+    regularTotalPrice: TotalPrice
+    familyTotalPrice: Optional[TotalPrice] = None
+
+
+class CartTotalsResponseData(BaseModel):
+    cart: CartTotalsData
+
+
+class ResponseCartTotals(BaseModel):
+    data: CartTotalsResponseData
+
+
+def parse_cart_totals(response: dict[str, Any]) -> types.CartTotals:
+    """Parse `Cart.show(profile="totals")` response."""
+    cart = ResponseCartTotals.model_validate(response).data.cart
+    return types.CartTotals(
+        currency=cart.currency,
+        total=cart.regularTotalPrice.totalInclDiscount.inclTax,
+        discount=cart.regularTotalPrice.totalDiscount.amount,
+        family_total=(
+            cart.familyTotalPrice.totalInclDiscount.inclTax
+            if cart.familyTotalPrice
+            else None
+        ),
+    )
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import json
 import re
-from typing import Any, Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, ValidationInfo, field_validator
 
+from ikea_api.abc import ResponseInfo
 from ikea_api.constants import Constants
-from ikea_api.exceptions import ParsingError
+from ikea_api.exceptions import JSONError, ParsingError
+from ikea_api.utils import iter_json_array
 from ikea_api.wrappers import types
 from ikea_api.wrappers.parsers.item_base import (
     ItemCode,
@@ -71,6 +75,21 @@ class ResponseIngkaItem(BaseModel):
     localisedCommunications: List[LocalisedCommunication]
     childItems: Optional[List[ChildItem]] = None
 
+    @field_validator("localisedCommunications", mode="before")
+    @classmethod
+    def only_requested_language(cls, value: Any, info: ValidationInfo) -> Any:
+        # Skip validating communications in other languages: they are heavy
+        # and never used
+        if not info.context or not isinstance(value, list):
+            return value
+        language = info.context["language"]
+        return [
+            comm
+            for comm in value
+            if isinstance(comm, dict)
+            and comm.get("languageCode") == language  # pyright: ignore
+        ]
+
 
 class ResponseIngkaItems(BaseModel):
     data: List[ResponseIngkaItem]
@@ -85,27 +104,57 @@ def get_localised_communication(
     raise ParsingError("Cannot find appropriate localized communication")
 
 
-def parse_russian_product_name(product_name: str) -> str:
-    if not re.findall(r"[А-яЁё ]+", product_name):  # Russian text found
-        # No russian text found: 'MARABOU'
-        return product_name
+_DIGIT_RE = re.compile(r"\d")
+_SPACES_RE = re.compile(r"\s+")
+
+
+class ProductNameRule:
+    """Strips latin part of product name for languages with non-latin alphabet."""
+
+    def __init__(self, letters: str) -> None:
+        self.native_re = re.compile(f"[{letters}]")
+        self.from_native_re = re.compile(f"^[^{letters}]+?([{letters}].*)")
+        self.not_native_re = re.compile(f"[^{letters} /+]+")
+
+    def parse(self, product_name: str) -> str:
+        if not self.native_re.search(product_name):
+            # No native text found: 'MARABOU'
+            return product_name
+
+        if _DIGIT_RE.search(product_name):
+            # Has numbers in itself: 'IKEA 365+ ИКЕА/365+', 'VINTER 2021 ВИНТЕР 2021'
+            match = self.from_native_re.match(product_name)
+            return match.group(1) if match else product_name
 
-    if re.findall(r"\d+", product_name):
-        # Has numbers in itself: 'IKEA 365+ ИКЕА/365+', 'VINTER 2021 ВИНТЕР 2021'
-        matches = re.findall(r"^[^А-яЁё]+?([А-яЁё].*)", product_name)
-        if matches:
-            product_name = matches[0]
-    else:
         # Covers cases like: 'BESTÅ БЕСТО / EKET ЭКЕТ'
-        product_name = re.sub(r"[^А-яЁё /+]+", "", product_name)
-        product_name = re.sub(r"\s+", " ", product_name)
-        product_name = re.sub(r"^ | $", "", product_name)
+        product_name = self.not_native_re.sub("", product_name)
+        return _SPACES_RE.sub(" ", product_name).strip(" ")
+
 
-    return product_name
+PRODUCT_NAME_RULES = {
+    "ru": ProductNameRule("А-яЁё"),
+    "uk": ProductNameRule("А-яЁёЄєІіЇїҐґ"),
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_product_name(language: str, product_name: str) -> str:
+    rule = PRODUCT_NAME_RULES.get(language)
+    if rule is None:
+        return product_name
+    return rule.parse(product_name)
 
 
-def get_name(comm: LocalisedCommunication) -> str:
-    product_name = parse_russian_product_name(comm.productName)
+def parse_product_name(constants: Constants, product_name: str) -> str:
+    return _parse_product_name(constants.language, product_name)
+
+
+def parse_russian_product_name(product_name: str) -> str:
+    return _parse_product_name("ru", product_name)
+
+
+def get_name(constants: Constants, comm: LocalisedCommunication) -> str:
+    product_name = parse_product_name(constants, comm.productName)
     product_type = comm.productType.name.capitalize()
     design = comm.validDesign.text if comm.validDesign else None
 
@@ -168,16 +217,54 @@ def parse_item(constants: Constants, item: ResponseIngkaItem) -> types.IngkaItem
     return types.IngkaItem(
         is_combination=get_is_combination_from_item_type(item.itemKey.itemType),
         item_code=item.itemKey.itemNo,
-        name=get_name(comm),
+        name=get_name(constants, comm),
         image_url=get_image_url(comm),
         weight=get_weight(comm),
         child_items=get_child_items(item.childItems),
     )
 
 
+def get_validation_context(constants: Constants) -> dict[str, Any]:
+    return {"language": constants.language}
+
+
 def parse_ingka_items(
     constants: Constants, response: dict[str, Any]
 ) -> Iterable[types.IngkaItem]:
-    parsed_resp = ResponseIngkaItems.model_validate(response)
+    parsed_resp = ResponseIngkaItems.model_validate(
+        response, context=get_validation_context(constants)
+    )
     for item in parsed_resp.data:
         yield parse_item(constants, item)
+
+
+def parse_ingka_items_stream(
+    constants: Constants,
+    response: ResponseInfo,
+    chunks: Iterable[bytes],
+    on_error: Callable[[ParsingError], None] | None = None,
+) -> Iterable[types.IngkaItem]:
+    """Parse raw body of `response` chunk by chunk, yielding items as they arrive.
+
+    If item can't be parsed, it is skipped and the error is passed to `on_error`.
+    If body is malformed or truncated, JSONError is raised.
+    """
+    context = get_validation_context(constants)
+    raw_items = iter_json_array(chunks, "data")
+    while True:
+        try:
+            raw_item = next(raw_items)
+        except StopIteration:
+            return
+        except json.JSONDecodeError:
+            raise JSONError(response)
+
+        try:
+            parsed_item = ResponseIngkaItem.model_validate(raw_item, context=context)
+            item = parse_item(constants, parsed_item)
+        except (ValidationError, ParsingError) as exc:
+            if on_error:
+                error = exc if isinstance(exc, ParsingError) else ParsingError(exc)
+                on_error(error)
+            continue
+        yield item
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -58,6 +58,47 @@ class ResponseCosts(BaseModel):
     data: CostsData
 
 
+class ProductImage(BaseModel):
+    large: Optional[str] = None
+
+
+class FormattedPrice(BaseModel):
+    formatted: str
+
+
+class Product(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    href: Optional[str] = None
+    quantity: int
+    image: Optional[ProductImage] = None
+    unitPrice: Optional[FormattedPrice] = None
+    totalPrice: Optional[FormattedPrice] = None
+
+
+class AnyDirectionProducts(BaseModel):
+    direction: str
+    any: List[Product]
+
+
+class ExchangeProducts(BaseModel):
+    inbound: List[Product]
+    outbound: List[Product]
+
+
+class ProductListOrder(BaseModel):
+    articles: Union[AnyDirectionProducts, ExchangeProducts]
+
+
+class ProductListData(BaseModel):
+    order: ProductListOrder
+
+
+class ResponseProductList(BaseModel):
+    data: ProductListData
+
+
 class HistoryDateAndTime(BaseModel):
     date: str
     time: str
@@ -102,6 +143,38 @@ def parse_costs_order(response: dict[str, Any]) -> types.CostsOrder:
     )
 
 
+def parse_purchase_info(
+    status_banner_response: dict[str, Any], costs_response: dict[str, Any]
+) -> types.PurchaseInfo:
+    return types.PurchaseInfo(
+        **parse_status_banner_order(status_banner_response).model_dump(),
+        **parse_costs_order(costs_response).model_dump(),
+    )
+
+
+def get_purchase_product(product: Product, direction: str) -> types.PurchaseProduct:
+    return types.PurchaseProduct(
+        item_code=product.id,
+        name=product.name,
+        description=product.description,
+        qty=product.quantity,
+        direction=direction,
+        url=product.href,
+        image_url=product.image.large if product.image else None,
+        unit_price=product.unitPrice.formatted if product.unitPrice else None,
+        total_price=product.totalPrice.formatted if product.totalPrice else None,
+    )
+
+
+def parse_product_list_order(response: dict[str, Any]) -> list[types.PurchaseProduct]:
+    articles = ResponseProductList.model_validate(response).data.order.articles
+    if isinstance(articles, AnyDirectionProducts):
+        return [get_purchase_product(p, articles.direction) for p in articles.any]
+    return [get_purchase_product(p, "INBOUND") for p in articles.inbound] + [
+        get_purchase_product(p, "OUTBOUND") for p in articles.outbound
+    ]
+
+
 def get_history_datetime(item: HistoryItem) -> str:
     return f"{item.dateAndTime.date}T{item.dateAndTime.time}"
 
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, cast
+
+from pydantic import BaseModel
+
+from ikea_api.wrappers import types
+from ikea_api.wrappers.parsers.item_base import ItemCode
+
+
+class ItemKey(BaseModel):
+    itemNo: ItemCode
+
+
+class ClassUnitKey(BaseModel):
+    classUnitCode: str
+
+
+class ResponseRestock(BaseModel):
+    earliestDate: datetime.date
+    latestDate: datetime.date
+    quantity: Optional[int] = None
+
+
+class ThisDayProbability(BaseModel):
+    messageType: Optional[str] = None
+
+
+class Probability(BaseModel):
+    thisDay: Optional[ThisDayProbability] = None
+
+
+class Availability(BaseModel):
+    quantity: int = 0
+    probability: Optional[Probability] = None
+    restocks: List[ResponseRestock] = []
+
+
+class CashCarry(BaseModel):
+    availability: Optional[Availability] = None
+
+
+class BuyingOption(BaseModel):
+    cashCarry: Optional[CashCarry] = None
+
+
+class ResponseStoreAvailability(BaseModel):
+    itemKey: ItemKey
+    classUnitKey: ClassUnitKey
+    buyingOption: Optional[BuyingOption] = None
+
+
+def is_store_availability(availability: Any) -> bool:
+    if not isinstance(availability, dict):
+        return False
+    class_unit_key = cast(Dict[str, Any], availability).get("classUnitKey")
+    return (
+        isinstance(class_unit_key, dict)
+        and cast(Dict[str, Any], class_unit_key).get("classUnitType") == "STO"
+    )
+
+
+def get_probability(availability: Availability) -> str | None:
+    if availability.probability and availability.probability.thisDay:
+        return availability.probability.thisDay.messageType
+
+
+def get_restocks(availability: Availability) -> list[types.Restock]:
+    restocks = [
+        types.Restock(
+            earliest_date=r.earliestDate, latest_date=r.latestDate, qty=r.quantity
+        )
+        for r in availability.restocks
+    ]
+    restocks.sort(key=lambda r: r.earliest_date)
+    return restocks
+
+
+def parse_store_stock(item: ResponseStoreAvailability) -> types.StoreStock:
+    availability = None
+    if item.buyingOption and item.buyingOption.cashCarry:
+        availability = item.buyingOption.cashCarry.availability
+
+    if availability is None:
+        return types.StoreStock(
+            item_code=item.itemKey.itemNo,
+            store_id=item.classUnitKey.classUnitCode,
+            qty=0,
+            restocks=[],
+        )
+    return types.StoreStock(
+        item_code=item.itemKey.itemNo,
+        store_id=item.classUnitKey.classUnitCode,
+        qty=availability.quantity,
+        probability=get_probability(availability),
+        restocks=get_restocks(availability),
+    )
+
+
+def parse_stock(response: dict[str, Any]) -> Iterable[types.StoreStock]:
+    """Parse store availabilities of `Stock.get_stock()` response.
+    Retail unit (country-wide) availabilities are skipped before validation.
+    Restocks are sorted by earliest date.
+    """
+    availabilities = response.get("availabilities")
+    if not isinstance(availabilities, list):
+        return
+
+    for availability in cast(List[Any], availabilities):
+        if is_store_availability(availability):
+            yield parse_store_stock(
+                ResponseStoreAvailability.model_validate(availability)
+            )
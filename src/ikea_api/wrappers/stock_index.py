@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping
+
+from ikea_api.wrappers import types
+from ikea_api.wrappers.parsers.stock import parse_stock
+
+
+class StockIndex:
+    """In-memory index of store stock by item code and store id.
+
+    Basket availability and restock queries are answered from the index,
+    without walking `Stock.get_stock()` responses again.
+    """
+
+    _stock: dict[tuple[str, str], types.StoreStock]
+    _qty_by_item: dict[str, dict[str, int]]
+
+    def __init__(self, stock: Iterable[types.StoreStock] = ()) -> None:
+        self._stock = {}
+        self._qty_by_item = {}
+        self.update(stock)
+
+    def __len__(self) -> int:
+        return len(self._stock)
+
+    def update(self, stock: Iterable[types.StoreStock]) -> None:
+        """Add or update stores. Stores that aren't in `stock` are kept."""
+        for store_stock in stock:
+            self._stock[store_stock.item_code, store_stock.store_id] = store_stock
+            stores = self._qty_by_item.setdefault(store_stock.item_code, {})
+            stores[store_stock.store_id] = store_stock.qty
+
+    def update_from_response(self, response: dict[str, Any]) -> None:
+        self.update(parse_stock(response))
+
+    def replace(self, item_code: str, stock: Iterable[types.StoreStock]) -> None:
+        """Set all stores of item. Stores that aren't in `stock` are removed."""
+        self.remove(item_code)
+        self.update(stock)
+
+    def remove(self, item_code: str) -> None:
+        for store_id in self._qty_by_item.pop(item_code, {}):
+            del self._stock[item_code, store_id]
+
+    def get_item_stock(self, item_code: str) -> list[types.StoreStock]:
+        return [self._stock[item_code, s] for s in self._qty_by_item.get(item_code, {})]
+
+    def get(self, item_code: str, store_id: str) -> types.StoreStock | None:
+        return self._stock.get((item_code, store_id))
+
+    def get_qty(self, item_code: str, store_id: str) -> int:
+        return self._qty_by_item.get(item_code, {}).get(store_id, 0)
+
+    def find_stores(self, items: Mapping[str, int]) -> list[str]:
+        """Get stores that have at least `qty` units of every item in `items`
+        (item code to quantity mapping).
+        """
+        if not items:
+            return []
+
+        qty_by_item: list[tuple[dict[str, int], int]] = []
+        for item_code, qty in items.items():
+            stores = self._qty_by_item.get(item_code)
+            if not stores:
+                return []
+            qty_by_item.append((stores, qty))
+
+        # Start with item that is in fewest stores to keep candidates few
+        qty_by_item.sort(key=lambda v: len(v[0]))
+        (stores, qty), *rest = qty_by_item
+        candidates = [store_id for store_id, q in stores.items() if q >= qty]
+        for stores, qty in rest:
+            if not candidates:
+                break
+            candidates = [c for c in candidates if stores.get(c, 0) >= qty]
+        return candidates
+
+    def next_restock(
+        self, item_code: str, store_id: str | None = None
+    ) -> types.Restock | None:
+        """Get earliest restock of item in store or, if `store_id` is None,
+        in any store.
+        """
+        if store_id is not None:
+            store_ids: Iterable[str] = (store_id,)
+        else:
+            store_ids = self._qty_by_item.get(item_code, {})
+
+        res: types.Restock | None = None
+        for id_ in store_ids:
+            store_stock = self._stock.get((item_code, id_))
+            if not store_stock or not store_stock.restocks:
+                continue
+            # Restocks are sorted by parser
+            restock = store_stock.restocks[0]
+            if res is None or restock.earliest_date < res.earliest_date:
+                res = restock
+        return res
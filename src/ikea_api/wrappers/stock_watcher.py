@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, cast
+
+from ikea_api.constants import Constants
+from ikea_api.endpoints.stock import Stock
+from ikea_api.exceptions import APIError, GraphQLError, WrongItemCodeError
+from ikea_api.executors.httpx import run_async as run_with_httpx
+from ikea_api.invalid_items import InvalidItemRegistry
+from ikea_api.utils import LazySemaphore
+from ikea_api.wrappers import types
+from ikea_api.wrappers.parsers.stock import parse_stock
+from ikea_api.wrappers.stock_index import StockIndex
+
+
+def _is_unknown_item_error(error: Any) -> bool:
+    # {"code": 404, "message": "Not found", "details": {"itemNo": "11111111", ...}}
+    if not isinstance(error, dict):
+        return False
+    error = cast(Dict[str, Any], error)
+    details = error.get("details")
+    return (
+        error.get("code") == 404 and isinstance(details, dict) and "itemNo" in details
+    )
+
+
+def _is_item_error(error: APIError) -> bool:
+    """Whether server reported some of requested item codes as invalid.
+    Other errors don't depend on item codes and are retried.
+    """
+    if isinstance(error, WrongItemCodeError):
+        return True
+    if isinstance(error, GraphQLError):
+        return bool(error.errors) and all(
+            _is_unknown_item_error(e) for e in error.errors
+        )
+    return False
+
+
+def _get_next_restock(store_stock: types.StoreStock | None) -> types.Restock | None:
+    if store_stock and store_stock.restocks:
+        return store_stock.restocks[0]
+
+
+@dataclass
+class _StockSchedule:
+    interval: float
+    next_poll_at: float = 0
+    polled: bool = False
+
+
+class StockWatcher:
+    """Polls stock of items and reports changes.
+
+    Items that are due are requested `batch_size` at a time. Poll interval
+    of item starts at `min_interval` and doubles after every poll without
+    changes, up to `max_interval`. Items that have changed or have from 1 to
+    `low_stock_qty` units in some store are polled every `min_interval`.
+
+    First poll of item only fills `index`, following polls report changes.
+    If store disappears from response, change with zero `qty` is reported.
+
+    If server reports unknown item codes, batch is split to find them.
+    These items are not polled anymore and are added to `invalid_items`.
+    Batches that fail for other reasons are retried after current interval.
+    """
+
+    min_interval: float
+    max_interval: float
+    low_stock_qty: int
+    batch_size: int
+    concurrency: int
+    index: StockIndex
+    _schedule: dict[str, _StockSchedule]
+    _semaphore: LazySemaphore
+
+    def __init__(
+        self,
+        constants: Constants,
+        item_codes: Iterable[str] = (),
+        *,
+        min_interval: float = 60,
+        max_interval: float = 60 * 60,
+        low_stock_qty: int = 5,
+        batch_size: int = 50,
+        concurrency: int = 5,
+        invalid_items: InvalidItemRegistry | None = None,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.low_stock_qty = low_stock_qty
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.index = StockIndex()
+        self._stock = Stock(constants, invalid_items=invalid_items)
+        self._schedule = {}
+        self._semaphore = LazySemaphore(concurrency)
+        self.add(item_codes)
+
+    def add(self, item_codes: Iterable[str]) -> None:
+        for item_code in item_codes:
+            self._schedule.setdefault(
+                item_code, _StockSchedule(interval=self.min_interval)
+            )
+
+    def remove(self, item_codes: Iterable[str]) -> None:
+        for item_code in item_codes:
+            self._schedule.pop(item_code, None)
+            self.index.remove(item_code)
+
+    def get_interval(self, item_code: str) -> float | None:
+        schedule = self._schedule.get(item_code)
+        return schedule.interval if schedule else None
+
+    async def poll(self) -> list[types.StockChange]:
+        """Request stock of items that are due. Return changes since previous poll."""
+        now = time.monotonic()
+        due = sorted(
+            (c for c, s in self._schedule.items() if s.next_poll_at <= now),
+            key=lambda c: self._schedule[c].next_poll_at,
+        )
+        chunks = [
+            due[start : start + self.batch_size]
+            for start in range(0, len(due), self.batch_size)
+        ]
+        results = await asyncio.gather(*(self._poll_chunk(c) for c in chunks))
+        return [change for changes in results for change in changes]
+
+    async def watch(self) -> AsyncIterator[types.StockChange]:
+        """Poll items when they are due and yield changes. Never stops."""
+        while True:
+            for change in await self.poll():
+                yield change
+            await asyncio.sleep(self._get_delay())
+
+    def _get_delay(self) -> float:
+        if not self._schedule:
+            return self.min_interval
+        next_poll_at = min(s.next_poll_at for s in self._schedule.values())
+        return max(next_poll_at - time.monotonic(), 0)
+
+    async def _poll_chunk(self, item_codes: list[str]) -> list[types.StockChange]:
+        item_codes, known_invalid = self._stock._split_invalid_item_codes(item_codes)
+        self.remove(known_invalid)
+        if not item_codes:
+            return []
+
+        response = await self._get_stocks(item_codes)
+        if isinstance(response, APIError):
+            return await self._poll_failed_chunk(item_codes, response)
+
+        now = time.monotonic()
+        stock_by_item: dict[str, list[types.StoreStock]] = {}
+        for store_stock in parse_stock(response):
+            stock_by_item.setdefault(store_stock.item_code, []).append(store_stock)
+
+        changes: list[types.StockChange] = []
+        for item_code in item_codes:
+            schedule = self._schedule.get(item_code)
+            if schedule is None:  # Removed while polling
+                continue
+
+            stock = stock_by_item.get(item_code, [])
+            item_changes = self._diff(item_code, stock) if schedule.polled else []
+            self.index.replace(item_code, stock)
+            changes.extend(item_changes)
+            self._reschedule(schedule, stock, changed=bool(item_changes), now=now)
+        return changes
+
+    async def _get_stocks(self, item_codes: list[str]) -> dict[str, Any] | APIError:
+        async with self._semaphore:
+            try:
+                return await run_with_httpx(self._stock.get_stocks(item_codes))
+            except APIError as exc:
+                return exc
+
+    async def _poll_failed_chunk(
+        self, item_codes: list[str], error: APIError
+    ) -> list[types.StockChange]:
+        if not _is_item_error(error):  # Retry after current interval
+            now = time.monotonic()
+            for item_code in item_codes:
+                schedule = self._schedule.get(item_code)
+                if schedule is not None:
+                    schedule.next_poll_at = now + schedule.interval
+            return []
+
+        if len(item_codes) == 1:
+            self._stock._add_invalid_item_codes(item_codes)
+            self.remove(item_codes)
+            return []
+
+        middle = len(item_codes) // 2
+        results = await asyncio.gather(
+            self._poll_chunk(item_codes[:middle]),
+            self._poll_chunk(item_codes[middle:]),
+        )
+        return [change for changes in results for change in changes]
+
+    def _diff(
+        self, item_code: str, stock: list[types.StoreStock]
+    ) -> list[types.StockChange]:
+        changes: list[types.StockChange] = []
+        store_ids = {s.store_id for s in stock}
+        for previous in self.index.get_item_stock(item_code):
+            if previous.store_id in store_ids:
+                continue
+            changes.append(
+                types.StockChange(
+                    item_code=item_code,
+                    store_id=previous.store_id,
+                    previous_qty=previous.qty,
+                    qty=0,
+                    previous_restock=_get_next_restock(previous),
+                    restock=None,
+                )
+            )
+
+        for store_stock in stock:
+            previous = self.index.get(item_code, store_stock.store_id)
+            previous_qty = previous.qty if previous else None
+            previous_restock = _get_next_restock(previous)
+            restock = _get_next_restock(store_stock)
+            if previous_qty == store_stock.qty and previous_restock == restock:
+                continue
+            changes.append(
+                types.StockChange(
+                    item_code=item_code,
+                    store_id=store_stock.store_id,
+                    previous_qty=previous_qty,
+                    qty=store_stock.qty,
+                    previous_restock=previous_restock,
+                    restock=restock,
+                )
+            )
+        return changes
+
+    def _reschedule(
+        self,
+        schedule: _StockSchedule,
+        stock: list[types.StoreStock],
+        *,
+        changed: bool,
+        now: float,
+    ) -> None:
+        is_low_stock = any(0 < s.qty <= self.low_stock_qty for s in stock)
+        if changed or is_low_stock:
+            schedule.interval = self.min_interval
+        else:
+            schedule.interval = min(schedule.interval * 2, self.max_interval)
+        schedule.next_poll_at = now + schedule.interval
+        schedule.polled = True
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, HttpUrl
 
@@ -43,6 +43,33 @@ class PipItem(BaseModel):
     category_url: Optional[HttpUrl] = None
 
 
+class Restock(BaseModel):
+    earliest_date: datetime.date
+    latest_date: datetime.date
+    qty: Optional[int] = None
+
+
+class StoreStock(BaseModel):
+    item_code: str
+    store_id: str
+    qty: int
+    probability: Optional[str] = None
+    restocks: List[Restock]
+
+
+class StockChange(BaseModel):
+    item_code: str
+    store_id: str
+    previous_qty: Optional[int] = None
+    qty: int
+    previous_restock: Optional[Restock] = None
+    restock: Optional[Restock] = None
+
+    @property
+    def qty_delta(self) -> int:
+        return self.qty - (self.previous_qty or 0)
+
+
 class UnavailableItem(BaseModel):
     item_code: str
     available_qty: int
@@ -76,6 +103,18 @@ class PurchaseInfo(StatusBannerOrder, CostsOrder):
     pass
 
 
+class PurchaseProduct(BaseModel):
+    item_code: str
+    name: str
+    description: Optional[str] = None
+    qty: int
+    direction: str
+    url: Optional[str] = None
+    image_url: Optional[str] = None
+    unit_price: Optional[str] = None
+    total_price: Optional[str] = None
+
+
 class PurchaseHistoryItem(BaseModel):
     id: str
     status: str
@@ -85,4 +124,30 @@ class PurchaseHistoryItem(BaseModel):
     store: str
 
 
+class CartTotals(BaseModel):
+    currency: str
+    total: float
+    discount: float
+    family_total: Optional[float] = None
+
+
+class CartDiff(BaseModel):
+    add: Dict[str, int]
+    update: Dict[str, int]
+    remove: List[str]
+
+
+class AddItemsChunkReport(BaseModel):
+    items: List[str]
+    cannot_add: List[str]
+    attempts: int
+    elapsed: float
+
+
+class AddItemsReport(BaseModel):
+    cannot_add: List[str]
+    chunks: List[AddItemsChunkReport]
+    elapsed: float
+
+
 CannotAddItems = List[str]
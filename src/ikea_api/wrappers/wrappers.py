@@ -1,34 +1,105 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List, Optional
+import contextlib
+import time
+from collections import Counter
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Container,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
+from ikea_api.abc import EndpointInfo
+from ikea_api.cache import TTLCache
+from ikea_api.combination_hints import CombinationHints
 from ikea_api.constants import Constants
-from ikea_api.endpoints.cart import Cart
+from ikea_api.endpoints.cart import Cart, CartMutation
+from ikea_api.endpoints.ingka_items import IngkaItems
 from ikea_api.endpoints.order_capture import (
     OrderCapture,
     convert_cart_to_checkout_items,
 )
+from ikea_api.endpoints.pip_item import PipItem
 from ikea_api.endpoints.purchases import Purchases
-from ikea_api.exceptions import GraphQLError
+from ikea_api.exceptions import (
+    APIError,
+    AuthError,
+    GraphQLError,
+    ItemFetchError,
+    NotSuccessError,
+    ParsingError,
+)
 from ikea_api.executors.httpx import run_async as run_with_httpx
 from ikea_api.executors.requests import run as run_with_requests
+from ikea_api.invalid_items import InvalidItemRegistry
+from ikea_api.token_manager import TokenPool
+from ikea_api.utils import parse_item_codes
 from ikea_api.wrappers import types
+from ikea_api.wrappers.child_items import (
+    ChildItemResolver,
+    get_ingka_items_skipping_invalid,
+)
+from ikea_api.wrappers.parsers.cart import parse_cart_items
+from ikea_api.wrappers.parsers.ingka_items import parse_ingka_items
 from ikea_api.wrappers.parsers.order_capture import parse_delivery_services
+from ikea_api.wrappers.parsers.pip_item import parse_pip_item
 from ikea_api.wrappers.parsers.purchases import (
-    parse_costs_order,
     parse_history,
-    parse_status_banner_order,
+    parse_product_list_order,
+    parse_purchase_info,
 )
 
+_T = TypeVar("_T")
+
 
 def get_purchase_history(purchases: Purchases) -> list[types.PurchaseHistoryItem]:
-    response = run_with_requests(purchases.history())
+    response = run_with_requests(purchases.history(profile="lite"))
+    return parse_history(purchases._const, response)
+
+
+async def get_purchase_history_async(
+    purchases: Purchases,
+) -> list[types.PurchaseHistoryItem]:
+    response = await run_with_httpx(purchases.history(profile="lite"))
     return parse_history(purchases._const, response)
 
 
+async def iter_purchase_history(
+    purchases: Purchases, *, page_size: int = 50, known_ids: Container[str] = ()
+) -> AsyncIterator[types.PurchaseHistoryItem]:
+    """Iterate over purchase history page by page, newest purchases first.
+
+    Stops at the first purchase which id is in `known_ids`,
+    so that syncs after the first one fetch only new purchases.
+    """
+    skip = 0
+    while True:
+        response = await run_with_httpx(
+            purchases.history(take=page_size, skip=skip, profile="lite")
+        )
+        items = parse_history(purchases._const, response)
+        for item in items:
+            if item.id in known_ids:
+                return
+            yield item
+
+        if len(items) < page_size:
+            return
+        skip += page_size
+
+
 def get_purchase_info(
     purchases: Purchases, *, order_number: str, email: str | None = None
 ) -> types.PurchaseInfo:
@@ -36,12 +107,95 @@ def get_purchase_info(
         order_number=order_number,
         email=email,
         queries=["StatusBannerOrder", "CostsOrder"],
+        profile="lite",
     )
     status_banner, costs = run_with_requests(endpoint)
-    return types.PurchaseInfo(
-        **parse_status_banner_order(status_banner).model_dump(),
-        **parse_costs_order(costs).model_dump(),
+    return parse_purchase_info(status_banner, costs)
+
+
+async def get_purchase_info_async(
+    purchases: Purchases, *, order_number: str, email: str | None = None
+) -> types.PurchaseInfo:
+    endpoint = purchases.order_info(
+        order_number=order_number,
+        email=email,
+        queries=["StatusBannerOrder", "CostsOrder"],
+        profile="lite",
+    )
+    status_banner, costs = await run_with_httpx(endpoint)
+    return parse_purchase_info(status_banner, costs)
+
+
+def get_purchases_info(
+    purchases: Purchases, order_numbers: list[str], *, chunk_size: int = 50
+) -> dict[str, types.PurchaseInfo | GraphQLError | ParsingError]:
+    """Get info for many orders in batches. Requires authorized token.
+
+    Orders that failed are mapped to GraphQLError with their errors,
+    orders with unexpected response format are mapped to ParsingError.
+    """
+    endpoint = purchases.bulk_order_info(
+        order_numbers, chunk_size=chunk_size, profile="lite"
     )
+    res: dict[str, types.PurchaseInfo | GraphQLError | ParsingError] = {}
+    for order_number, response in run_with_requests(endpoint).items():
+        if isinstance(response, GraphQLError):
+            res[order_number] = response
+            continue
+        try:
+            res[order_number] = parse_purchase_info(*response)
+        except ValidationError as exc:
+            res[order_number] = ParsingError(exc)
+    return res
+
+
+async def iter_purchase_products(
+    purchases: Purchases,
+    *,
+    order_number: str,
+    email: str | None = None,
+    page_size: int = 50,
+    skip_prices: bool = False,
+) -> AsyncIterator[types.PurchaseProduct]:
+    """Iterate over all products in order.
+
+    Products are fetched `page_size` at a time, next page is requested
+    while current one is being consumed.
+    """
+
+    def fetch(skip: int) -> asyncio.Future[list[dict[str, Any]]]:
+        endpoint = purchases.order_info(
+            order_number=order_number,
+            email=email,
+            queries=["ProductListOrder"],
+            skip_products=skip,
+            skip_product_prices=skip_prices,
+            take_products=page_size,
+        )
+        return asyncio.ensure_future(run_with_httpx(endpoint))
+
+    skip = 0
+    next_page: asyncio.Future[list[dict[str, Any]]] | None = fetch(skip)
+    try:
+        while next_page:
+            (response,) = await next_page
+            products = parse_product_list_order(response)
+
+            # Exchange orders are paginated separately in both directions
+            counts = Counter(p.direction for p in products)
+            if counts and max(counts.values()) >= page_size:
+                skip += page_size
+                next_page = fetch(skip)
+            else:
+                next_page = None
+
+            for product in products:
+                yield product
+    finally:
+        if next_page:
+            next_page.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await next_page
 
 
 class _ExtensionsData(BaseModel):
@@ -57,53 +211,258 @@ class _CartErrorRef(BaseModel):
     extensions: _Extensions
 
 
+def get_invalid_item_codes(exc: GraphQLError) -> list[str]:
+    res: list[str] = []
+    for error_dict in exc.errors:
+        error = _CartErrorRef.model_validate(error_dict)
+        if error.extensions.code != "INVALID_ITEM_NUMBER":
+            continue
+        if not error.extensions.data:
+            continue
+        res += error.extensions.data.itemNos
+    return res
+
+
+def _skip_known_invalid_items(
+    cart: Cart, items: dict[str, int]
+) -> tuple[dict[str, int], list[str]]:
+    _, invalid_item_codes = cart._split_invalid_item_codes(list(items))
+    pending_items = {k: v for k, v in items.items() if k not in invalid_item_codes}
+    return pending_items, invalid_item_codes
+
+
+def _drop_invalid_items(
+    cart: Cart,
+    exc: GraphQLError,
+    pending_items: dict[str, int],
+    cannot_add_items: list[str],
+) -> None:
+    """Move items that server reported as invalid from `pending_items`
+    to `cannot_add_items`. Reraise error if it isn't about invalid items.
+    """
+    invalid_item_codes = get_invalid_item_codes(exc)
+    if not invalid_item_codes:
+        raise exc
+    cart._add_invalid_item_codes(invalid_item_codes)
+    cannot_add_items += invalid_item_codes
+
+    for item_code in cannot_add_items:
+        pending_items.pop(item_code, None)
+
+
 def add_items_to_cart(cart: Cart, items: dict[str, int]) -> types.CannotAddItems:
     run_with_requests(cart.clear())
-    cannot_add_items: list[str] = []
-    pending_items = items.copy()
+    pending_items, cannot_add_items = _skip_known_invalid_items(cart, items)
 
     while pending_items:
         try:
             run_with_requests(cart.add_items(pending_items))
             break
         except GraphQLError as exc:
-            for error_dict in exc.errors:
-                error = _CartErrorRef.model_validate(error_dict)
-                if error.extensions.code != "INVALID_ITEM_NUMBER":
-                    continue
-                if not error.extensions.data:
-                    continue
-                cannot_add_items += error.extensions.data.itemNos
+            _drop_invalid_items(cart, exc, pending_items, cannot_add_items)
+
+    return cannot_add_items
 
-            for item_code in cannot_add_items:
-                pending_items.pop(item_code, None)
 
+async def add_items_to_cart_async(
+    cart: Cart, items: dict[str, int]
+) -> types.CannotAddItems:
+    await run_with_httpx(cart.clear())
+    _, cannot_add_items = await _run_skipping_invalid_items(cart, cart.add_items, items)
     return cannot_add_items
 
 
-async def get_delivery_services(
-    constants: Constants,
-    token: str,
+async def _run_skipping_invalid_items(
+    cart: Cart,
+    func: Callable[[dict[str, int]], EndpointInfo[_T]],
     items: dict[str, int],
-    zip_code: str,
-) -> types.GetDeliveryServicesResponse:
-    cart = Cart(constants, token=token)
-    order_capture = OrderCapture(constants, token=token)
+) -> tuple[_T | None, types.CannotAddItems]:
+    """Run cart endpoint, retrying without items that server reported as invalid.
+    Returns None instead of endpoint response if none of the items are valid.
+    """
+    pending_items, cannot_add_items = _skip_known_invalid_items(cart, items)
 
-    cannot_add = add_items_to_cart(cart, items)
-    cannot_add_all_items = not set(items.keys()) ^ set(cannot_add)
-    if cannot_add_all_items:
-        return types.GetDeliveryServicesResponse(
-            delivery_options=[], cannot_add=cannot_add
+    while pending_items:
+        try:
+            return await run_with_httpx(func(pending_items)), cannot_add_items
+        except GraphQLError as exc:
+            _drop_invalid_items(cart, exc, pending_items, cannot_add_items)
+
+    return None, cannot_add_items
+
+
+async def add_items_to_large_cart(
+    cart: Cart, items: dict[str, int], *, chunk_size: int = 100, clear: bool = True
+) -> types.AddItemsReport:
+    """Add many items to cart, `chunk_size` items per request.
+
+    Invalid items are retried within their chunk only, so chunks that
+    were added are never resent.
+    Returns items that can't be added and timings of every chunk.
+    """
+    started = time.perf_counter()
+    if clear:
+        await run_with_httpx(cart.clear())
+
+    report = types.AddItemsReport(cannot_add=[], chunks=[], elapsed=0)
+    item_codes = list(items)
+
+    for start in range(0, len(item_codes), chunk_size):
+        chunk = {code: items[code] for code in item_codes[start : start + chunk_size]}
+        chunk_started = time.perf_counter()
+        attempts = 0
+
+        def add_items(pending_items: dict[str, int]) -> EndpointInfo[list[Any]]:
+            nonlocal attempts
+            attempts += 1
+            return cart.mutate([CartMutation.add_items(pending_items)])
+
+        _, cannot_add = await _run_skipping_invalid_items(cart, add_items, chunk)
+        report.cannot_add += cannot_add
+        report.chunks.append(
+            types.AddItemsChunkReport(
+                items=list(chunk),
+                cannot_add=cannot_add,
+                attempts=attempts,
+                elapsed=time.perf_counter() - chunk_started,
+            )
+        )
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def get_cart_diff(current: dict[str, int], target: dict[str, int]) -> types.CartDiff:
+    diff = types.CartDiff(add={}, update={}, remove=[])
+    for item_code, qty in target.items():
+        if qty <= 0:
+            continue
+        if item_code not in current:
+            diff.add[item_code] = qty
+        elif current[item_code] != qty:
+            diff.update[item_code] = qty
+    diff.remove = [c for c in current if target.get(c, 0) <= 0]
+    return diff
+
+
+async def sync_cart(cart: Cart, items: dict[str, int]) -> types.CannotAddItems:
+    """Make cart contain exactly `items` with as few changes as possible.
+
+    Unlike `add_items_to_cart_async`, cart is not cleared:
+    only missing items are added, changed ones are updated
+    and the rest are removed.
+    """
+    current = parse_cart_items(await run_with_httpx(cart.show(profile="items")))
+    diff = get_cart_diff(current, items)
+
+    if diff.remove:
+        await run_with_httpx(cart.remove_items(diff.remove))
+    if diff.update:
+        await run_with_httpx(cart.update_items(diff.update))
+    if diff.add:
+        _, cannot_add_items = await _run_skipping_invalid_items(
+            cart, cart.add_items, diff.add
         )
+        return cannot_add_items
+    return []
 
-    cart_response = await run_with_httpx(cart.show())
+
+async def _prepare_checkout(
+    cart: Cart, order_capture: OrderCapture, items: dict[str, int]
+) -> tuple[str | None, types.CannotAddItems]:
+    response, cannot_add = await _run_skipping_invalid_items(
+        cart, cart.replace_items, items
+    )
+    if response is None:
+        return None, cannot_add
+
+    cart_response = await run_with_httpx(cart.show(profile="items"))
     checkout_items = convert_cart_to_checkout_items(cart_response)
     checkout_id = await run_with_httpx(order_capture.get_checkout(checkout_items))
+    return checkout_id, cannot_add
+
+
+ServiceAreaKey = Tuple[Constants, str]
+ServiceAreaCache = TTLCache[ServiceAreaKey, str]
+
+
+async def _resolve_service_area(
+    order_capture: OrderCapture,
+    checkout_id: str,
+    zip_code: str,
+    service_areas: ServiceAreaCache | None,
+) -> str:
     service_area_id = await run_with_httpx(
         order_capture.get_service_area(checkout_id, zip_code=zip_code)
     )
+    if service_areas is not None:
+        service_areas.set((order_capture._const, zip_code), service_area_id)
+    return service_area_id
+
+
+async def _get_delivery_options(
+    order_capture: OrderCapture,
+    checkout_id: str,
+    zip_code: str,
+    service_areas: ServiceAreaCache | None = None,
+) -> list[types.DeliveryService]:
+    """If service area of zip code is cached and fresh, service area request
+    is skipped. If it is stale, service area is resolved again while services
+    are requested with cached id speculatively.
+    """
+    zip_code = zip_code.strip()
+    cached = (
+        service_areas.lookup((order_capture._const, zip_code))
+        if service_areas is not None
+        else None
+    )
+
+    if cached is None:
+        service_area_id = await _resolve_service_area(
+            order_capture, checkout_id, zip_code, service_areas
+        )
+        return await _get_delivery_options_for_service_area(
+            order_capture, checkout_id, service_area_id
+        )
+
+    cached_id, is_fresh = cached
+    if is_fresh:
+        try:
+            return await _get_delivery_options_for_service_area(
+                order_capture, checkout_id, cached_id
+            )
+        except NotSuccessError as exc:
+            if service_areas is None or not _is_service_area_mismatch(exc):
+                raise
+            service_areas.invalidate((order_capture._const, zip_code))
+            return await _get_delivery_options(
+                order_capture, checkout_id, zip_code, service_areas
+            )
+
+    service_area_id, speculative_options = await asyncio.gather(
+        _resolve_service_area(order_capture, checkout_id, zip_code, service_areas),
+        _get_delivery_options_for_service_area(order_capture, checkout_id, cached_id),
+        return_exceptions=True,
+    )
+    if isinstance(service_area_id, BaseException):
+        raise service_area_id
+    if service_area_id == cached_id and not isinstance(
+        speculative_options, BaseException
+    ):
+        return speculative_options
+    return await _get_delivery_options_for_service_area(
+        order_capture, checkout_id, service_area_id
+    )
+
+
+def _is_service_area_mismatch(exc: NotSuccessError) -> bool:
+    # Checkout doesn't know cached service area id, it belongs to another one
+    return exc.response.status_code in (400, 404)
+
 
+async def _get_delivery_options_for_service_area(
+    order_capture: OrderCapture, checkout_id: str, service_area_id: str
+) -> list[types.DeliveryService]:
     home, collect = await asyncio.gather(
         run_with_httpx(
             order_capture.get_home_delivery_services(checkout_id, service_area_id),
@@ -113,11 +472,392 @@ async def get_delivery_services(
         ),
     )
 
-    parsed_data = parse_delivery_services(
-        constants=constants,
+    return parse_delivery_services(
+        constants=order_capture._const,
         home_response=home,
         collect_response=collect,
     )
+
+
+DeliveryServicesKey = Tuple[Constants, FrozenSet[Tuple[str, int]], str]
+DeliveryServicesCache = TTLCache[DeliveryServicesKey, types.GetDeliveryServicesResponse]
+
+
+def get_delivery_services_key(
+    constants: Constants, items: dict[str, int], zip_code: str
+) -> DeliveryServicesKey:
+    """Build cache key. Formatted and unformatted codes of the same item
+    give the same key.
+    """
+    return constants, frozenset(_normalize_items(items).items()), zip_code.strip()
+
+
+def _normalize_items(items: dict[str, int]) -> dict[str, int]:
+    normalized: Counter[str] = Counter()
+    for item_code, qty in items.items():
+        parsed = parse_item_codes(item_code)
+        normalized[parsed[0] if parsed else item_code] += qty
+    return dict(normalized)
+
+
+async def get_delivery_services(
+    constants: Constants,
+    token: str,
+    items: dict[str, int],
+    zip_code: str,
+    *,
+    invalid_items: InvalidItemRegistry | None = None,
+    cache: DeliveryServicesCache | None = None,
+    service_areas: ServiceAreaCache | None = None,
+    pool: TokenPool | None = None,
+) -> types.GetDeliveryServicesResponse:
+    """
+    :params cache: Cache of responses for the same items and zip code,
+        for example, `TTLCache(ttl=300)`. Stale responses are refreshed
+        before returning: refresh changes cart of `token` that caller owns.
+    :params service_areas: Cache of zip code service areas.
+        See `warm_up_service_areas()`.
+    :params pool: Token pool for cached responses. If set, they are fetched
+        with leased tokens instead of `token`, so stale responses are returned
+        right away and refreshed in background.
+    """
+    items = _normalize_items(items)
+    zip_code = zip_code.strip()
+
+    def fetch() -> Awaitable[types.GetDeliveryServicesResponse]:
+        return _get_delivery_services(
+            constants,
+            token,
+            items,
+            zip_code,
+            invalid_items=invalid_items,
+            service_areas=service_areas,
+        )
+
+    if cache is None:
+        return await fetch()
+    key: DeliveryServicesKey = (constants, frozenset(items.items()), zip_code)
+    if pool is None:
+        return await cache.get_or_fetch(key, fetch, revalidate_in_background=False)
+    return await cache.get_or_fetch(
+        key,
+        partial(
+            _get_delivery_services_with_lease,
+            constants,
+            pool,
+            items,
+            zip_code,
+            invalid_items=invalid_items,
+            service_areas=service_areas,
+        ),
+    )
+
+
+async def _get_delivery_services_with_lease(
+    constants: Constants,
+    pool: TokenPool,
+    items: dict[str, int],
+    zip_code: str,
+    *,
+    invalid_items: InvalidItemRegistry | None,
+    service_areas: ServiceAreaCache | None,
+) -> types.GetDeliveryServicesResponse:
+    async with pool.lease_manager() as manager:
+        token = await manager.get_token()
+        try:
+            return await _get_delivery_services(
+                constants,
+                token,
+                items,
+                zip_code,
+                invalid_items=invalid_items,
+                service_areas=service_areas,
+            )
+        except AuthError:
+            manager.invalidate()
+            raise
+
+
+async def _get_delivery_services(
+    constants: Constants,
+    token: str,
+    items: dict[str, int],
+    zip_code: str,
+    *,
+    invalid_items: InvalidItemRegistry | None,
+    service_areas: ServiceAreaCache | None,
+) -> types.GetDeliveryServicesResponse:
+    cart = Cart(constants, token=token, invalid_items=invalid_items)
+    order_capture = OrderCapture(constants, token=token)
+
+    checkout_id, cannot_add = await _prepare_checkout(cart, order_capture, items)
+    if checkout_id is None:
+        return types.GetDeliveryServicesResponse(
+            delivery_options=[], cannot_add=cannot_add
+        )
+
+    delivery_options = await _get_delivery_options(
+        order_capture, checkout_id, zip_code, service_areas
+    )
     return types.GetDeliveryServicesResponse(
-        delivery_options=parsed_data, cannot_add=cannot_add
+        delivery_options=delivery_options, cannot_add=cannot_add
+    )
+
+
+async def get_delivery_services_for_zip_codes(
+    constants: Constants,
+    token: str,
+    items: dict[str, int],
+    zip_codes: Iterable[str],
+    *,
+    concurrency: int = 5,
+    invalid_items: InvalidItemRegistry | None = None,
+    service_areas: ServiceAreaCache | None = None,
+) -> dict[str, types.GetDeliveryServicesResponse | APIError]:
+    """Get delivery services for the same items in many zip codes.
+
+    Cart and checkout are prepared once, then zip codes are quoted
+    concurrently, `concurrency` at a time. If zip code fails, its error
+    is returned instead of response.
+    """
+    cart = Cart(constants, token=token, invalid_items=invalid_items)
+    order_capture = OrderCapture(constants, token=token)
+    zip_codes = list(dict.fromkeys(zip_codes))
+
+    checkout_id, cannot_add = await _prepare_checkout(cart, order_capture, items)
+    if checkout_id is None:
+        return {
+            zip_code: types.GetDeliveryServicesResponse(
+                delivery_options=[], cannot_add=cannot_add
+            )
+            for zip_code in zip_codes
+        }
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get_response(
+        checkout_id: str, zip_code: str
+    ) -> types.GetDeliveryServicesResponse | APIError:
+        async with semaphore:
+            try:
+                delivery_options = await _get_delivery_options(
+                    order_capture, checkout_id, zip_code, service_areas
+                )
+            except APIError as exc:
+                return exc
+        return types.GetDeliveryServicesResponse(
+            delivery_options=delivery_options, cannot_add=cannot_add
+        )
+
+    responses = await asyncio.gather(*(get_response(checkout_id, z) for z in zip_codes))
+    return dict(zip(zip_codes, responses))
+
+
+async def get_delivery_services_for_baskets(
+    constants: Constants,
+    pool: TokenPool,
+    baskets: Iterable[tuple[dict[str, int], str]],
+    *,
+    invalid_items: InvalidItemRegistry | None = None,
+    cache: DeliveryServicesCache | None = None,
+    service_areas: ServiceAreaCache | None = None,
+) -> list[types.GetDeliveryServicesResponse | Exception]:
+    """Get delivery services for many (items, zip code) baskets.
+
+    Every basket is quoted with its own guest cart leased from `pool`,
+    so up to `pool.size` baskets are quoted concurrently. Token is held
+    until quote is done, including background refresh of stale `cache` entry.
+    If token is rejected, it is replaced on next lease.
+    Results are in the same order as baskets. If basket quote fails
+    (APIError, unexpected response or network error), the exception
+    is returned instead of response.
+    """
+
+    async def quote(
+        items: dict[str, int], zip_code: str
+    ) -> types.GetDeliveryServicesResponse | Exception:
+        items = _normalize_items(items)
+        zip_code = zip_code.strip()
+        fetch = partial(
+            _get_delivery_services_with_lease,
+            constants,
+            pool,
+            items,
+            zip_code,
+            invalid_items=invalid_items,
+            service_areas=service_areas,
+        )
+        try:
+            if cache is None:
+                return await fetch()
+            return await cache.get_or_fetch(
+                (constants, frozenset(items.items()), zip_code), fetch
+            )
+        except Exception as exc:
+            return exc
+
+    return await asyncio.gather(*(quote(i, z) for i, z in baskets))
+
+
+async def warm_up_service_areas(
+    constants: Constants,
+    token: str,
+    items: dict[str, int],
+    zip_codes: Iterable[str],
+    service_areas: ServiceAreaCache,
+    *,
+    concurrency: int = 5,
+) -> dict[str, str]:
+    """Resolve service areas of zip codes in advance, so that delivery wrappers
+    with `service_areas` cache skip this request. Items are needed to create
+    checkout, any available item will do.
+
+    Returns service area ids by zip code.
+    """
+    cart = Cart(constants, token=token)
+    order_capture = OrderCapture(constants, token=token)
+    zip_codes = list(dict.fromkeys(z.strip() for z in zip_codes))
+
+    checkout_id, _ = await _prepare_checkout(cart, order_capture, items)
+    if checkout_id is None:
+        return {}
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def resolve(checkout_id: str, zip_code: str) -> str:
+        async with semaphore:
+            return await _resolve_service_area(
+                order_capture, checkout_id, zip_code, service_areas
+            )
+
+    service_area_ids = await asyncio.gather(
+        *(resolve(checkout_id, z) for z in zip_codes)
+    )
+    return dict(zip(zip_codes, service_area_ids))
+
+
+def _merge_item(
+    ingka_item: types.IngkaItem, pip_item: types.PipItem
+) -> types.ParsedItem:
+    return types.ParsedItem(
+        is_combination=ingka_item.is_combination,
+        item_code=ingka_item.item_code,
+        name=ingka_item.name,
+        image_url=ingka_item.image_url,
+        weight=ingka_item.weight,
+        child_items=ingka_item.child_items,
+        price=pip_item.price,
+        url=pip_item.url,
+        category_name=pip_item.category_name,
+        category_url=pip_item.category_url,
+    )
+
+
+async def get_items(
+    constants: Constants,
+    item_codes: Iterable[str],
+    *,
+    chunk_size: int = 50,
+    concurrency: int = 10,
+    invalid_items: InvalidItemRegistry | None = None,
+    child_items: ChildItemResolver | None = None,
+    combination_hints: CombinationHints | None = None,
+) -> AsyncIterator[types.ParsedItem]:
+    """Get items from Ingka (`chunk_size` items per request) and PIP
+    concurrently, `concurrency` requests at a time.
+
+    Every item is yielded as soon as both its responses are parsed,
+    so order differs from `item_codes`. Items that weren't found are skipped.
+
+    :params child_items: Resolver that fills child items of combinations.
+    :params combination_hints: Known item types. PIP request for item without
+        hint waits for its Ingka batch to pick the right URL.
+    """
+    if invalid_items is None:
+        # Codes that Ingka rejected are skipped in retries and PIP requests
+        invalid_items = InvalidItemRegistry()
+    ingka_items = IngkaItems(
+        constants, invalid_items=invalid_items, combination_hints=combination_hints
     )
+    pip_item = PipItem(
+        constants, invalid_items=invalid_items, combination_hints=combination_hints
+    )
+    item_codes = list(dict.fromkeys(item_codes))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_ingka(chunk: list[str]) -> list[types.IngkaItem]:
+        async with semaphore:
+            try:
+                response, _ = await get_ingka_items_skipping_invalid(ingka_items, chunk)
+            except ItemFetchError:
+                return []
+        parsed_items = list(parse_ingka_items(constants, response))
+        if child_items:
+            return await child_items.resolve(parsed_items)
+        return parsed_items
+
+    async def get_ingka_is_combination(item_code: str) -> bool | None:
+        # Shield Ingka batch: other items wait for it too
+        for ingka_item in await asyncio.shield(ingka_tasks[item_code]):
+            if ingka_item.item_code == item_code:
+                return ingka_item.is_combination
+        return None
+
+    async def fetch_pip(item_code: str) -> types.PipItem | None:
+        # Stored hint may be stale: PipItem uses it, but falls back to other URL
+        is_combination = None
+        if combination_hints is None or combination_hints.get(item_code) is None:
+            # Resolve item type before taking semaphore, Ingka batch needs it
+            is_combination = await get_ingka_is_combination(item_code)
+            if is_combination is None:
+                return None
+
+        async with semaphore:
+            try:
+                response = await run_with_httpx(
+                    pip_item.get_item(item_code, is_combination)
+                )
+            except ItemFetchError:
+                return None
+        return parse_pip_item(response)
+
+    # Ingka batches go first: no item can be yielded before its batch is done
+    pending: set[asyncio.Future[Any]] = set()
+    ingka_tasks: dict[str, asyncio.Future[list[types.IngkaItem]]] = {}
+    for start in range(0, len(item_codes), chunk_size):
+        chunk = item_codes[start : start + chunk_size]
+        task = asyncio.ensure_future(fetch_ingka(chunk))
+        pending.add(task)
+        ingka_tasks.update(dict.fromkeys(chunk, task))
+    pip_tasks = {asyncio.ensure_future(fetch_pip(c)): c for c in item_codes}
+    pending.update(pip_tasks)
+
+    ingka_results: dict[str, types.IngkaItem] = {}
+    pip_results: dict[str, types.PipItem | None] = {}
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            ready: list[str] = []
+            for task in done:
+                if task in pip_tasks:
+                    item_code = pip_tasks[task]
+                    pip_results[item_code] = task.result()
+                    if item_code in ingka_results:
+                        ready.append(item_code)
+                    continue
+
+                for ingka_item in task.result():
+                    ingka_results[ingka_item.item_code] = ingka_item
+                    if ingka_item.item_code in pip_results:
+                        ready.append(ingka_item.item_code)
+
+            for item_code in ready:
+                pip_result = pip_results[item_code]
+                if pip_result is not None:
+                    yield _merge_item(ingka_results[item_code], pip_result)
+    finally:
+        for task in pending:
+            task.cancel()
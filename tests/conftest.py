@@ -46,6 +46,8 @@ class TestData:
     purchases_status_banner = get_data_file("purchases/status_banner.json")
     purchases_costs = get_data_file("purchases/costs.json")
     purchases_history = get_data_file("purchases/history.json")
+    purchases_product_list = get_data_file("purchases/product_list.json")
+    stock = get_data_file("stock/default.json")
 
 
 @pytest.fixture(scope="session")
@@ -72,7 +74,7 @@ class MockResponseInfo(ResponseInfo):
 
     @property
     def is_success(self) -> bool:
-        return True
+        return self.status_code < 400
 
 
 class EndpointTester:
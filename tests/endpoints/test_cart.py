@@ -1,11 +1,22 @@
-from typing import Any, Callable
+from __future__ import annotations
+
+from typing import Any, Callable, Literal
 
 import pytest
 
-from ikea_api.abc import EndpointInfo
+from ikea_api.abc import EndpointInfo, get_endpoint_name
 from ikea_api.constants import Constants
-from ikea_api.endpoints.cart import Cart, Mutations, Queries, convert_items
-from tests.conftest import EndpointTester
+from ikea_api.endpoints.cart import (
+    Cart,
+    CartMutation,
+    Fragments,
+    Mutations,
+    Queries,
+    build_mutation,
+    convert_items,
+    get_fragments,
+)
+from tests.conftest import EndpointTester, MockResponseInfo
 
 in_items = {"11111111": 1, "22222222": 2}
 out_items = [
@@ -86,3 +97,124 @@ def test_cart_remove_items(cart: Cart):
 def test_cart_set_coupon(cart: Cart):
     code = "11"
     assert_req_called_with(cart.set_coupon(code), Mutations.set_coupon, code=code)
+
+
+def test_build_mutation():
+    query, variables = build_mutation(
+        [
+            CartMutation.clear_items(),
+            CartMutation.add_items(in_items),
+            CartMutation.remove_items(["11111111"]),
+        ]
+    )
+    assert query.startswith(
+        "mutation Batch($languageCode: String $items1: [AddItemInput!]! "
+        + "$itemNos2: [ID!]!) { "
+        + "m0: clearItems(languageCode: $languageCode) { ...CartProps } "
+        + "m1: addItems(items: $items1, languageCode: $languageCode) "
+        + "{ quantity context { userId isAnonymous retailId } } "
+        + "m2: removeItems(itemNos: $itemNos2, languageCode: $languageCode) "
+        + "{ ...CartProps } }"
+    )
+    assert query.endswith(Fragments.cart_props)
+    assert variables == {"items1": out_items, "itemNos2": ["11111111"]}
+
+
+def test_build_mutation_no_fragments():
+    query, variables = build_mutation([CartMutation("clearItems", selection="id")])
+    assert query == (
+        "mutation Batch($languageCode: String) { "
+        + "m0: clearItems(languageCode: $languageCode) { id } }"
+    )
+    assert variables == {}
+
+
+@pytest.mark.parametrize(
+    ("mutation", "field", "arguments"),
+    (
+        (CartMutation.update_items(in_items), "updateItems", {"items": out_items}),
+        (CartMutation.copy_items("1"), "copyItems", {"sourceUserId": "1"}),
+        (CartMutation.set_coupon("1"), "setCoupon", {"code": "1"}),
+        (CartMutation.clear_coupon(), "clearCoupon", {}),
+    ),
+)
+def test_cart_mutation(mutation: CartMutation, field: str, arguments: Any):
+    assert mutation.field == field
+    assert {k: v for k, (_, v) in mutation.arguments.items()} == arguments
+
+
+def test_cart_mutate(cart: Cart):
+    mutations = [CartMutation.clear_items(), CartMutation.set_coupon("1")]
+    t = EndpointTester(cart.mutate(mutations))
+    req = t.prepare()
+    query, variables = build_mutation(mutations)
+    assert req.json == {
+        "query": query,
+        "variables": {"languageCode": cart._const.language, **variables},
+    }
+    res = t.parse(MockResponseInfo(json_={"data": {"m0": "one", "m1": "two"}}))
+    assert res == ["one", "two"]
+
+
+def test_cart_replace_items(cart: Cart):
+    t = EndpointTester(cart.replace_items(in_items))
+    req = t.prepare()
+    assert "m0: clearItems" in req.json["query"]
+    assert "m1: addItems" in req.json["query"]
+    assert req.json["variables"]["items1"] == out_items
+
+    res = t.parse(MockResponseInfo(json_={"data": {"m0": {}, "m1": {"quantity": 1}}}))
+    assert res == [{}, {"quantity": 1}]
+
+
+@pytest.mark.parametrize(
+    ("get_endpoint", "name"),
+    (
+        (lambda cart: cart.show(), "Cart.show"),
+        (lambda cart: cart.add_items(in_items), "Cart.add_items"),
+        (lambda cart: cart.replace_items(in_items), "Cart.replace_items"),
+        (lambda cart: cart.mutate([]), "Cart.mutate"),
+    ),
+)
+def test_cart_endpoint_name(
+    cart: Cart, get_endpoint: Callable[[Cart], EndpointInfo[Any]], name: str
+):
+    assert get_endpoint_name(get_endpoint(cart)) == name
+
+
+def test_cart_mutation_add_items_selection():
+    # addItems doesn't return cart, so cart fragments can't be selected
+    selection = CartMutation.add_items(in_items).selection
+    assert selection == "quantity context { userId isAnonymous retailId }"
+    assert get_fragments([selection]) == ""
+
+
+@pytest.mark.parametrize(
+    ("profile", "query"),
+    (
+        ("full", Queries.cart),
+        ("items", Queries.cart_items),
+        ("totals", Queries.cart_totals),
+    ),
+)
+def test_cart_show_profile(
+    cart: Cart, profile: Literal["full", "items", "totals"], query: str
+):
+    assert_req_called_with(cart.show(profile), query)
+
+
+@pytest.mark.parametrize(
+    ("selections", "expected"),
+    (
+        ([], ""),
+        (["checksum"], ""),
+        (["checksum", "...CartProps"], Fragments.cart_props),
+    ),
+)
+def test_get_fragments(selections: list[str], expected: str):
+    assert get_fragments(selections) == expected
+
+
+def test_queries_minified():
+    assert "  " not in Queries.cart
+    assert "\n" not in Mutations.add_items
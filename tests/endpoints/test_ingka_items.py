@@ -3,8 +3,11 @@ from typing import Any
 import pytest
 
 from ikea_api import ItemFetchError
+from ikea_api.combination_hints import CombinationHints
 from ikea_api.constants import Constants
 from ikea_api.endpoints.ingka_items import IngkaItems
+from ikea_api.executors.requests import run
+from ikea_api.invalid_items import InvalidItemRegistry
 from tests.conftest import EndpointTester, MockResponseInfo
 
 
@@ -54,3 +57,41 @@ def test_ingka_items_raises_with_item_code(constants: Constants):
     t = EndpointTester(IngkaItems(constants).get_items([]))
     with pytest.raises(ItemFetchError):
         t.parse(MockResponseInfo(json_=v))
+
+
+def test_ingka_items_skips_known_invalid(constants: Constants):
+    registry = InvalidItemRegistry()
+    registry.add(constants.country, ["11111111"])
+    api = IngkaItems(constants, invalid_items=registry)
+
+    t = EndpointTester(api.get_items(["11111111", "22222222"]))
+    assert t.prepare().params == {"itemNos": ["22222222"]}
+
+    assert run(api.get_items(["11111111"])) == {"data": []}
+
+
+def test_ingka_items_records_invalid(constants: Constants):
+    registry = InvalidItemRegistry()
+    v = {"error": {"details": [{"value": {"keys": ["11111111"]}}]}}
+    t = EndpointTester(
+        IngkaItems(constants, invalid_items=registry).get_items(["11111111"])
+    )
+    with pytest.raises(ItemFetchError):
+        t.parse(MockResponseInfo(json_=v))
+    assert registry.is_invalid(constants.country, "11111111")
+
+
+def test_ingka_items_records_combination_hints(constants: Constants):
+    hints = CombinationHints()
+    v = {
+        "data": [
+            {"itemKey": {"itemNo": "11111111", "itemType": "ART"}},
+            {"itemKey": {"itemNo": "22222222", "itemType": "SPR"}},
+        ]
+    }
+    t = EndpointTester(
+        IngkaItems(constants, combination_hints=hints).get_items(["11111111"])
+    )
+    assert t.parse(MockResponseInfo(json_=v)) == v
+    assert hints.get("11111111") is False
+    assert hints.get("22222222") is True
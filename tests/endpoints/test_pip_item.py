@@ -1,8 +1,10 @@
 import pytest
 
+from ikea_api.combination_hints import CombinationHints
 from ikea_api.constants import Constants
 from ikea_api.endpoints.pip_item import PipItem, build_url
-from ikea_api.exceptions import APIError, ItemFetchError
+from ikea_api.exceptions import APIError, ItemFetchError, KnownInvalidItemError
+from ikea_api.invalid_items import InvalidItemRegistry
 from tests.conftest import EndpointTester, MockResponseInfo
 
 
@@ -61,3 +63,92 @@ def test_pip_item_retry_not_exists(pip_item: PipItem):
     t.parse(response)
     with pytest.raises(ItemFetchError):
         t.parse(response)
+
+
+def test_pip_item_no_retry_not_recorded_invalid(constants: Constants):
+    registry = InvalidItemRegistry()
+    pip_item = PipItem(constants, invalid_items=registry)
+    t = EndpointTester(pip_item.get_item("11111111", False))
+    t.prepare()
+
+    with pytest.raises(ItemFetchError):
+        t.parse(MockResponseInfo(status_code=404))
+    assert not registry.is_invalid(constants.country, "11111111")
+
+
+def test_pip_item_explicit_flag_ignores_hint(constants: Constants):
+    hints = CombinationHints()
+    hints.set("11111111", True)
+    t = EndpointTester(
+        PipItem(constants, combination_hints=hints).get_item("11111111", False)
+    )
+
+    assert t.prepare().url == build_url("11111111", False)
+    with pytest.raises(ItemFetchError):
+        t.parse(MockResponseInfo(status_code=404))
+    assert hints.get("11111111") is True
+
+
+def test_pip_item_records_invalid(constants: Constants):
+    registry = InvalidItemRegistry()
+    pip_item = PipItem(constants, invalid_items=registry)
+    t = EndpointTester(pip_item.get_item("11111111"))
+    t.prepare()
+
+    response = MockResponseInfo(status_code=404)
+    t.parse(response)
+    with pytest.raises(ItemFetchError):
+        t.parse(response)
+
+    with pytest.raises(KnownInvalidItemError):
+        EndpointTester(pip_item.get_item("11111111"))
+
+
+def test_pip_item_uses_combination_hint(constants: Constants):
+    hints = CombinationHints()
+    hints.set("11111111", False)
+    t = EndpointTester(PipItem(constants, combination_hints=hints).get_item("11111111"))
+
+    assert t.prepare().url == build_url("11111111", False)
+    assert t.parse(MockResponseInfo(json_="ok")) == "ok"
+
+
+def test_pip_item_retries_wrong_combination_hint(constants: Constants):
+    hints = CombinationHints()
+    hints.set("11111111", False)
+    t = EndpointTester(PipItem(constants, combination_hints=hints).get_item("11111111"))
+    t.prepare()
+
+    t.parse(MockResponseInfo(status_code=404))
+    assert t.parse(MockResponseInfo(json_="ok")) == "ok"
+    assert hints.get("11111111") is True
+
+
+def test_pip_item_drops_stale_combination_hint(constants: Constants):
+    hints = CombinationHints()
+    hints.set("11111111", False)
+    registry = InvalidItemRegistry()
+    pip_item = PipItem(constants, invalid_items=registry, combination_hints=hints)
+    t = EndpointTester(pip_item.get_item("11111111"))
+    t.prepare()
+
+    response = MockResponseInfo(status_code=404)
+    t.parse(response)
+    with pytest.raises(ItemFetchError):
+        t.parse(response)
+    assert hints.get("11111111") is None
+    assert registry.is_invalid(constants.country, "11111111")
+
+
+def test_pip_item_records_combination_hint(constants: Constants):
+    hints = CombinationHints()
+    pip_item = PipItem(constants, combination_hints=hints)
+    t = EndpointTester(pip_item.get_item("11111111"))
+    t.prepare()
+
+    t.parse(MockResponseInfo(status_code=404))
+    t.parse(MockResponseInfo(json_="ok"))
+    assert hints.get("11111111") is False
+
+    t = EndpointTester(pip_item.get_item("11111111"))
+    assert t.prepare().url == build_url("11111111", False)
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
+from typing import Any
+
 import pytest
 
 from ikea_api.constants import Constants
 from ikea_api.endpoints.purchases import Purchases, Queries, build_payload
-from tests.conftest import EndpointTester
+from ikea_api.exceptions import GraphQLError, ProcessingError
+from tests.conftest import EndpointTester, MockResponseInfo
 
 
 def test_build_payload():
@@ -28,6 +33,29 @@ def test_history(purchases: Purchases):
     t.assert_json_returned()
 
 
+def test_history_lite(purchases: Purchases):
+    req = EndpointTester(purchases.history(profile="lite")).prepare()
+    assert req.json["query"] == Queries.history_lite
+    assert "formattedShortDate" not in req.json["query"]
+    assert "formattedLongDateTime" in req.json["query"]
+
+
+def test_order_info_lite(purchases: Purchases):
+    t = EndpointTester(
+        purchases.order_info(
+            order_number="1",
+            queries=["StatusBannerOrder", "CostsOrder", "ProductListOrder"],
+            profile="lite",
+        )
+    )
+    req = t.prepare()
+    assert [c["query"] for c in req.json] == [
+        Queries.status_banner_order_lite,
+        Queries.costs_order_lite,
+        Queries.product_list_order,
+    ]
+
+
 def test_order_info_with_email(purchases: Purchases):
     email = "mail@example.com"
 
@@ -53,3 +81,67 @@ def test_order_info_no_email(purchases: Purchases):
     assert order_number in req.headers["Referer"]
 
     t.assert_json_returned()
+
+
+def test_bulk_order_info(purchases: Purchases):
+    t = EndpointTester(purchases.bulk_order_info(["1", "2", "3", "1"], chunk_size=2))
+
+    req = t.prepare()
+    assert req.headers
+    assert req.headers["Referer"].endswith("/purchases/")
+    assert [c["variables"]["orderNumber"] for c in req.json] == ["1", "1", "2", "2"]
+    assert [c["operationName"] for c in req.json] == [
+        "StatusBannerOrder",
+        "CostsOrder",
+    ] * 2
+    error = {"message": "not found"}
+    t.parse(
+        MockResponseInfo(
+            json_=[{"data": "1a"}, {"data": "1b"}, {"errors": [error]}, {"data": "2b"}]
+        )
+    )
+
+    req = t.prepare()
+    assert [c["variables"]["orderNumber"] for c in req.json] == ["3", "3"]
+    res = t.parse(MockResponseInfo(json_=[{"data": "3a"}, {"data": "3b"}]))
+
+    assert res["1"] == [{"data": "1a"}, {"data": "1b"}]
+    assert isinstance(res["2"], GraphQLError)
+    assert res["2"].errors == [error]
+    assert res["3"] == [{"data": "3a"}, {"data": "3b"}]
+
+
+@pytest.mark.parametrize(
+    ("response", "exc_type"),
+    (({"errors": ["myerror"]}, GraphQLError), ({}, ProcessingError)),
+)
+def test_bulk_order_info_not_list(
+    purchases: Purchases, response: Any, exc_type: type[Exception]
+):
+    t = EndpointTester(purchases.bulk_order_info(["1"]))
+    with pytest.raises(exc_type):
+        t.parse(MockResponseInfo(json_=response))
+
+
+def test_bulk_order_info_duplicate_queries(purchases: Purchases):
+    t = EndpointTester(
+        purchases.bulk_order_info(
+            ["1", "2"], queries=["CostsOrder", "StatusBannerOrder", "CostsOrder"]
+        )
+    )
+
+    req = t.prepare()
+    assert len(req.json) == 4
+    res = t.parse(
+        MockResponseInfo(
+            json_=[{"data": "1a"}, {"data": "1b"}, {"data": "2a"}, {"data": "2b"}]
+        )
+    )
+    assert res["1"] == [{"data": "1a"}, {"data": "1b"}]
+    assert res["2"] == [{"data": "2a"}, {"data": "2b"}]
+
+
+def test_bulk_order_info_length_mismatch(purchases: Purchases):
+    t = EndpointTester(purchases.bulk_order_info(["1", "2"]))
+    with pytest.raises(ProcessingError, match="Expected 4 responses, got 3"):
+        t.parse(MockResponseInfo(json_=[{"data": "1a"}, {"data": "1b"}, {}]))
@@ -2,7 +2,8 @@ import pytest
 
 from ikea_api.constants import Constants
 from ikea_api.endpoints.rotera_item import RoteraItem, build_url
-from ikea_api.exceptions import APIError
+from ikea_api.exceptions import APIError, KnownInvalidItemError
+from ikea_api.invalid_items import InvalidItemRegistry
 from tests.conftest import EndpointTester, MockResponseInfo
 
 
@@ -40,3 +41,16 @@ def test_rotera_item_exists(rotera_item: RoteraItem):
     t.prepare()
 
     assert t.parse(MockResponseInfo(json_="ok")) == "ok"
+
+
+def test_rotera_item_records_invalid(constants: Constants):
+    registry = InvalidItemRegistry()
+    rotera_item = RoteraItem(constants, invalid_items=registry)
+    t = EndpointTester(rotera_item.get_item("11111111"))
+    t.prepare()
+
+    with pytest.raises(APIError):
+        t.parse(MockResponseInfo(status_code=404))
+
+    with pytest.raises(KnownInvalidItemError):
+        EndpointTester(rotera_item.get_item("11111111"))
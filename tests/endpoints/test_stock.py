@@ -16,3 +16,12 @@ def test_stock_parse(constants: Constants):
     item_code = "11111111"
     t = EndpointTester(Stock(constants).get_stock(item_code))
     assert t.parse(MockResponseInfo(json_="ok")) == "ok"
+
+
+def test_stocks_prepare(constants: Constants):
+    item_codes = ["11111111", "22222222"]
+    t = EndpointTester(Stock(constants).get_stocks(item_codes))
+    req = t.prepare()
+
+    assert req.params
+    assert req.params["itemNos"] == item_codes
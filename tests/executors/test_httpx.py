@@ -31,6 +31,8 @@ def test_httpx_response_info():
     assert info.status_code == response.status_code
     assert info.text == response.text
     assert info.json == response.json()
+    assert info.json_decode_time is not None
+    assert info.content_length == len(response.content)
     assert info.is_success == response.is_success
 
 
@@ -1,17 +1,29 @@
+from __future__ import annotations
+
 from types import SimpleNamespace
 from typing import Any
 
+import pytest
+
 from ikea_api.abc import (
     AsyncExecutor,
     BaseAPI,
     Endpoint,
     EndpointInfo,
+    EndpointTags,
+    ExecutorHooks,
+    Reauthenticator,
     RequestInfo,
     ResponseInfo,
     SessionInfo,
     SyncExecutor,
     endpoint,
+    get_endpoint_name,
+    named_endpoint,
+    set_executor_hooks,
 )
+from ikea_api.error_handlers import handle_401
+from ikea_api.exceptions import AuthError
 from tests.conftest import EndpointTester, ExecutorContext, MockResponseInfo
 
 
@@ -57,6 +69,30 @@ async def test_async_executor(executor_context: ExecutorContext):
     executor_context.handler.assert_called_with(executor_context.response)
 
 
+@endpoint()
+def no_requests_endpoint() -> Endpoint[str]:
+    return "cached"
+    yield  # pragma: no cover
+
+
+def test_sync_executor_no_requests():
+    class MyExecutor(SyncExecutor):
+        @staticmethod
+        def request(request: RequestInfo) -> ResponseInfo:  # pragma: no cover
+            raise NotImplementedError
+
+    assert MyExecutor.run(no_requests_endpoint()) == "cached"
+
+
+async def test_async_executor_no_requests():
+    class MyExecutor(AsyncExecutor):
+        @staticmethod
+        async def request(request: RequestInfo) -> ResponseInfo:  # pragma: no cover
+            raise NotImplementedError
+
+    assert await MyExecutor.run(no_requests_endpoint()) == "cached"
+
+
 def test_error_handlers():
     def handle_no_anotherthing(response: ResponseInfo) -> None:
         try:
@@ -96,3 +132,222 @@ def test_base_api_request_info():
         data=None,
         json=None,
     )
+
+
+class ReauthAPI(BaseAPI):
+    def __init__(self) -> None:
+        self.token = "old"
+        self.set_tokens: list[str] = []
+        super().__init__()
+
+    def _get_session_info(self) -> SessionInfo:
+        return SessionInfo("", {"Authorization": self.token})
+
+    def _get_reauthenticator(self) -> Reauthenticator:
+        return Reauthenticator(get_token=self.get_token, set_token=self.set_token)
+
+    def set_token(self, token: str) -> SessionInfo:
+        self.set_tokens.append(token)
+        self.token = token
+        self._session_info = self._get_session_info()
+        return self._session_info
+
+    @endpoint()
+    def get_token(self) -> Endpoint[str]:
+        response = yield self._RequestInfo("POST", "/token")
+        return response.json
+
+    @endpoint(handlers=[handle_401])
+    def get_something(self) -> Endpoint[list[str]]:
+        response1 = yield self._RequestInfo("GET", "/one")
+        response2 = yield self._RequestInfo("GET", "/two")
+        return [response1.json, response2.json]
+
+
+def reauth_response(request: RequestInfo, valid_tokens: set[str]) -> MockResponseInfo:
+    if request.url == "/token":
+        return MockResponseInfo(json_="new")
+    if request.session_info.headers["Authorization"] not in valid_tokens:
+        return MockResponseInfo(status_code=401)
+    return MockResponseInfo(json_=request.url)
+
+
+@endpoint()
+def no_api_endpoint() -> Endpoint[None]:  # pragma: no cover
+    yield RequestInfo(SessionInfo("", {}), "GET", "", {}, {})
+
+
+def test_endpoint_decorator_reauthenticator():
+    assert ReauthAPI().get_something().reauthenticator is not None
+    assert no_api_endpoint().reauthenticator is None
+
+
+def test_sync_executor_reauthenticates():
+    api = ReauthAPI()
+    requests: list[RequestInfo] = []
+
+    class MyExecutor(SyncExecutor):
+        @staticmethod
+        def request(request: RequestInfo):
+            requests.append(request)
+            return reauth_response(request, {"new"})
+
+    assert MyExecutor.run(api.get_something()) == ["/one", "/two"]
+    assert api.set_tokens == ["new"]
+    assert [r.url for r in requests] == ["/one", "/token", "/one", "/two"]
+
+
+async def test_async_executor_reauthenticates():
+    api = ReauthAPI()
+    requests: list[RequestInfo] = []
+
+    class MyExecutor(AsyncExecutor):
+        @staticmethod
+        async def request(request: RequestInfo):
+            requests.append(request)
+            return reauth_response(request, {"new"})
+
+    assert await MyExecutor.run(api.get_something()) == ["/one", "/two"]
+    assert api.set_tokens == ["new"]
+    assert [r.url for r in requests] == ["/one", "/token", "/one", "/two"]
+
+
+def test_executor_reauthenticates_once():
+    api = ReauthAPI()
+
+    class MyExecutor(SyncExecutor):
+        @staticmethod
+        def request(request: RequestInfo):
+            return reauth_response(request, set())
+
+    with pytest.raises(AuthError):
+        MyExecutor.run(api.get_something())
+    assert api.set_tokens == ["new"]
+
+
+class RecordingHooks(ExecutorHooks):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, EndpointTags]] = []
+        self.errors: list[BaseException | None] = []
+
+    def on_request_start(self, tags: EndpointTags, request: RequestInfo) -> None:
+        self.events.append(("request_start", tags))
+
+    def on_request_end(
+        self, tags: EndpointTags, response: ResponseInfo, duration: float
+    ) -> None:
+        assert duration >= 0
+        self.events.append(("request_end", tags))
+
+    def on_handlers_end(self, tags: EndpointTags, duration: float) -> None:
+        self.events.append(("handlers_end", tags))
+
+    def on_json_decode(self, tags: EndpointTags, duration: float) -> None:
+        self.events.append(("json_decode", tags))
+
+    def on_endpoint_end(
+        self, tags: EndpointTags, duration: float, error: BaseException | None
+    ) -> None:
+        self.events.append(("endpoint_end", tags))
+        self.errors.append(error)
+
+
+@pytest.fixture
+def hooks():
+    hooks = RecordingHooks()
+    set_executor_hooks(hooks)
+    yield hooks
+    set_executor_hooks(None)
+
+
+def test_get_endpoint_name():
+    assert get_endpoint_name(ReauthAPI().get_token()) == "ReauthAPI.get_token"
+
+
+def test_named_endpoint():
+    class API(ReauthAPI):
+        @named_endpoint
+        def get_token_alias(self) -> EndpointInfo[str]:
+            return self.get_token()
+
+    info = API().get_token_alias()
+    assert info.func.func.__name__ == "get_token"
+    assert get_endpoint_name(info) == "test_named_endpoint.<locals>.API.get_token_alias"
+
+
+async def test_async_executor_hooks_reauthenticated(hooks: RecordingHooks):
+    class MyExecutor(AsyncExecutor):
+        @staticmethod
+        async def request(request: RequestInfo):
+            response = reauth_response(request, {"new"})
+            response.json_decode_time = 0.1
+            return response
+
+    await MyExecutor.run(ReauthAPI().get_something())
+
+    # First 401 response is reported before request is replayed
+    assert [e for e, _ in hooks.events][:3] == [
+        "request_start",
+        "request_end",
+        "json_decode",
+    ]
+
+
+def test_sync_executor_hooks(executor_context: ExecutorContext, hooks: RecordingHooks):
+    class MyExecutor(SyncExecutor):
+        @staticmethod
+        def request(request: RequestInfo):
+            response = MockResponseInfo(json_={"ok": "ok"})
+            response.json_decode_time = 0.1
+            return response
+
+    MyExecutor.run(executor_context.func())
+
+    request_events = ["request_start", "request_end", "handlers_end", "json_decode"]
+    assert [e for e, _ in hooks.events] == request_events * 2 + ["endpoint_end"]
+    tags = EndpointTags(
+        endpoint=get_endpoint_name(executor_context.func()), host="example.com"
+    )
+    assert all(t == tags for _, t in hooks.events)
+    assert hooks.errors == [None]
+
+
+async def test_async_executor_hooks_error(hooks: RecordingHooks):
+    class MyExecutor(AsyncExecutor):
+        @staticmethod
+        async def request(request: RequestInfo):
+            return reauth_response(request, set())
+
+    with pytest.raises(AuthError):
+        await MyExecutor.run(ReauthAPI().get_something())
+
+    assert [e for e, _ in hooks.events] == [
+        "request_start",
+        "request_end",
+        "request_start",
+        "request_end",
+        "handlers_end",
+        "endpoint_end",
+        "request_start",
+        "request_end",
+        "handlers_end",
+        "endpoint_end",
+    ]
+    assert hooks.events[5][1].endpoint == "ReauthAPI.get_token"
+    assert hooks.events[-1][1].endpoint == "ReauthAPI.get_something"
+    assert hooks.errors[0] is None
+    assert isinstance(hooks.errors[1], AuthError)
+
+
+def test_sync_executor_no_hooks(executor_context: ExecutorContext):
+    hooks = RecordingHooks()
+    set_executor_hooks(hooks)
+    set_executor_hooks(None)
+
+    class MyExecutor(SyncExecutor):
+        @staticmethod
+        def request(request: RequestInfo):
+            return executor_context.response
+
+    MyExecutor.run(executor_context.func())
+    assert hooks.events == []
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from ikea_api.abc import Endpoint, RequestInfo, SessionInfo, SyncExecutor, endpoint
+from ikea_api.base_ikea_api import BaseAuthIkeaAPI, BaseGraphQLAPI
+from ikea_api.constants import Constants
+from ikea_api.endpoints.auth import Auth
+from ikea_api.error_handlers import handle_graphql_error
+from ikea_api.exceptions import GraphQLError
+from ikea_api.graphql import get_query_hash
+from tests.conftest import EndpointTester, MockResponseInfo
+
+
+class API(BaseAuthIkeaAPI):
+    def _get_session_info(self) -> SessionInfo:
+        return SessionInfo("", self._extend_default_headers_with_auth({}))
+
+    @endpoint()
+    def get_something(self) -> Endpoint[None]:
+        yield self._RequestInfo("GET")
+
+
+def test_no_token_provider(constants: Constants):
+    api = API(constants, token="old")  # nosec
+    assert api.get_something().reauthenticator is None
+
+
+def test_token_provider(constants: Constants):
+    provider = Auth(constants).get_guest_token
+    api = API(constants, token="old", token_provider=provider)  # nosec
+
+    reauthenticator = api.get_something().reauthenticator
+    assert reauthenticator
+    assert reauthenticator.get_token == provider
+
+    session_info = reauthenticator.set_token("new")
+    assert api.token == "new"
+    assert api._session_info is session_info
+    assert session_info.headers["Authorization"] == "Bearer new"
+
+
+class GraphQLAPI(BaseGraphQLAPI):
+    def _get_session_info(self) -> SessionInfo:
+        return SessionInfo("", self._extend_default_headers_with_auth({}))
+
+    @endpoint()
+    def query(self, payload: Any) -> Endpoint[Any]:
+        response = yield from self._graphql_request(payload)
+        return response.json
+
+    @endpoint(handlers=[handle_graphql_error])
+    def checked_query(self, payload: Any) -> Endpoint[Any]:
+        response = yield from self._graphql_request(payload)
+        return response.json
+
+
+def test_graphql_request_not_persisted(constants: Constants):
+    api = GraphQLAPI(constants, token="token")  # nosec
+    payload = {"query": "query{id}"}
+    t = EndpointTester(api.query(payload))
+    assert t.prepare().json == payload
+    assert t.parse(MockResponseInfo(json_="ok")) == "ok"
+
+
+@pytest.mark.parametrize("batched", (False, True))
+def test_graphql_request_persisted_hit(constants: Constants, batched: bool):
+    api = GraphQLAPI(constants, token="token", persisted_queries=True)  # nosec
+    payload = {"operationName": "Op", "query": "query{id}"}
+    t = EndpointTester(api.query([payload] if batched else payload))
+
+    req = t.prepare()
+    sent = req.json[0] if batched else req.json
+    assert sent == {
+        "operationName": "Op",
+        "extensions": {
+            "persistedQuery": {"version": 1, "sha256Hash": get_query_hash("query{id}")}
+        },
+    }
+    assert t.parse(MockResponseInfo(json_="ok")) == "ok"
+
+
+@pytest.mark.parametrize("batched", (False, True))
+def test_graphql_request_persisted_miss(constants: Constants, batched: bool):
+    api = GraphQLAPI(constants, token="token", persisted_queries=True)  # nosec
+    payload = {"query": "query{id}"}
+    t = EndpointTester(api.query([payload] if batched else payload))
+    t.prepare()
+
+    not_found = {"errors": [{"extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]}
+    t.parse(MockResponseInfo(json_=[not_found] if batched else not_found))
+    req = t.prepare()
+    sent = req.json[0] if batched else req.json
+    assert sent["query"] == "query{id}"
+    assert "persistedQuery" in sent["extensions"]
+    assert t.parse(MockResponseInfo(json_="ok")) == "ok"
+
+
+not_found = {"errors": [{"extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]}
+
+
+def run_graphql(
+    api: GraphQLAPI, responses: list[Any], sent: list[RequestInfo] | None = None
+) -> Any:
+    class MyExecutor(SyncExecutor):
+        @staticmethod
+        def request(request: RequestInfo):
+            if sent is not None:
+                sent.append(request)
+            return MockResponseInfo(json_=responses.pop(0))
+
+    return MyExecutor.run(api.checked_query({"query": "query{id}"}))
+
+
+def test_graphql_request_persisted_miss_handled(constants: Constants):
+    api = GraphQLAPI(constants, token="token", persisted_queries=True)  # nosec
+    sent: list[RequestInfo] = []
+    assert run_graphql(api, [not_found, {"data": "ok"}], sent) == {"data": "ok"}
+    assert "query" in sent[1].json
+
+
+def test_graphql_request_persisted_miss_after_full_query(constants: Constants):
+    api = GraphQLAPI(constants, token="token", persisted_queries=True)  # nosec
+    with pytest.raises(GraphQLError):
+        run_graphql(api, [not_found, not_found])
+
+
+def test_graphql_request_not_persisted_query_not_found(constants: Constants):
+    api = GraphQLAPI(constants, token="token")  # nosec
+    with pytest.raises(GraphQLError):
+        run_graphql(api, [not_found])
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ikea_api.cache import CacheStats, TTLCache
+
+
+def counting_fetch(values: list[str]):
+    calls: list[str] = []
+
+    async def fetch() -> str:
+        await asyncio.sleep(0)
+        value = values[len(calls)]
+        calls.append(value)
+        return value
+
+    return fetch, calls
+
+
+def test_cache_stats_hit_ratio():
+    assert CacheStats().hit_ratio == 0
+    assert CacheStats(hits=2, stale_hits=1, misses=1).hit_ratio == 0.75
+
+
+def test_cache_get_set():
+    cache = TTLCache[str, int](ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+
+def test_cache_expired():
+    cache = TTLCache[str, int](ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_maxsize():
+    cache = TTLCache[str, int](ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+async def test_cache_get_or_fetch_hit():
+    cache = TTLCache[str, str](ttl=60)
+    fetch, calls = counting_fetch(["one", "two"])
+    assert await cache.get_or_fetch("a", fetch) == "one"
+    assert await cache.get_or_fetch("a", fetch) == "one"
+    assert calls == ["one"]
+    assert cache.stats == CacheStats(hits=1, misses=1)
+
+
+async def test_cache_get_or_fetch_concurrent_misses():
+    cache = TTLCache[str, str](ttl=60)
+    fetch, calls = counting_fetch(["one", "two"])
+    res = await asyncio.gather(*(cache.get_or_fetch("a", fetch) for _ in range(3)))
+    assert res == ["one"] * 3
+    assert calls == ["one"]
+
+
+async def test_cache_get_or_fetch_stale_while_revalidate():
+    cache = TTLCache[str, str](ttl=0, stale_ttl=60)
+    fetch, calls = counting_fetch(["one", "two", "three"])
+    assert await cache.get_or_fetch("a", fetch) == "one"
+    assert await cache.get_or_fetch("a", fetch) == "one"
+    assert await cache.get_or_fetch("a", fetch) == "one"
+    await asyncio.sleep(0.01)
+
+    assert calls == ["one", "two"]
+    assert await cache.get_or_fetch("a", fetch) == "two"
+    assert cache.stats == CacheStats(stale_hits=3, misses=1)
+
+
+async def test_cache_get_or_fetch_revalidate_in_foreground():
+    cache = TTLCache[str, str](ttl=0, stale_ttl=60)
+    fetch, calls = counting_fetch(["one", "two"])
+    assert await cache.get_or_fetch("a", fetch) == "one"
+    res = await cache.get_or_fetch("a", fetch, revalidate_in_background=False)
+    assert res == "two"
+    assert calls == ["one", "two"]
+    assert cache.stats == CacheStats(misses=2)
+
+
+async def test_cache_get_or_fetch_error():
+    cache = TTLCache[str, str](ttl=0, stale_ttl=60)
+
+    async def fail() -> str:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await cache.get_or_fetch("a", fail)
+
+    cache.set("a", "one")
+    assert await cache.get_or_fetch("a", fail) == "one"
+    await asyncio.sleep(0.01)
+    assert len(cache) == 1
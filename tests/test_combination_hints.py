@@ -0,0 +1,45 @@
+from typing import Any
+
+import pytest
+
+from ikea_api.combination_hints import CombinationHints
+
+
+def test_combination_hints_set_get():
+    hints = CombinationHints()
+    assert hints.get("11111111") is None
+    assert len(hints) == 0
+
+    hints.set("11111111", True)
+    assert hints.get("11111111") is True
+    assert len(hints) == 1
+
+    hints.discard("11111111")
+    hints.discard("11111111")
+    assert hints.get("11111111") is None
+
+
+def test_combination_hints_update_from_ingka_response():
+    hints = CombinationHints()
+    hints.update_from_ingka_response(
+        {
+            "data": [
+                {"itemKey": {"itemNo": "11111111", "itemType": "ART"}},
+                {"itemKey": {"itemNo": "22222222", "itemType": "SPR"}},
+                {"itemKey": {"itemNo": "33333333", "itemType": "OTHER"}},
+                {"itemKey": {}},
+                None,
+            ]
+        }
+    )
+    assert hints.get("11111111") is False
+    assert hints.get("22222222") is True
+    assert hints.get("33333333") is None
+    assert len(hints) == 2
+
+
+@pytest.mark.parametrize("v", (None, [], {}, {"data": None}, {"data": {}}))
+def test_combination_hints_update_from_invalid_response(v: Any):
+    hints = CombinationHints()
+    hints.update_from_ingka_response(v)
+    assert len(hints) == 0
@@ -56,3 +56,14 @@ def test_handle_graphql_error(response: Any, expected: Any):
         handle_graphql_error(response)
 
     assert exc.value.errors == expected
+
+
+def test_handle_graphql_error_persisted_query_not_found():
+    error = {"extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}
+    with pytest.raises(GraphQLError):
+        handle_graphql_error(MockResponseInfo(json_={"errors": [error]}))
+
+
+def test_graphql_error_explicit_errors():
+    response = MockResponseInfo(json_=[{"errors": ["error1"]}, {"errors": ["error2"]}])
+    assert GraphQLError(response, ["error2"]).errors == ["error2"]  # type: ignore
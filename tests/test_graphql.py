@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import pytest
+
+from ikea_api.graphql import (
+    build_persisted_payload,
+    get_query_hash,
+    is_persisted_query_not_found,
+    minify_queries,
+    minify_query,
+)
+
+
+def test_minify_query():
+    query = """
+    query Order($orderNumber: String!, $skip: Int!) {
+        order(orderNumber: $orderNumber) {
+            id
+            items @skip(if: $skip) {
+            ...Item
+            }
+            ... on Exchange { inbound }
+        }
+    }
+    """
+    assert minify_query(query) == (
+        "query Order($orderNumber:String!,$skip:Int!){order(orderNumber:$orderNumber)"
+        + "{id items @skip(if:$skip){...Item}... on Exchange{inbound}}}"
+    )
+
+
+def test_minify_queries():
+    @minify_queries
+    class Queries:
+        query = " query {  id } "
+        _private = " query {  id } "
+
+    assert Queries.query == "query{id}"
+    assert Queries._private == " query {  id } "
+
+
+def test_build_persisted_payload():
+    payload = {"operationName": "Op", "variables": {"a": 1}, "query": "query{id}"}
+    extensions = {
+        "persistedQuery": {
+            "version": 1,
+            "sha256Hash": hashlib.sha256(b"query{id}").hexdigest(),
+        }
+    }
+    assert get_query_hash("query{id}") == extensions["persistedQuery"]["sha256Hash"]
+    assert build_persisted_payload(payload, include_query=False) == {
+        "operationName": "Op",
+        "variables": {"a": 1},
+        "extensions": extensions,
+    }
+    assert build_persisted_payload(payload, include_query=True) == {
+        **payload,
+        "extensions": extensions,
+    }
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    (
+        ({"data": {}}, False),
+        ({"errors": ["error"]}, False),
+        ({"errors": [{"extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]}, True),
+        ({"errors": [{"message": "PersistedQueryNotFound"}]}, True),
+        ([{"data": {}}, {"errors": [{"message": "PersistedQueryNotFound"}]}], True),
+        ([{"data": {}}, "chunk"], False),
+        ("text", False),
+    ),
+)
+def test_is_persisted_query_not_found(response: Any, expected: bool):
+    assert is_persisted_query_not_found(response) is expected
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ikea_api.invalid_items import InvalidItemRegistry
+
+
+def test_invalid_items_add():
+    registry = InvalidItemRegistry()
+    registry.add("ru", ["11111111"])
+    assert registry.is_invalid("ru", "11111111")
+    assert not registry.is_invalid("ru", "22222222")
+    assert not registry.is_invalid("de", "11111111")
+
+
+def test_invalid_items_expire():
+    registry = InvalidItemRegistry(ttl=-1)
+    registry.add("ru", ["11111111"])
+    assert not registry.is_invalid("ru", "11111111")
+
+
+def test_invalid_items_split():
+    registry = InvalidItemRegistry()
+    registry.add("ru", ["22222222"])
+    assert registry.split("ru", ["11111111", "22222222", "33333333"]) == (
+        ["11111111", "33333333"],
+        ["22222222"],
+    )
+
+
+def test_invalid_items_clear():
+    registry = InvalidItemRegistry()
+    registry.add("ru", ["11111111"])
+    registry.clear()
+    assert not registry.is_invalid("ru", "11111111")
+
+
+def test_invalid_items_persisted(tmp_path: Path):
+    path = tmp_path / "invalid_items.json"
+    InvalidItemRegistry(path=path).add("ru", ["11111111"])
+    assert InvalidItemRegistry(path=path).is_invalid("ru", "11111111")
+
+
+def test_invalid_items_load_drops_expired(tmp_path: Path):
+    path = tmp_path / "invalid_items.json"
+    path.write_text(json.dumps({"ru": {"11111111": 0, "22222222": 2**40}}))
+    registry = InvalidItemRegistry(path=path)
+    assert registry.split("ru", ["11111111", "22222222"]) == (
+        ["11111111"],
+        ["22222222"],
+    )
+
+
+def test_invalid_items_save_debounced(tmp_path: Path):
+    path = tmp_path / "invalid_items.json"
+    registry = InvalidItemRegistry(path=path, save_interval=60)
+    registry.add("ru", ["11111111"])
+    registry.add("ru", ["22222222"])
+    assert InvalidItemRegistry(path=path).split("ru", ["11111111", "22222222"]) == (
+        ["22222222"],
+        ["11111111"],
+    )
+
+    registry.flush()
+    assert InvalidItemRegistry(path=path).split("ru", ["11111111", "22222222"]) == (
+        [],
+        ["11111111", "22222222"],
+    )
+
+
+def test_invalid_items_save_without_path():
+    registry = InvalidItemRegistry()
+    registry.flush()
+    with pytest.raises(ValueError):
+        registry.save()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import pytest
+
+from ikea_api.abc import (
+    Endpoint,
+    EndpointTags,
+    RequestInfo,
+    SessionInfo,
+    SyncExecutor,
+    endpoint,
+    set_executor_hooks,
+)
+from ikea_api.metrics import (
+    ENDPOINT_DURATION,
+    ENDPOINT_ERRORS,
+    HANDLERS_DURATION,
+    JSON_DECODE_DURATION,
+    REQUEST_DURATION,
+    RESPONSE_SIZE,
+    RESPONSES,
+    Histogram,
+    HistogramCollector,
+    MetricsHooks,
+)
+from tests.conftest import MockResponseInfo
+
+
+def test_histogram():
+    histogram = Histogram((1, 2, 5))
+    for value in (0.5, 1, 1.5, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.count == 5
+    assert histogram.sum == 16
+    assert histogram.mean == 3.2
+    assert histogram.quantile(0.4) == 1
+    assert histogram.quantile(0.5) == 2
+    assert histogram.quantile(1) == 5
+
+
+def test_histogram_empty():
+    histogram = Histogram()
+    assert histogram.mean == 0
+    assert histogram.quantile(0.99) == 0
+
+
+def test_histogram_collector():
+    collector = HistogramCollector({"custom_seconds": (1,)})
+    collector.observe("custom_seconds", 2, {"b": "2", "a": "1"})
+    collector.increment("custom_total", {"a": "1"})
+    collector.increment("custom_total", {"a": "1"})
+
+    histogram = collector.get_histogram("custom_seconds", a="1", b="2")
+    assert histogram and histogram.counts == [0, 1]
+    assert collector.get_histogram("custom_seconds", a="2") is None
+    assert collector.get_counter("custom_total", a="1") == 2
+    assert collector.get_counter("custom_total", a="2") == 0
+
+    collector.clear()
+    assert collector.histograms == {}
+    assert collector.counters == {}
+
+
+class ResponseWithLength(MockResponseInfo):
+    @property
+    def content_length(self) -> int:
+        return 2048
+
+
+def test_metrics_hooks():
+    collector = HistogramCollector()
+    hooks = MetricsHooks(collector)
+    tags = EndpointTags(endpoint="Cart.show", host="example.com")
+    labels = {"endpoint": "Cart.show", "host": "example.com"}
+
+    hooks.on_request_end(tags, ResponseWithLength(status_code=404), 0.2)
+    hooks.on_request_end(tags, MockResponseInfo(), 0.2)
+    hooks.on_handlers_end(tags, 0.01)
+    hooks.on_json_decode(tags, 0.01)
+    hooks.on_endpoint_end(tags, 0.5, None)
+    hooks.on_endpoint_end(tags, 0.5, ValueError())
+
+    request_duration = collector.get_histogram(REQUEST_DURATION, **labels)
+    assert request_duration and request_duration.count == 2
+    response_size = collector.get_histogram(RESPONSE_SIZE, **labels)
+    assert response_size and response_size.count == 1
+    assert response_size.quantile(1) == 4096
+    assert collector.get_counter(RESPONSES, **labels, status="404") == 1
+    assert collector.get_counter(RESPONSES, **labels, status="200") == 1
+    for name in (HANDLERS_DURATION, JSON_DECODE_DURATION):
+        assert collector.get_histogram(name, **labels)
+    endpoint_duration = collector.get_histogram(ENDPOINT_DURATION, **labels)
+    assert endpoint_duration and endpoint_duration.count == 2
+    assert collector.get_counter(ENDPOINT_ERRORS, **labels, error="ValueError") == 1
+
+
+@endpoint()
+def ping() -> Endpoint[str]:
+    response = yield RequestInfo(
+        SessionInfo("https://example.com/api", {}), "GET", "/ping", {}, {}
+    )
+    return response.json
+
+
+@pytest.fixture
+def collector():
+    collector = HistogramCollector()
+    set_executor_hooks(MetricsHooks(collector))
+    yield collector
+    set_executor_hooks(None)
+
+
+def test_metrics_hooks_with_executor(collector: HistogramCollector):
+    class MyExecutor(SyncExecutor):
+        @staticmethod
+        def request(request: RequestInfo):
+            return MockResponseInfo(json_="pong")
+
+    assert MyExecutor.run(ping()) == "pong"
+
+    labels = {"endpoint": "ping", "host": "example.com"}
+    assert collector.get_counter(RESPONSES, **labels, status="200") == 1
+    assert collector.get_histogram(ENDPOINT_DURATION, **labels)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+
+from ikea_api.abc import EndpointInfo
+from ikea_api.constants import Constants
+from ikea_api.token_manager import (
+    DEFAULT_TOKEN_LIFETIME,
+    GuestToken,
+    TokenManager,
+    TokenPool,
+    get_token_expiration_time,
+)
+
+
+def build_jwt(payload: object) -> str:
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+    return f"header.{encoded.rstrip('=')}.signature"
+
+
+class TokenRunner:
+    def __init__(self, expires_in: float = 24 * 60 * 60) -> None:
+        self.count = 0
+        self.expires_in = expires_in
+
+    async def __call__(self, endpoint: EndpointInfo[str]) -> str:
+        self.count += 1
+        await asyncio.sleep(0)
+        return build_jwt({"exp": time.time() + self.expires_in, "n": self.count})
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    (
+        (build_jwt({"exp": 1700000000}), 1700000000.0),
+        (build_jwt({"sub": "guest"}), None),
+        (build_jwt({"exp": "soon"}), None),
+        (build_jwt([]), None),
+        ("header.not base64!.signature", None),
+        ("notajwt", None),
+    ),
+)
+def test_get_token_expiration_time(token: str, expected: float | None):
+    assert get_token_expiration_time(token) == expected
+
+
+def test_guest_token_default_lifetime():
+    token = GuestToken.from_value("notajwt")
+    assert token.expires_at == pytest.approx(time.time() + DEFAULT_TOKEN_LIFETIME, 5)
+    assert not token.expires_within(60)
+
+
+def test_guest_token_expires_within():
+    token = GuestToken.from_value(build_jwt({"exp": time.time() + 100}))
+    assert token.expires_within(200)
+    assert not token.expires_within(50)
+
+
+async def test_token_manager_caches_token(constants: Constants):
+    run = TokenRunner()
+    manager = TokenManager(constants, refresh_margin=60, run=run)
+    assert await manager.get_token() == await manager.get_token()
+    assert run.count == 1
+
+
+async def test_token_manager_refreshes_before_expiry(constants: Constants):
+    run = TokenRunner(expires_in=30)
+    manager = TokenManager(constants, refresh_margin=60, run=run)
+    assert await manager.get_token() != await manager.get_token()
+    assert run.count == 2
+
+
+async def test_token_manager_single_flight(constants: Constants):
+    run = TokenRunner()
+    manager = TokenManager(constants, run=run)
+    tokens = await asyncio.gather(*(manager.get_token() for _ in range(10)))
+    assert len(set(tokens)) == 1
+    assert run.count == 1
+
+
+async def test_token_manager_invalidate(constants: Constants):
+    run = TokenRunner()
+    manager = TokenManager(constants, run=run)
+    first = await manager.get_token()
+    manager.invalidate()
+    assert await manager.get_token() != first
+
+
+async def test_token_manager_refresh_error(constants: Constants):
+    async def run(endpoint: EndpointInfo[str]) -> str:
+        raise RuntimeError
+
+    manager = TokenManager(constants, run=run)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await manager.get_token()
+
+
+async def test_token_pool_lease_is_exclusive(constants: Constants):
+    pool = TokenPool(constants, 2, run=TokenRunner())
+    active: set[str] = set()
+    max_active = 0
+
+    async def work():
+        nonlocal max_active
+        async with pool.lease() as token:
+            assert token not in active
+            active.add(token)
+            max_active = max(max_active, len(active))
+            await asyncio.sleep(0.01)
+            active.remove(token)
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert max_active == pool.size == 2
+
+
+async def test_token_pool_warm_up(constants: Constants):
+    run = TokenRunner()
+    pool = TokenPool(constants, 3, run=run)
+    await pool.warm_up()
+    assert run.count == 3
+    async with pool.lease():
+        pass
+    assert run.count == 3
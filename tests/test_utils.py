@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Any
 
 import pytest
 
 import ikea_api.utils
-from ikea_api.utils import format_item_code, parse_item_codes
+from ikea_api.utils import (
+    LazySemaphore,
+    format_item_code,
+    iter_json_array,
+    parse_item_codes,
+)
 
 
 def test_parse_item_codes_unique():
@@ -58,3 +65,62 @@ def test_format_item_code(
     monkeypatch.setattr(ikea_api.utils, "parse_item_codes", mock_parse)
     assert format_item_code(input) == output
     assert called
+
+
+def split_bytes(value: bytes, size: int) -> list[bytes]:
+    return [value[i : i + size] for i in range(0, len(value), size)]
+
+
+def test_iter_json_array_chunks():
+    data = {
+        "before": 'da\\"ta[',
+        "data": [{"name": "ы,]}\\", "nums": [1, 2]}, [3], "str", 4, None],
+        "after": {"data": [5]},
+    }
+    raw = json.dumps(data, ensure_ascii=False).encode()
+
+    for size in range(1, len(raw) + 1):
+        assert list(iter_json_array(split_bytes(raw, size), "data")) == data["data"]
+
+
+@pytest.mark.parametrize(
+    "v", (b'{"data": []}', b'{"other": [1]}', b'{"error": {"data": [1]}}')
+)
+def test_iter_json_array_empty(v: bytes):
+    assert list(iter_json_array([v], "data")) == []
+
+
+@pytest.mark.parametrize(
+    "v", (b'{"data": [{"a": 1}', b'{"data": ["a', b'{"data": [1}', b'{"data": [1')
+)
+def test_iter_json_array_malformed(v: bytes):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([v], "data"))
+
+
+def test_iter_json_array_lazy():
+    def chunks():
+        yield b'{"data": [{"a": 1},'
+        raise RuntimeError
+
+    items = iter_json_array(chunks(), "data")
+    assert next(items) == {"a": 1}
+    with pytest.raises(RuntimeError):
+        next(items)
+
+
+async def test_lazy_semaphore():
+    semaphore = LazySemaphore(2)
+    running = 0
+    max_running = 0
+
+    async def run():
+        nonlocal running, max_running
+        async with semaphore:
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+    await asyncio.gather(*(run() for _ in range(5)))
+    assert max_running == 2
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import datetime
+from typing import Callable
+
+import pytest
+
+import ikea_api.executors.httpx
+from ikea_api.abc import RequestInfo, ResponseInfo
+from ikea_api.executors.httpx import HttpxExecutor
+from ikea_api.wrappers import types
+
+
+def patch_httpx_executor(
+    m: pytest.MonkeyPatch, func: Callable[[RequestInfo], ResponseInfo]
+):
+    class PatchedHttpxExecutor(HttpxExecutor):
+        @staticmethod
+        async def request(request: RequestInfo) -> ResponseInfo:  # type: ignore
+            return func(request)
+
+    m.setattr(ikea_api.executors.httpx, "HttpxExecutor", PatchedHttpxExecutor)
+
+
+def build_store_stock(
+    item_code: str, store_id: str, qty: int, restock_days: list[int] | None = None
+) -> types.StoreStock:
+    restocks = [
+        types.Restock(
+            earliest_date=datetime.date(2022, 5, day),
+            latest_date=datetime.date(2022, 5, day + 1),
+        )
+        for day in restock_days or []
+    ]
+    return types.StoreStock(
+        item_code=item_code, store_id=store_id, qty=qty, restocks=restocks
+    )
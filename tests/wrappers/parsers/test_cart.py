@@ -0,0 +1,53 @@
+import pytest
+from pydantic import ValidationError
+
+from ikea_api.wrappers import types
+from ikea_api.wrappers.parsers.cart import parse_cart_items, parse_cart_totals
+
+
+def test_parse_cart_items():
+    response = {
+        "data": {
+            "cart": {
+                "items": [
+                    {"itemNo": "11111111", "quantity": 1, "type": "ART"},
+                    {"itemNo": "22222222", "quantity": 3, "type": "SPR"},
+                ]
+            }
+        }
+    }
+    assert parse_cart_items(response) == {"11111111": 1, "22222222": 3}
+
+
+def test_parse_cart_items_empty():
+    assert parse_cart_items({"data": {"cart": {"items": []}}}) == {}
+
+
+def test_parse_cart_items_raises():
+    with pytest.raises(ValidationError):
+        parse_cart_items({"data": {"cart": None}})
+
+
+def test_parse_cart_totals():
+    def total(value: float, discount: float):
+        return {
+            "totalInclDiscount": {"inclTax": value, "exclTax": value, "tax": 0},
+            "totalDiscount": {"amount": discount},
+        }
+
+    response = {
+        "data": {
+            "cart": {
+                "currency": "RUB",
+                "checksum": "1",
+                "regularTotalPrice": total(1000, 100),
+                "familyTotalPrice": total(900, 200),
+            }
+        }
+    }
+    assert parse_cart_totals(response) == types.CartTotals(
+        currency="RUB", total=1000, discount=100, family_total=900
+    )
+
+    response["data"]["cart"]["familyTotalPrice"] = None
+    assert parse_cart_totals(response).family_total is None
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
+import json
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
 from ikea_api.constants import Constants
-from ikea_api.exceptions import ParsingError
+from ikea_api.exceptions import JSONError, ParsingError
 from ikea_api.wrappers.parsers.ingka_items import (
+    ResponseIngkaItem,
     get_child_items,
     get_image_url,
     get_localised_communication,
     get_name,
     get_weight,
     parse_ingka_items,
+    parse_ingka_items_stream,
+    parse_product_name,
     parse_russian_product_name,
 )
-from tests.conftest import TestData
+from tests.conftest import MockResponseInfo, TestData
 
 
 def test_get_localised_communication_passes():
@@ -42,6 +46,18 @@ def test_get_localised_communication_raises():
         get_localised_communication(constants, communications)
 
 
+def test_response_item_only_requested_language():
+    item = TestData.item_ingka[0]["data"][0]
+    parsed = ResponseIngkaItem.model_validate(item, context={"language": "ru"})
+    assert [c.languageCode for c in parsed.localisedCommunications] == ["ru"]
+
+
+def test_response_item_all_languages_without_context():
+    item = TestData.item_ingka[0]["data"][0]
+    parsed = ResponseIngkaItem.model_validate(item)
+    assert len(parsed.localisedCommunications) == len(item["localisedCommunications"])
+
+
 @pytest.mark.parametrize(
     ("input", "output"),
     (
@@ -51,12 +67,26 @@ def test_get_localised_communication_raises():
         ("BESTÅ БЕСТО / EKET ЭКЕТ", "БЕСТО / ЭКЕТ"),
         ("BESTÅ", "BESTÅ"),
         ("BESTÅ БЕСТО", "БЕСТО"),
+        ("IKEA PS", "IKEA PS"),
     ),
 )
 def test_parse_russian_product_name(input: str, output: str):
     assert parse_russian_product_name(input) == output
 
 
+@pytest.mark.parametrize(
+    ("language", "input", "output"),
+    (
+        ("ru", "BESTÅ БЕСТО / EKET ЭКЕТ", "БЕСТО / ЭКЕТ"),
+        ("uk", "BILLY БІЛЛІ", "БІЛЛІ"),
+        ("uk", "VINTER 2021 ВІНТЕР 2021", "ВІНТЕР 2021"),
+        ("en", "BESTÅ БЕСТО", "BESTÅ БЕСТО"),
+    ),
+)
+def test_parse_product_name(language: str, input: str, output: str):
+    assert parse_product_name(Constants(language=language), input) == output
+
+
 @pytest.mark.parametrize(
     ("product_name", "product_type", "design", "measurements", "exp_result"),
     (
@@ -104,7 +134,7 @@ def test_get_name(
         ),
     )
 
-    assert get_name(comm) == exp_result
+    assert get_name(Constants(), comm) == exp_result
 
 
 def test_get_image_url_not_main_image():
@@ -207,3 +237,37 @@ def test_get_child_items_success():
 @pytest.mark.parametrize("test_data_response", TestData.item_ingka)
 def test_main(constants: Constants, test_data_response: dict[str, Any]):
     list(parse_ingka_items(constants, test_data_response))
+
+
+@pytest.mark.parametrize("test_data_response", TestData.item_ingka)
+def test_stream(constants: Constants, test_data_response: dict[str, Any]):
+    raw = json.dumps(test_data_response).encode()
+    chunks = [raw[i : i + 512] for i in range(0, len(raw), 512)]
+    response = MockResponseInfo(text_=raw.decode())
+    assert list(parse_ingka_items_stream(constants, response, chunks)) == list(
+        parse_ingka_items(constants, test_data_response)
+    )
+
+
+def test_stream_reports_errors(constants: Constants):
+    valid_item = TestData.item_ingka[0]["data"][0]
+    no_comm_item = {**valid_item, "localisedCommunications": []}
+    raw = json.dumps({"data": [{}, no_comm_item, valid_item]}).encode()
+    errors: list[ParsingError] = []
+
+    response = MockResponseInfo(text_=raw.decode())
+    items = list(
+        parse_ingka_items_stream(constants, response, [raw], on_error=errors.append)
+    )
+
+    assert len(items) == 1
+    assert len(errors) == 2
+    assert all(isinstance(e, ParsingError) for e in errors)
+
+
+@pytest.mark.parametrize("raw", (b'{"data": [{"a": 1}', b'{"data": [{"a": 1}}]}'))
+def test_stream_malformed(constants: Constants, raw: bytes):
+    response = MockResponseInfo(text_=raw.decode())
+    with pytest.raises(JSONError) as exc:
+        list(parse_ingka_items_stream(constants, response, [raw]))
+    assert exc.value.response is response
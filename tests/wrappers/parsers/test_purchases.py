@@ -8,6 +8,8 @@ from ikea_api.wrappers.parsers.purchases import (
     get_history_datetime,
     parse_costs_order,
     parse_history,
+    parse_product_list_order,
+    parse_purchase_info,
     parse_status_banner_order,
 )
 from tests.conftest import TestData
@@ -29,5 +31,28 @@ def test_get_history_datetime(date: str, time: str):
     assert get_history_datetime(item) == f"{date}T{time}"
 
 
+def test_parse_purchase_info():
+    parse_purchase_info(TestData.purchases_status_banner, TestData.purchases_costs)
+
+
 def test_parse_history(constants: Constants):
     parse_history(constants, TestData.purchases_history)
+
+
+def test_parse_product_list_order():
+    res = parse_product_list_order(TestData.purchases_product_list)
+    assert [(p.item_code, p.qty, p.direction) for p in res] == [
+        ("00263850", 2, "OUTBOUND"),
+        ("60275635", 1, "OUTBOUND"),
+    ]
+    assert res[0].unit_price == "5 999 ₽"
+    assert res[1].image_url is None
+
+
+def test_parse_product_list_order_exchange():
+    product = TestData.purchases_product_list["data"]["order"]["articles"]["any"][0]
+    response = {
+        "data": {"order": {"articles": {"inbound": [product], "outbound": [product]}}}
+    }
+    res = parse_product_list_order(response)
+    assert [p.direction for p in res] == ["INBOUND", "OUTBOUND"]
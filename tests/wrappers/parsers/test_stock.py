@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+import pytest
+
+from ikea_api.wrappers import types
+from ikea_api.wrappers.parsers.stock import is_store_availability, parse_stock
+from tests.conftest import TestData
+
+
+@pytest.mark.parametrize(
+    ("v", "expected"),
+    (
+        ({"classUnitKey": {"classUnitType": "STO"}}, True),
+        ({"classUnitKey": {"classUnitType": "RU"}}, False),
+        ({"classUnitKey": None}, False),
+        ({}, False),
+        (None, False),
+    ),
+)
+def test_is_store_availability(v: Any, expected: bool):
+    assert is_store_availability(v) is expected
+
+
+def test_parse_stock():
+    stock = list(parse_stock(TestData.stock))
+
+    assert [s.store_id for s in stock] == ["335", "442", "511"]
+    assert stock[0] == types.StoreStock(
+        item_code="30457903",
+        store_id="335",
+        qty=42,
+        probability="HIGH_IN_STOCK",
+        restocks=[],
+    )
+    assert [r.earliest_date for r in stock[1].restocks] == [
+        datetime.date(2022, 5, 19),
+        datetime.date(2022, 5, 25),
+    ]
+    assert stock[2].qty == 0
+    assert stock[2].probability is None
+
+
+@pytest.mark.parametrize("v", ({}, {"availabilities": None}))
+def test_parse_stock_no_availabilities(v: dict[str, Any]):
+    assert list(parse_stock(v)) == []
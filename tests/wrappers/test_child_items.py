@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import Any
+
+import pytest
+
+from ikea_api.abc import RequestInfo
+from ikea_api.constants import Constants
+from ikea_api.wrappers import types
+from ikea_api.wrappers.child_items import ChildItemResolver
+from ikea_api.wrappers.parsers.ingka_items import parse_ingka_items
+from tests.conftest import MockResponseInfo, get_data_file
+from tests.wrappers.conftest import patch_httpx_executor
+
+
+def build_ingka_response(item_codes: list[str]) -> dict[str, Any]:
+    item = get_data_file("item_ingka/default.json")["data"][0]
+    data: list[dict[str, Any]] = []
+    for item_code in item_codes:
+        item = copy.deepcopy(item)
+        item["itemKey"]["itemNo"] = item_code
+        data.append(item)
+    return {"data": data}
+
+
+async def test_child_item_resolver(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    requests: list[list[str]] = []
+    missing_item_code = "10359343"
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        item_codes: list[str] = request.params["itemNos"]
+        requests.append(item_codes)
+        return MockResponseInfo(
+            json_=build_ingka_response(
+                [c for c in item_codes if c != missing_item_code]
+            )
+        )
+
+    patch_httpx_executor(monkeypatch, func)
+    combination = next(
+        iter(parse_ingka_items(constants, get_data_file("item_ingka/combination.json")))
+    )
+    other_combination = combination.model_copy(update={"item_code": "11111111"})
+    resolver = ChildItemResolver(constants, chunk_size=3)
+
+    items = await resolver.resolve([combination, other_combination])
+    assert sorted(len(r) for r in requests) == [1, 3]
+    assert items[0].child_items == items[1].child_items
+    child = next(iter(parse_ingka_items(constants, build_ingka_response(["40510858"]))))
+    for item in items[0].child_items:
+        if item.item_code == missing_item_code:
+            assert item.name is None
+            assert item.weight == 0
+        else:
+            assert item.name == child.name
+            assert item.weight == child.weight
+    assert items[0].weight == child.weight * 2 * 3
+
+    requests.clear()
+    await resolver.resolve([combination])
+    assert requests == []
+
+
+def build_combination(child_item_codes: list[str]) -> types.IngkaItem:
+    return types.IngkaItem(
+        is_combination=True,
+        item_code="11111111",
+        name="name",
+        weight=1,
+        child_items=[
+            types.ChildItem(item_code=c, weight=0, qty=1) for c in child_item_codes
+        ],
+    )
+
+
+async def test_child_item_resolver_item_fetch_error(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    requests: list[list[str]] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        requests.append(request.params["itemNos"])
+        return MockResponseInfo(json_={"error": {"details": []}})
+
+    patch_httpx_executor(monkeypatch, func)
+    item = build_combination(["22222222"])
+    resolver = ChildItemResolver(constants)
+    assert await resolver.resolve([item]) == [item]
+
+    # Error isn't about specific items, so they are requested again
+    assert await resolver.resolve([item]) == [item]
+    assert requests == [["22222222"], ["22222222"]]
+
+
+async def test_child_item_resolver_invalid_item(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    requests: list[list[str]] = []
+    invalid_item_code = "33333333"
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        item_codes: list[str] = request.params["itemNos"]
+        requests.append(item_codes)
+        if invalid_item_code in item_codes:
+            error = {"details": [{"value": {"keys": [invalid_item_code]}}]}
+            return MockResponseInfo(json_={"error": error})
+        return MockResponseInfo(json_=build_ingka_response(item_codes))
+
+    patch_httpx_executor(monkeypatch, func)
+    resolver = ChildItemResolver(constants)
+    item = build_combination(["22222222", invalid_item_code])
+
+    res = await resolver.resolve([item])
+    assert res[0].child_items[1].name is None
+    assert res[0].child_items[0].name is not None
+    assert requests == [["22222222", invalid_item_code], ["22222222"]]
+
+    requests.clear()
+    await resolver.resolve([item])
+    assert requests == []
+
+
+async def test_child_item_resolver_concurrent(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    requests: list[list[str]] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        requests.append(request.params["itemNos"])
+        return MockResponseInfo(json_=build_ingka_response(request.params["itemNos"]))
+
+    patch_httpx_executor(monkeypatch, func)
+    resolver = ChildItemResolver(constants)
+    first, second = await asyncio.gather(
+        resolver.resolve([build_combination(["22222222"])]),
+        resolver.resolve([build_combination(["22222222", "33333333"])]),
+    )
+
+    assert first[0].child_items[0].name is not None
+    assert all(c.name is not None for c in second[0].child_items)
+    assert requests == [["22222222"], ["33333333"]]
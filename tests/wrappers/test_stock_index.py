@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import datetime
+
+from ikea_api.wrappers.stock_index import StockIndex
+from tests.conftest import TestData
+from tests.wrappers.conftest import build_store_stock
+
+
+def test_stock_index_from_response():
+    index = StockIndex()
+    index.update_from_response(TestData.stock)
+
+    assert len(index) == 3
+    assert index.get_qty("30457903", "335") == 42
+    assert index.get_qty("30457903", "000") == 0
+    assert index.get("30457903", "000") is None
+    assert index.find_stores({"30457903": 3}) == ["335", "442"]
+
+
+def test_stock_index_find_stores():
+    index = StockIndex(
+        [
+            build_store_stock("11111111", "1", 5),
+            build_store_stock("11111111", "2", 1),
+            build_store_stock("11111111", "3", 5),
+            build_store_stock("22222222", "1", 2),
+            build_store_stock("22222222", "3", 1),
+        ]
+    )
+
+    assert index.find_stores({"11111111": 2, "22222222": 2}) == ["1"]
+    assert index.find_stores({"11111111": 1, "22222222": 1}) == ["1", "3"]
+    assert index.find_stores({"11111111": 6}) == []
+    assert index.find_stores({"11111111": 1, "33333333": 1}) == []
+    assert index.find_stores({}) == []
+
+    index.update([build_store_stock("22222222", "1", 0)])
+    assert index.find_stores({"11111111": 1, "22222222": 1}) == ["3"]
+
+
+def test_stock_index_replace():
+    index = StockIndex(
+        [
+            build_store_stock("11111111", "1", 5),
+            build_store_stock("11111111", "2", 1),
+            build_store_stock("22222222", "1", 2),
+        ]
+    )
+    index.replace("11111111", [build_store_stock("11111111", "2", 3)])
+
+    assert index.get("11111111", "1") is None
+    assert index.get_item_stock("11111111") == [build_store_stock("11111111", "2", 3)]
+    assert index.get_qty("22222222", "1") == 2
+    assert len(index) == 2
+
+
+def test_stock_index_next_restock():
+    index = StockIndex(
+        [
+            build_store_stock("11111111", "1", 0, [20, 25]),
+            build_store_stock("11111111", "2", 0, [18]),
+            build_store_stock("11111111", "3", 0),
+        ]
+    )
+
+    restock = index.next_restock("11111111", "1")
+    assert restock and restock.earliest_date == datetime.date(2022, 5, 20)
+    restock = index.next_restock("11111111")
+    assert restock and restock.earliest_date == datetime.date(2022, 5, 18)
+    assert index.next_restock("11111111", "3") is None
+    assert index.next_restock("22222222") is None
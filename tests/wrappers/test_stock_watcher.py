@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+import pytest
+
+from ikea_api.abc import RequestInfo
+from ikea_api.constants import Constants
+from ikea_api.invalid_items import InvalidItemRegistry
+from ikea_api.wrappers import types
+from ikea_api.wrappers.stock_watcher import StockWatcher
+from tests.conftest import MockResponseInfo
+from tests.wrappers.conftest import build_store_stock, patch_httpx_executor
+
+
+def mock_stock(
+    request: RequestInfo,
+    stock: dict[str, dict[str, Any]],
+    requests: list[list[str]],
+) -> MockResponseInfo:
+    item_codes: list[str] = request.params["itemNos"]
+    requests.append(item_codes)
+    availabilities = [
+        {
+            "buyingOption": {"cashCarry": {"availability": availability}},
+            "classUnitKey": {"classUnitCode": "335", "classUnitType": "STO"},
+            "itemKey": {"itemNo": item_code, "itemType": "ART"},
+        }
+        for item_code in item_codes
+        if (availability := stock.get(item_code))
+    ]
+    return MockResponseInfo(json_={"availabilities": availabilities})
+
+
+async def test_stock_watcher_poll(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    stock: dict[str, dict[str, Any]] = {
+        "11111111": {"quantity": 42},
+        "22222222": {"quantity": 3},
+    }
+    requests: list[list[str]] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_stock(r, stock, requests))
+    watcher = StockWatcher(
+        constants,
+        ["11111111", "22222222"],
+        min_interval=10,
+        max_interval=15,
+        batch_size=1,
+    )
+
+    assert await watcher.poll() == []
+    assert sorted(requests) == [["11111111"], ["22222222"]]
+    assert watcher.index.get_qty("11111111", "335") == 42
+    assert watcher.get_interval("11111111") == 15
+    assert watcher.get_interval("22222222") == 10
+
+    requests.clear()
+    assert await watcher.poll() == []
+    assert requests == []
+
+    for schedule in watcher._schedule.values():  # pyright: ignore[reportPrivateUsage]
+        schedule.next_poll_at = 0
+    restock = {"earliestDate": "2022-05-19", "latestDate": "2022-05-20"}
+    stock["11111111"] = {"quantity": 40}
+    stock["22222222"] = {"quantity": 3, "restocks": [restock]}
+
+    changes = {c.item_code: c for c in await watcher.poll()}
+    assert changes["11111111"].qty_delta == -2
+    assert changes["11111111"].restock is None
+    assert changes["22222222"].qty_delta == 0
+    assert changes["22222222"].previous_restock is None
+    assert changes["22222222"].restock == types.Restock(
+        earliest_date=datetime.date(2022, 5, 19),
+        latest_date=datetime.date(2022, 5, 20),
+    )
+    assert watcher.get_interval("11111111") == 10
+
+
+@pytest.mark.parametrize(
+    "response",
+    (
+        MockResponseInfo(text_="not json"),
+        MockResponseInfo(status_code=500, json_={"message": "Internal error"}),
+        MockResponseInfo(status_code=404, json_={}),
+        MockResponseInfo(status_code=400, json_={"errors": [{"code": 400}]}),
+    ),
+)
+async def test_stock_watcher_poll_error(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants, response: MockResponseInfo
+):
+    requests: list[list[str]] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        requests.append(request.params["itemNos"])
+        return response
+
+    patch_httpx_executor(monkeypatch, func)
+    registry = InvalidItemRegistry()
+    item_codes = ["11111111", "22222222"]
+    watcher = StockWatcher(
+        constants, item_codes, min_interval=10, invalid_items=registry
+    )
+    watcher.index.update([build_store_stock("11111111", "335", 5)])
+
+    assert await watcher.poll() == []
+    # Batch is retried as is after current interval, stock is kept
+    assert requests == [item_codes]
+    assert await watcher.poll() == []
+    assert requests == [item_codes]
+    assert watcher.get_interval("11111111") == 10
+    assert watcher.index.get_qty("11111111", "335") == 5
+    assert registry.split(constants.country, item_codes) == (item_codes, [])
+
+
+async def test_stock_watcher_poll_invalid_item(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    invalid_item_code = "33333333"
+    stock: dict[str, dict[str, Any]] = {
+        "11111111": {"quantity": 1},
+        "22222222": {"quantity": 1},
+    }
+    requests: list[list[str]] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if invalid_item_code in request.params["itemNos"]:
+            requests.append(request.params["itemNos"])
+            error = {"code": 404, "details": {"itemNo": invalid_item_code}}
+            return MockResponseInfo(status_code=404, json_={"errors": [error]})
+        return mock_stock(request, stock, requests)
+
+    patch_httpx_executor(monkeypatch, func)
+    registry = InvalidItemRegistry()
+    item_codes = ["11111111", "22222222", invalid_item_code]
+    watcher = StockWatcher(constants, item_codes, invalid_items=registry)
+
+    assert await watcher.poll() == []
+    # Batch is split until invalid item is found
+    assert requests == [
+        item_codes,
+        ["11111111"],
+        ["22222222", invalid_item_code],
+        ["22222222"],
+        [invalid_item_code],
+    ]
+    assert watcher.index.get_qty("22222222", "335") == 1
+    assert watcher.get_interval(invalid_item_code) is None
+    assert registry.is_invalid(constants.country, invalid_item_code)
+
+    requests.clear()
+    watcher.add([invalid_item_code])
+    assert await watcher.poll() == []
+    assert requests == []
+    assert watcher.get_interval(invalid_item_code) is None
+
+
+async def test_stock_watcher_poll_store_removed(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    stock: dict[str, dict[str, Any]] = {"11111111": {"quantity": 42}}
+    requests: list[list[str]] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_stock(r, stock, requests))
+    watcher = StockWatcher(constants, ["11111111"], min_interval=0)
+
+    assert await watcher.poll() == []
+    del stock["11111111"]
+
+    changes = await watcher.poll()
+    assert [(c.store_id, c.previous_qty, c.qty) for c in changes] == [("335", 42, 0)]
+    assert watcher.index.get("11111111", "335") is None
+
+    assert await watcher.poll() == []
+
+
+async def test_stock_watcher_watch(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    stock: dict[str, dict[str, Any]] = {"11111111": {"quantity": 1}}
+    requests: list[list[str]] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        response = mock_stock(request, stock, requests)
+        stock["11111111"] = {"quantity": 2}
+        return response
+
+    patch_httpx_executor(monkeypatch, func)
+    watcher = StockWatcher(constants, ["11111111"], min_interval=0)
+
+    async for change in watcher.watch():
+        assert (change.previous_qty, change.qty) == (1, 2)
+        break
+    assert len(requests) == 2
+
+
+def test_stock_watcher_add_remove(constants: Constants):
+    watcher = StockWatcher(constants, ["11111111"], min_interval=10)
+    watcher.add(["11111111", "22222222"])
+    assert watcher.get_interval("22222222") == 10
+
+    watcher.index.update([build_store_stock("11111111", "1", 5)])
+    watcher.remove(["11111111"])
+    assert watcher.get_interval("11111111") is None
+    assert len(watcher.index) == 0
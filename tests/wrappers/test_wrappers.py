@@ -1,27 +1,50 @@
 from __future__ import annotations
 
-from typing import Callable
+import asyncio
+from typing import Any, Callable
 
+import httpx
 import pytest
 
-import ikea_api.executors.httpx
 import ikea_api.executors.requests
 import ikea_api.wrappers.wrappers
-from ikea_api.abc import RequestInfo, ResponseInfo
+from ikea_api.abc import EndpointInfo, RequestInfo, ResponseInfo
+from ikea_api.cache import CacheStats, TTLCache
+from ikea_api.combination_hints import CombinationHints
 from ikea_api.constants import Constants
 from ikea_api.endpoints.cart import Cart, convert_items
 from ikea_api.endpoints.order_capture import convert_cart_to_checkout_items
 from ikea_api.endpoints.purchases import Purchases
-from ikea_api.executors.httpx import HttpxExecutor
+from ikea_api.exceptions import AuthError, GraphQLError, ParsingError
 from ikea_api.executors.requests import RequestsExecutor
+from ikea_api.invalid_items import InvalidItemRegistry
+from ikea_api.token_manager import TokenPool
 from ikea_api.wrappers import types
+from ikea_api.wrappers.child_items import ChildItemResolver
 from ikea_api.wrappers.wrappers import (
+    DeliveryServicesCache,
+    ServiceAreaCache,
     add_items_to_cart,
+    add_items_to_cart_async,
+    add_items_to_large_cart,
+    get_cart_diff,
     get_delivery_services,
+    get_delivery_services_for_baskets,
+    get_delivery_services_for_zip_codes,
+    get_delivery_services_key,
+    get_items,
     get_purchase_history,
+    get_purchase_history_async,
     get_purchase_info,
+    get_purchase_info_async,
+    get_purchases_info,
+    iter_purchase_history,
+    iter_purchase_products,
+    sync_cart,
+    warm_up_service_areas,
 )
-from tests.conftest import MockResponseInfo, TestData
+from tests.conftest import MockResponseInfo, TestData, get_data_file
+from tests.wrappers.conftest import patch_httpx_executor
 
 
 def patch_requests_executor(
@@ -35,17 +58,6 @@ def patch_requests_executor(
     m.setattr(ikea_api.executors.requests, "RequestsExecutor", PatchedRequestsExecutor)
 
 
-def patch_httpx_executor(
-    m: pytest.MonkeyPatch, func: Callable[[RequestInfo], ResponseInfo]
-):
-    class PatchedHttpxExecutor(HttpxExecutor):
-        @staticmethod
-        async def request(request: RequestInfo) -> ResponseInfo:  # type: ignore
-            return func(request)
-
-    m.setattr(ikea_api.executors.httpx, "HttpxExecutor", PatchedHttpxExecutor)
-
-
 def test_get_purchase_history(monkeypatch: pytest.MonkeyPatch, constants: Constants):
     api = Purchases(constants, token="mytoken")  # nosec
     patch_requests_executor(
@@ -55,6 +67,104 @@ def test_get_purchase_history(monkeypatch: pytest.MonkeyPatch, constants: Consta
     assert isinstance(res[0], types.PurchaseHistoryItem)
 
 
+async def test_get_purchase_history_async(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Purchases(constants, token="mytoken")  # nosec
+    patch_httpx_executor(
+        monkeypatch, lambda _: MockResponseInfo(json_=TestData.purchases_history)
+    )
+    res = await get_purchase_history_async(api)
+    assert isinstance(res[0], types.PurchaseHistoryItem)
+
+
+def build_history_response(ids: list[str]) -> dict[str, Any]:
+    item = TestData.purchases_history["data"]["history"][0]
+    return {"data": {"history": [{**item, "id": id_} for id_ in ids]}}
+
+
+@pytest.mark.parametrize(
+    ("known_ids", "exp_ids", "exp_requests"),
+    (
+        (set(), ["1", "2", "3", "4", "5"], 3),
+        ({"4"}, ["1", "2", "3"], 2),
+        ({"1"}, [], 1),
+    ),
+)
+async def test_iter_purchase_history(
+    monkeypatch: pytest.MonkeyPatch,
+    constants: Constants,
+    known_ids: set[str],
+    exp_ids: list[str],
+    exp_requests: int,
+):
+    api = Purchases(constants, token="mytoken")  # nosec
+    pages = [["1", "2"], ["3", "4"], ["5"]]
+    skips: list[int] = []
+
+    def func(request: RequestInfo):
+        variables = request.json["variables"]
+        assert variables["take"] == 2
+        skips.append(variables["skip"])
+        return MockResponseInfo(
+            json_=build_history_response(pages[variables["skip"] // 2])
+        )
+
+    patch_httpx_executor(monkeypatch, func)
+    res = [
+        i async for i in iter_purchase_history(api, page_size=2, known_ids=known_ids)
+    ]
+    assert [i.id for i in res] == exp_ids
+    assert skips == [0, 2, 4][:exp_requests]
+
+
+def build_product_list_response(item_codes: list[str]) -> dict[str, Any]:
+    articles = TestData.purchases_product_list["data"]["order"]["articles"]
+    products = [{**articles["any"][0], "id": code} for code in item_codes]
+    return {"data": {"order": {"articles": {**articles, "any": products}}}}
+
+
+async def test_iter_purchase_products(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Purchases(constants, token="mytoken")  # nosec
+    pages = [["11111111", "22222222"], ["33333333", "44444444"], []]
+    skips: list[int] = []
+
+    def func(request: RequestInfo):
+        (payload,) = request.json
+        assert payload["operationName"] == "ProductListOrder"
+        variables = payload["variables"]
+        assert variables["take"] == 2
+        skips.append(variables["skip"])
+        return MockResponseInfo(
+            json_=[build_product_list_response(pages[variables["skip"] // 2])]
+        )
+
+    patch_httpx_executor(monkeypatch, func)
+    res = [
+        p.item_code
+        async for p in iter_purchase_products(api, order_number="1", page_size=2)
+    ]
+    assert res == ["11111111", "22222222", "33333333", "44444444"]
+    assert skips == [0, 2, 4]
+
+
+async def test_iter_purchase_products_stopped_early(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Purchases(constants, token="mytoken")  # nosec
+    response = build_product_list_response(["11111111", "22222222"])
+    patch_httpx_executor(monkeypatch, lambda _: MockResponseInfo(json_=[response]))
+
+    products = iter_purchase_products(api, order_number="1", page_size=2)
+    async for _ in products:
+        break
+    await products.aclose()
+    current = asyncio.current_task()
+    assert all(t.done() for t in asyncio.all_tasks() if t is not current)
+
+
 def test_get_purchase_info(monkeypatch: pytest.MonkeyPatch, constants: Constants):
     api = Purchases(constants, token="mytoken")  # nosec
     patch_requests_executor(
@@ -67,6 +177,58 @@ def test_get_purchase_info(monkeypatch: pytest.MonkeyPatch, constants: Constants
     assert isinstance(res, types.PurchaseInfo)
 
 
+async def test_get_purchase_info_async(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Purchases(constants, token="mytoken")  # nosec
+    patch_httpx_executor(
+        monkeypatch,
+        lambda _: MockResponseInfo(
+            json_=[TestData.purchases_status_banner, TestData.purchases_costs]
+        ),
+    )
+    res = await get_purchase_info_async(api, order_number="1")
+    assert isinstance(res, types.PurchaseInfo)
+
+
+def test_get_purchases_info(monkeypatch: pytest.MonkeyPatch, constants: Constants):
+    api = Purchases(constants, token="mytoken")  # nosec
+    patch_requests_executor(
+        monkeypatch,
+        lambda _: MockResponseInfo(
+            json_=[
+                TestData.purchases_status_banner,
+                TestData.purchases_costs,
+                {"errors": [{"message": "not found"}]},
+                {"errors": [{"message": "not found"}]},
+            ]
+        ),
+    )
+    res = get_purchases_info(api, ["1", "2"])
+    assert isinstance(res["1"], types.PurchaseInfo)
+    assert isinstance(res["2"], GraphQLError)
+
+
+def test_get_purchases_info_malformed_order(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Purchases(constants, token="mytoken")  # nosec
+    patch_requests_executor(
+        monkeypatch,
+        lambda _: MockResponseInfo(
+            json_=[
+                TestData.purchases_status_banner,
+                TestData.purchases_costs,
+                {"data": {"order": None}},
+                {"data": {"order": None}},
+            ]
+        ),
+    )
+    res = get_purchases_info(api, ["1", "2"])
+    assert isinstance(res["1"], types.PurchaseInfo)
+    assert isinstance(res["2"], ParsingError)
+
+
 def test_add_items_to_cart(monkeypatch: pytest.MonkeyPatch, constants: Constants):
     api = Cart(constants, token="mytoken")  # nosec
     exp_items = [
@@ -122,12 +284,207 @@ def test_add_items_to_cart(monkeypatch: pytest.MonkeyPatch, constants: Constants
     assert count == 3
 
 
+async def test_add_items_to_cart_async(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Cart(constants, token="mytoken")  # nosec
+    sent: list[Any] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if "clear" in str(request.json):
+            return MockResponseInfo(json_={})
+        sent.append(request.json["variables"]["items"])
+        if len(sent) > 1:
+            return MockResponseInfo(json_={})
+        error = {
+            "extensions": {
+                "code": "INVALID_ITEM_NUMBER",
+                "data": {"itemNos": ["22222222"]},
+            }
+        }
+        return MockResponseInfo(json_={"errors": [error]})
+
+    patch_httpx_executor(monkeypatch, func)
+    items = {"11111111": 2, "22222222": 1}
+    assert await add_items_to_cart_async(api, items) == ["22222222"]
+    assert sent == [convert_items(items), convert_items({"11111111": 2})]
+
+
+def test_add_items_to_cart_records_invalid_items(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    registry = InvalidItemRegistry()
+    api = Cart(constants, token="mytoken", invalid_items=registry)  # nosec
+    items = {"11111111": 2, "22222222": 1}
+    sent: list[Any] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if "clear" in str(request.json):
+            return MockResponseInfo(json_={})
+        sent.append(request.json["variables"]["items"])
+        if "22222222" not in str(sent[-1]):
+            return MockResponseInfo(json_={})
+        error = {
+            "extensions": {
+                "code": "INVALID_ITEM_NUMBER",
+                "data": {"itemNos": ["22222222"]},
+            }
+        }
+        return MockResponseInfo(json_={"errors": [error]})
+
+    patch_requests_executor(monkeypatch, func)
+    assert add_items_to_cart(api, items) == ["22222222"]
+    assert registry.split(constants.country, items) == (["11111111"], ["22222222"])
+
+    # Second time known invalid items are skipped without round trips
+    sent.clear()
+    assert add_items_to_cart(api, items) == ["22222222"]
+    assert sent == [convert_items({"11111111": 2})]
+
+
+def test_add_items_to_cart_other_error(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Cart(constants, token="mytoken")  # nosec
+    response = {"errors": [{"extensions": {"code": "UNKNOWN"}}]}
+    patch_requests_executor(monkeypatch, lambda _: MockResponseInfo(json_=response))
+    with pytest.raises(GraphQLError):
+        add_items_to_cart(api, {"11111111": 1})
+
+
+async def test_add_items_to_large_cart(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Cart(constants, token="mytoken")  # nosec
+    items = {"11111111": 1, "22222222": 2, "33333333": 3, "44444444": 4}
+    sent: list[list[str]] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if "clearItems" in request.json["query"]:
+            return MockResponseInfo(json_={"data": {"clearItems": {}}})
+
+        assert "...CartProps" not in request.json["query"]
+        codes = [i["itemNo"] for i in request.json["variables"]["items0"]]
+        sent.append(codes)
+        if "33333333" in codes:
+            error = {
+                "extensions": {
+                    "code": "INVALID_ITEM_NUMBER",
+                    "data": {"itemNos": ["33333333"]},
+                }
+            }
+            return MockResponseInfo(json_={"errors": [error]})
+        return MockResponseInfo(json_={"data": {"m0": {"checksum": "1"}}})
+
+    patch_httpx_executor(monkeypatch, func)
+    report = await add_items_to_large_cart(api, items, chunk_size=2)
+
+    assert sent == [["11111111", "22222222"], ["33333333", "44444444"], ["44444444"]]
+    assert report.cannot_add == ["33333333"]
+    assert [c.items for c in report.chunks] == [
+        ["11111111", "22222222"],
+        ["33333333", "44444444"],
+    ]
+    assert [c.attempts for c in report.chunks] == [1, 2]
+    assert [c.cannot_add for c in report.chunks] == [[], ["33333333"]]
+    assert report.elapsed >= sum(c.elapsed for c in report.chunks)
+
+
+@pytest.mark.parametrize(
+    ("current", "target", "expected"),
+    (
+        ({}, {}, types.CartDiff(add={}, update={}, remove=[])),
+        (
+            {"11111111": 1, "22222222": 2, "33333333": 3},
+            {"11111111": 1, "22222222": 5, "44444444": 4, "55555555": 0},
+            types.CartDiff(
+                add={"44444444": 4}, update={"22222222": 5}, remove=["33333333"]
+            ),
+        ),
+        (
+            {"11111111": 1},
+            {"11111111": 0},
+            types.CartDiff(add={}, update={}, remove=["11111111"]),
+        ),
+    ),
+)
+def test_get_cart_diff(
+    current: dict[str, int], target: dict[str, int], expected: types.CartDiff
+):
+    assert get_cart_diff(current, target) == expected
+
+
+async def test_sync_cart(monkeypatch: pytest.MonkeyPatch, constants: Constants):
+    api = Cart(constants, token="mytoken")  # nosec
+    cart_response = {
+        "data": {
+            "cart": {
+                "items": [
+                    {"itemNo": "11111111", "quantity": 1},
+                    {"itemNo": "22222222", "quantity": 2},
+                    {"itemNo": "33333333", "quantity": 3},
+                ]
+            }
+        }
+    }
+    operations: list[tuple[str, Any]] = []
+    invalid_item_error = {
+        "extensions": {
+            "code": "INVALID_ITEM_NUMBER",
+            "data": {"itemNos": ["55555555"]},
+        }
+    }
+
+    def func(request: RequestInfo):
+        query: str = request.json["query"]
+        variables = request.json["variables"]
+        if "query Cart" in query:
+            return MockResponseInfo(json_=cart_response)
+        for name in ("RemoveItems", "UpdateItems", "AddItems"):
+            if f"mutation {name}" in query:
+                operations.append((name, variables.get("items", variables)))
+                if name == "AddItems" and len(variables["items"]) > 1:
+                    return MockResponseInfo(json_={"errors": [invalid_item_error]})
+                return MockResponseInfo(json_={})
+        raise NotImplementedError(request)
+
+    patch_httpx_executor(monkeypatch, func)
+    cannot_add = await sync_cart(
+        api, {"11111111": 1, "22222222": 5, "44444444": 4, "55555555": 1}
+    )
+
+    assert cannot_add == ["55555555"]
+    assert operations == [
+        ("RemoveItems", {"languageCode": constants.language, "itemNos": ["33333333"]}),
+        ("UpdateItems", convert_items({"22222222": 5})),
+        ("AddItems", convert_items({"44444444": 4, "55555555": 1})),
+        ("AddItems", convert_items({"44444444": 4})),
+    ]
+
+
+async def test_sync_cart_nothing_to_do(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    api = Cart(constants, token="mytoken")  # nosec
+    cart_response = {
+        "data": {"cart": {"items": [{"itemNo": "11111111", "quantity": 1}]}}
+    }
+    requests: list[RequestInfo] = []
+
+    def func(request: RequestInfo):
+        requests.append(request)
+        return MockResponseInfo(json_=cart_response)
+
+    patch_httpx_executor(monkeypatch, func)
+    assert await sync_cart(api, {"11111111": 1}) == []
+    assert len(requests) == 1
+
+
 async def test_get_delivery_services_cannot_add_all_items(
     monkeypatch: pytest.MonkeyPatch, constants: Constants
 ):
     item_code = "11111111"
     responses = [
-        {},
         {
             "errors": [
                 {
@@ -147,7 +504,7 @@ async def test_get_delivery_services_cannot_add_all_items(
         count += 1
         return r
 
-    patch_requests_executor(monkeypatch, func)
+    patch_httpx_executor(monkeypatch, func)
 
     res = await get_delivery_services(
         constants, "mytoken", items={item_code: 2}, zip_code="101000"  # nosec
@@ -183,6 +540,8 @@ async def test_get_delivery_services_main(
     }
 
     def func(request: RequestInfo):
+        if "mutation Batch" in str(request.json):
+            return {"data": {"m0": {}, "m1": {}}}
         if "Cart" in str(request.json):
             return cart_response
         if request.url == "/checkouts":
@@ -210,3 +569,617 @@ async def test_get_delivery_services_main(
         constants, "mytoken", items={"11111111": 2}, zip_code="101000"  # nosec
     )
     assert isinstance(res, types.GetDeliveryServicesResponse)
+
+
+def mock_delivery_services(request: RequestInfo, calls: list[str]) -> MockResponseInfo:
+    checkout_id = "21"
+    cart_response = {
+        "data": {
+            "cart": {
+                "items": [
+                    {
+                        "quantity": 1,
+                        "itemNo": "11111111",
+                        "product": {"unitCode": "uom"},
+                    },
+                    {
+                        "quantity": 4,
+                        "itemNo": "22222222",
+                        "product": {"unitCode": "uom"},
+                    },
+                ]
+            }
+        }
+    }
+
+    def get_response() -> Any:
+        checkout_url = f"/checkouts/{checkout_id}"
+        if "mutation Batch" in str(request.json):
+            calls.append("replace_items")
+            return {"data": {"m0": {"checksum": "1"}, "m1": {"quantity": 5}}}
+        if "query Cart" in str(request.json):
+            calls.append("show")
+            return cart_response
+        if request.url == "/checkouts":
+            calls.append("checkout")
+            assert request.json["items"] == convert_cart_to_checkout_items(
+                cart_response
+            )
+            return {"resourceId": checkout_id}
+        if request.url == f"{checkout_url}/service-area":
+            calls.append("service_area")
+            return {"id": f"area-{request.json['zipCode']}"}
+        if request.url.startswith(f"{checkout_url}/service-area/area-"):
+            calls.append("services")
+            if request.url.endswith("/home-delivery-services"):
+                return TestData.order_capture_home[0]
+            if request.url.endswith("/collect-delivery-services"):
+                return TestData.order_capture_collect[0]
+        raise NotImplementedError(request)
+
+    return MockResponseInfo(json_=get_response())
+
+
+async def test_get_delivery_services_requests(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    patch_requests_executor(
+        monkeypatch, lambda _: pytest.fail("Blocking request in async wrapper")
+    )
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+    res = await get_delivery_services(
+        constants, "mytoken", items={"11111111": 2}, zip_code="101000"  # nosec
+    )
+    assert res.delivery_options
+    assert calls == [
+        "replace_items",
+        "show",
+        "checkout",
+        "service_area",
+        "services",
+        "services",
+    ]
+
+
+async def test_get_delivery_services_cached(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+    cache: DeliveryServicesCache = TTLCache(ttl=60)
+
+    first = await get_delivery_services(
+        constants,
+        "mytoken",  # nosec
+        items={"11111111": 2, "22222222": 1},
+        zip_code="101000",
+        cache=cache,
+    )
+    second = await get_delivery_services(
+        constants,
+        "mytoken",  # nosec
+        items={"22222222": 1, "11111111": 2},
+        zip_code="101000 ",
+        cache=cache,
+    )
+    assert first is second
+    assert calls.count("replace_items") == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_get_delivery_services_key(constants: Constants):
+    assert get_delivery_services_key(
+        constants, {"11111111": 2, "22222222": 1}, "101000"
+    ) == get_delivery_services_key(constants, {"22222222": 1, "11111111": 2}, "101000")
+    assert get_delivery_services_key(
+        constants, {"11111111": 2}, "101000"
+    ) != get_delivery_services_key(constants, {"11111111": 1}, "101000")
+    assert get_delivery_services_key(
+        constants, {"111.111.11": 1, "11111111": 1}, "101000"
+    ) == get_delivery_services_key(constants, {"11111111": 2}, "101000")
+
+
+async def test_get_delivery_services_cached_stale(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+    cache: DeliveryServicesCache = TTLCache(ttl=0, stale_ttl=60)
+
+    for _ in range(2):
+        await get_delivery_services(
+            constants,
+            "mytoken",  # nosec
+            items={"11111111": 2},
+            zip_code="101000",
+            cache=cache,
+        )
+        # Cart of caller's token is not touched after return
+        requests = len(calls)
+        await asyncio.sleep(0.01)
+        assert len(calls) == requests
+
+    assert calls.count("replace_items") == 2
+    assert cache.stats == CacheStats(misses=2)
+
+
+async def test_get_delivery_services_cached_stale_with_pool(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    tokens: set[str] = set()
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        tokens.add(request.session_info.headers["Authorization"])
+        return mock_delivery_services(request, calls)
+
+    async def run_token(endpoint: EndpointInfo[str]) -> str:
+        return "leased"
+
+    patch_httpx_executor(monkeypatch, func)
+    pool = TokenPool(constants, size=1, run=run_token)
+    cache: DeliveryServicesCache = TTLCache(ttl=0, stale_ttl=60)
+
+    for _ in range(2):
+        await get_delivery_services(
+            constants,
+            "mytoken",  # nosec
+            items={"111.111.11": 2},
+            zip_code="101000 ",
+            cache=cache,
+            pool=pool,
+        )
+    assert cache.stats == CacheStats(stale_hits=1, misses=1)
+
+    # Stale response is refreshed in background with leased token
+    await asyncio.sleep(0)
+    async with pool.lease():
+        pass
+    assert calls.count("replace_items") == 2
+    assert tokens == {"Bearer leased"}
+    assert len(cache) == 1
+
+
+async def test_get_delivery_services_for_baskets(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    tokens: set[str] = set()
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        tokens.add(request.session_info.headers["Authorization"])
+        if request.json and request.json.get("zipCode") == "bad":
+            return MockResponseInfo(status_code=401, json_={})
+        if request.json and request.json.get("zipCode") == "down":
+            raise httpx.ConnectError("Connection refused")
+        return mock_delivery_services(request, calls)
+
+    issued_tokens: list[str] = []
+
+    async def run_token(endpoint: EndpointInfo[str]) -> str:
+        issued_tokens.append(f"token{len(issued_tokens)}")
+        return issued_tokens[-1]
+
+    patch_httpx_executor(monkeypatch, func)
+    pool = TokenPool(constants, size=1, run=run_token)
+    baskets = [
+        ({"11111111": 1}, "101000"),
+        ({"11111111": 2}, "bad"),
+        ({"22222222": 1}, "101001"),
+        ({"11111111": 3}, "down"),
+    ]
+    res = await get_delivery_services_for_baskets(constants, pool, baskets)
+
+    assert len(res) == 4
+    assert isinstance(res[0], types.GetDeliveryServicesResponse)
+    assert isinstance(res[1], AuthError)
+    assert isinstance(res[2], types.GetDeliveryServicesResponse)
+    assert isinstance(res[3], httpx.ConnectError)
+    # Rejected token is replaced
+    assert issued_tokens == ["token0", "token1"]
+    assert len(tokens) == 2
+    assert calls.count("replace_items") == 4
+
+
+async def test_get_delivery_services_for_baskets_concurrent(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    tokens: set[str] = set()
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        tokens.add(request.session_info.headers["Authorization"])
+        return mock_delivery_services(request, calls)
+
+    issued_tokens: list[str] = []
+
+    async def run_token(endpoint: EndpointInfo[str]) -> str:
+        issued_tokens.append(f"token{len(issued_tokens)}")
+        return issued_tokens[-1]
+
+    patch_httpx_executor(monkeypatch, func)
+    pool = TokenPool(constants, size=2, run=run_token)
+    baskets = [({"11111111": i}, "101000") for i in range(1, 4)]
+    res = await get_delivery_services_for_baskets(constants, pool, baskets)
+
+    assert all(isinstance(r, types.GetDeliveryServicesResponse) for r in res)
+    assert len(tokens) == 2
+    assert calls.count("replace_items") == 3
+
+
+async def test_get_delivery_services_for_baskets_cached_stale(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+
+    async def run_token(endpoint: EndpointInfo[str]) -> str:
+        return "token"
+
+    pool = TokenPool(constants, size=1, run=run_token)
+    cache: DeliveryServicesCache = TTLCache(ttl=0, stale_ttl=60)
+    baskets = [({"11111111": 1}, "101000")]
+
+    await get_delivery_services_for_baskets(constants, pool, baskets, cache=cache)
+    await get_delivery_services_for_baskets(constants, pool, baskets, cache=cache)
+    assert cache.stats.stale_hits == 1
+
+    # Background refresh holds the lease until it is done
+    async with pool.lease():
+        requests = list(calls)
+    assert requests.count("replace_items") == 2
+    assert calls == requests
+
+
+async def test_warm_up_service_areas(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+    service_areas: ServiceAreaCache = TTLCache(ttl=60)
+
+    res = await warm_up_service_areas(
+        constants,
+        "mytoken",  # nosec
+        {"11111111": 1},
+        ["101000", " 101001", "101000"],
+        service_areas,
+    )
+    assert res == {"101000": "area-101000", "101001": "area-101001"}
+    assert service_areas.get((constants, "101001")) == "area-101001"
+
+    calls.clear()
+    await get_delivery_services(
+        constants,
+        "mytoken",  # nosec
+        items={"11111111": 2},
+        zip_code="101001",
+        service_areas=service_areas,
+    )
+    assert calls == [
+        "replace_items",
+        "show",
+        "checkout",
+        "services",
+        "services",
+    ]
+
+
+async def test_warm_up_service_areas_cannot_add_items(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    error = {"extensions": {"code": "INVALID_ITEM_NUMBER", "data": {"itemNos": ["1"]}}}
+    patch_httpx_executor(
+        monkeypatch, lambda _: MockResponseInfo(json_={"errors": [error]})
+    )
+    service_areas: ServiceAreaCache = TTLCache(ttl=60)
+    res = await warm_up_service_areas(
+        constants, "mytoken", {"1": 1}, ["101000"], service_areas  # nosec
+    )
+    assert res == {}
+
+
+@pytest.mark.parametrize(
+    ("cached_id", "services_requests"),
+    (("area-101000", 2), ("area-old", 4)),
+)
+async def test_get_delivery_services_stale_service_area(
+    monkeypatch: pytest.MonkeyPatch,
+    constants: Constants,
+    cached_id: str,
+    services_requests: int,
+):
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+    service_areas: ServiceAreaCache = TTLCache(ttl=0, stale_ttl=60)
+    service_areas.set((constants, "101000"), cached_id)
+
+    res = await get_delivery_services(
+        constants,
+        "mytoken",  # nosec
+        items={"11111111": 2},
+        zip_code="101000",
+        service_areas=service_areas,
+    )
+    assert res.delivery_options
+    assert calls.count("service_area") == 1
+    assert calls.count("services") == services_requests
+    assert service_areas.stats.stale_hits == 1
+
+
+async def test_get_delivery_services_invalid_fresh_service_area(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if "area-gone" in request.url:
+            return MockResponseInfo(status_code=404, json_={})
+        return mock_delivery_services(request, calls)
+
+    patch_httpx_executor(monkeypatch, func)
+    service_areas: ServiceAreaCache = TTLCache(ttl=60)
+    service_areas.set((constants, "101000"), "area-gone")
+
+    res = await get_delivery_services(
+        constants,
+        "mytoken",  # nosec
+        items={"11111111": 2},
+        zip_code="101000",
+        service_areas=service_areas,
+    )
+    assert res.delivery_options
+    assert calls.count("service_area") == 1
+    assert service_areas.get((constants, "101000")) == "area-101000"
+
+
+async def test_get_delivery_services_fresh_service_area_other_error(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if "/service-area/area-" in request.url:
+            return MockResponseInfo(status_code=401, json_={})
+        return mock_delivery_services(request, calls)
+
+    patch_httpx_executor(monkeypatch, func)
+    service_areas: ServiceAreaCache = TTLCache(ttl=60)
+    service_areas.set((constants, "101000"), "area-101000")
+
+    with pytest.raises(AuthError):
+        await get_delivery_services(
+            constants,
+            "mytoken",  # nosec
+            items={"11111111": 2},
+            zip_code="101000",
+            service_areas=service_areas,
+        )
+    assert "service_area" not in calls
+    assert service_areas.get((constants, "101000")) == "area-101000"
+
+
+async def test_get_delivery_services_empty_service_areas(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+    service_areas: ServiceAreaCache = TTLCache(ttl=60)
+
+    await get_delivery_services(
+        constants,
+        "mytoken",  # nosec
+        items={"11111111": 2},
+        zip_code="101000",
+        service_areas=service_areas,
+    )
+    # Empty cache is filled too
+    assert service_areas.stats.misses == 1
+    assert service_areas.get((constants, "101000")) == "area-101000"
+
+
+async def test_get_delivery_services_for_zip_codes(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+    patch_httpx_executor(monkeypatch, lambda r: mock_delivery_services(r, calls))
+    zip_codes = ["101000", "101001", "101002", "101000"]
+    res = await get_delivery_services_for_zip_codes(
+        constants, "mytoken", {"11111111": 2}, zip_codes, concurrency=2  # nosec
+    )
+    assert list(res) == ["101000", "101001", "101002"]
+    for response in res.values():
+        assert isinstance(response, types.GetDeliveryServicesResponse)
+        assert response.delivery_options
+    for request in ("replace_items", "checkout"):
+        assert calls.count(request) == 1
+    assert calls.count("service_area") == 3
+    assert calls.count("services") == 6
+
+
+async def test_get_delivery_services_for_zip_codes_error(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    calls: list[str] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if request.json and request.json.get("zipCode") == "bad":
+            return MockResponseInfo(status_code=401, json_={})
+        if request.json and request.json.get("zipCode") == "down":
+            raise httpx.ConnectError("Connection refused")
+        return mock_delivery_services(request, calls)
+
+    patch_httpx_executor(monkeypatch, func)
+    res = await get_delivery_services_for_zip_codes(
+        constants, "mytoken", {"11111111": 2}, ["101000", "bad"]  # nosec
+    )
+    response = res["101000"]
+    assert isinstance(response, types.GetDeliveryServicesResponse)
+    assert response.delivery_options
+    assert isinstance(res["bad"], AuthError)
+
+
+async def test_get_delivery_services_for_zip_codes_cannot_add_all_items(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    item_code = "11111111"
+
+    def func(request: RequestInfo):
+        error = {
+            "extensions": {
+                "code": "INVALID_ITEM_NUMBER",
+                "data": {"itemNos": [item_code]},
+            }
+        }
+        return MockResponseInfo(json_={"errors": [error]})
+
+    patch_httpx_executor(monkeypatch, func)
+    res = await get_delivery_services_for_zip_codes(
+        constants, "mytoken", {item_code: 2}, ["101000", "101001"]  # nosec
+    )
+    assert list(res) == ["101000", "101001"]
+    for response in res.values():
+        assert isinstance(response, types.GetDeliveryServicesResponse)
+        assert response.delivery_options == []
+        assert response.cannot_add == [item_code]
+
+
+def mock_items(
+    request: RequestInfo, ingka_requests: list[list[str]], pip_requests: list[str]
+) -> MockResponseInfo:
+    if "salesitem" in request.session_info.base_url:
+        item_codes = request.params["itemNos"]
+        ingka_requests.append(item_codes)
+        if "30379118" in item_codes:
+            return MockResponseInfo(json_=get_data_file("item_ingka/default.json"))
+        return MockResponseInfo(json_={"error": {"details": []}})
+
+    pip_requests.append(request.url)
+    if "30379118" in request.url and "/s" not in request.url:
+        return MockResponseInfo(json_=get_data_file("item_pip/default.json"))
+    return MockResponseInfo(status_code=404)
+
+
+async def test_get_items(monkeypatch: pytest.MonkeyPatch, constants: Constants):
+    ingka_requests: list[list[str]] = []
+    pip_requests: list[str] = []
+    patch_httpx_executor(
+        monkeypatch, lambda r: mock_items(r, ingka_requests, pip_requests)
+    )
+
+    item_codes = ["30379118", "11111111", "30379118"]
+    items = [i async for i in get_items(constants, item_codes, chunk_size=1)]
+
+    assert len(items) == 1
+    item = items[0]
+    assert isinstance(item, types.ParsedItem)
+    assert item.item_code == "30379118"
+    assert item.price == 7999
+    assert item.weight > 0
+    assert sorted(ingka_requests) == [["11111111"], ["30379118"]]
+    # Item type comes from Ingka, missing items are not requested from PIP
+    assert pip_requests == ["/118/30379118.json"]
+
+
+async def test_get_items_invalid_item_in_chunk(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    ingka_requests: list[list[str]] = []
+    pip_requests: list[str] = []
+    invalid_item_code = "11111111"
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        if invalid_item_code in request.params.get("itemNos", []):
+            ingka_requests.append(request.params["itemNos"])
+            error = {"details": [{"value": {"keys": [invalid_item_code]}}]}
+            return MockResponseInfo(json_={"error": error})
+        return mock_items(request, ingka_requests, pip_requests)
+
+    patch_httpx_executor(monkeypatch, func)
+
+    item_codes = ["30379118", invalid_item_code]
+    items = [i async for i in get_items(constants, item_codes)]
+
+    assert [i.item_code for i in items] == ["30379118"]
+    # Chunk is requested again without invalid item
+    assert ingka_requests == [item_codes, ["30379118"]]
+    assert pip_requests == ["/118/30379118.json"]
+
+
+async def test_get_items_combination_hints(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    ingka_requests: list[list[str]] = []
+    pip_requests: list[str] = []
+    patch_httpx_executor(
+        monkeypatch, lambda r: mock_items(r, ingka_requests, pip_requests)
+    )
+    hints = CombinationHints()
+    hints.set("11111111", False)
+
+    item_codes = ["30379118", "11111111"]
+    items = [i async for i in get_items(constants, item_codes, combination_hints=hints)]
+
+    assert [i.item_code for i in items] == ["30379118"]
+    # Item with hint is requested from PIP without waiting for Ingka.
+    # Hint may be stale, so the other URL is tried too.
+    assert sorted(pip_requests) == [
+        "/111/11111111.json",
+        "/111/s11111111.json",
+        "/118/30379118.json",
+    ]
+    assert hints.get("30379118") is False
+    assert hints.get("11111111") is None
+
+
+async def test_get_items_stale_combination_hint(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    ingka_requests: list[list[str]] = []
+    pip_requests: list[str] = []
+
+    def func(request: RequestInfo) -> MockResponseInfo:
+        # Ingka doesn't correct the hint
+        if "salesitem" in request.session_info.base_url:
+            return MockResponseInfo(json_={"error": {"details": []}})
+        return mock_items(request, ingka_requests, pip_requests)
+
+    patch_httpx_executor(monkeypatch, func)
+    hints = CombinationHints()
+    hints.set("30379118", True)
+    registry = InvalidItemRegistry()
+
+    items = get_items(
+        constants, ["30379118"], combination_hints=hints, invalid_items=registry
+    )
+    assert [i async for i in items] == []
+    assert pip_requests == ["/118/s30379118.json", "/118/30379118.json"]
+    assert hints.get("30379118") is False
+    assert not registry.is_invalid(constants.country, "30379118")
+
+
+async def test_get_items_cancels_pending(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    ingka_requests: list[list[str]] = []
+    pip_requests: list[str] = []
+    patch_httpx_executor(
+        monkeypatch, lambda r: mock_items(r, ingka_requests, pip_requests)
+    )
+
+    item_codes = ["30379118"] + [str(10000000 + i) for i in range(20)]
+    items = get_items(constants, item_codes, chunk_size=50, concurrency=2)
+    first = await items.__anext__()
+    assert first.item_code == "30379118"
+    await items.aclose()
+
+
+async def test_get_items_with_child_items(
+    monkeypatch: pytest.MonkeyPatch, constants: Constants
+):
+    patch_httpx_executor(monkeypatch, lambda r: mock_items(r, [], []))
+    resolver = ChildItemResolver(constants)
+    items = [i async for i in get_items(constants, ["30379118"], child_items=resolver)]
+    assert len(items) == 1